@@ -1,6 +1,7 @@
 from pybuilder.core import use_plugin, init
 
 use_plugin("python.core")
+use_plugin("python.unittest")
 use_plugin("python.install_dependencies")
 use_plugin("python.distutils")
 use_plugin("pypi:pybuilder_smart_copy_resources")
@@ -18,6 +19,9 @@ def initialize(project):
     project.build_depends_on('tkinter')
     project.build_depends_on('redis')
     project.build_depends_on('igraph')
+    project.build_depends_on('numpy')
+    project.build_depends_on('pillow')
+    project.build_depends_on('fakeredis')
 
 
 @init
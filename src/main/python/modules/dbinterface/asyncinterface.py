@@ -0,0 +1,371 @@
+from asyncio import new_event_loop, run_coroutine_threadsafe, wait_for, gather, get_running_loop
+from threading import Thread, Lock
+from uuid import uuid4
+from modules.dbinterface.resultset import ResultSet, revise_response
+from modules.dbinterface.cache import ResultCache, normalize_query, is_write_query
+from modules.dbinterface.compact import CompactReader
+from modules.dbinterface.exceptons import DataBaseInterfaceTimeoutException, DataBaseInterfaceViewException
+from modules.dbinterface.constants import G_QUERY, G_EXPLAIN, TIMEOUT, TIMED_OUT, TIMEOUT_GRACE, ASYNC_POOL_SIZE, \
+    VIEW, UTF_8, GRAPH_VERSION, CACHE_NONCE, COMPACT
+
+import asyncio
+import redis.asyncio
+
+
+class AsyncDataBaseInterface:
+    """
+    Comprises coroutines to query a Redis instance on an event loop.
+
+    This class is used by the `DataBaseStatus` class to send queries without blocking one thread per
+    query. Queries share one event loop, which runs in a background thread, hence many queries are
+    sent concurrently and a running query is cancelled by cancelling its future. Merges and imports
+    are left to `DataBaseInterface`, whose result cache and reader of compact responses are shared. Like
+    `DataBaseInterface`, results of read queries are cached by graph version and write queries bump the
+    version of the graph.
+
+    Attributes
+    ----------
+    __Client : Redis
+        Asynchronous Redis server client.
+
+    __Loop : AbstractEventLoop
+        The event loop the queries are run on. Started on the first submitted coroutine.
+
+    __Lock : Lock
+        Guards the start of the event loop.
+
+    __Cache : ResultCache
+        Caches decoded query results of the connected instance by graph key, query and graph version.
+        Shared with `DataBaseInterface`.
+
+    __Reader : CompactReader
+        Reads compact responses through the schema cache of the connected instance. Shared with
+        `DataBaseInterface`. None if verbose responses are requested.
+
+    __identity : str
+        Identifies the contents of the connected instance in the keys of cached results. None until the
+        first result is cached.
+
+    __timeout : bool
+        If the connected instance accepts the `TIMEOUT` argument. None until a query was timed.
+
+    Methods
+    -------
+    client_connect(host, port, cache, reader)
+        Initializes a connection to a database.
+
+    client_disconnect()
+        Disconnects from a database.
+
+    client_get_connection()
+        Returns the current connection status.
+
+    submit(coroutine)
+        Runs a coroutine on the event loop.
+
+    db_query(query, dbkey, to_graph, timeout)
+        Queries a specified graph.
+
+    db_query_many(queries, dbkey, timeout)
+        Queries a specified graph with several queries concurrently.
+
+    db_explain(query, dbkey)
+        Returns the execution plan of a query.
+    """
+
+    def __init__(self):
+        """
+        Initializes a new `AsyncDataBaseInterface` instance.
+        """
+
+        self.__Client = None
+        self.__Loop = None
+        self.__Lock = Lock()
+        self.__Cache = None
+        self.__Reader = None
+
+        self.__identity = None
+        self.__timeout = None
+
+    def client_connect(self, host: str, port: str, cache: ResultCache, reader: CompactReader = None):
+        """
+        Initializes the client of the Redis instance specified with host and port.
+
+        Connections are established by the first queries on the event loop, drawn from a bounded pool of
+        `ASYNC_POOL_SIZE` connections.
+
+        Parameters
+        ----------
+        host : str
+            String to identify a host.
+
+        port : str
+            String to identify a port.
+
+        cache : ResultCache
+            The result cache of the instance, as returned by `DataBaseInterface.client_get_cache`.
+
+        reader : CompactReader, optional
+            The reader of compact responses of the instance, as returned by
+            `DataBaseInterface.client_get_reader`. Verbose responses are requested if None (default is None).
+        """
+
+        self.__Client = redis.asyncio.Redis(
+            connection_pool=redis.asyncio.BlockingConnectionPool(host=host, port=port,
+                                                                 max_connections=ASYNC_POOL_SIZE)
+        )
+        self.__Cache = cache
+        self.__Reader = reader
+        self.__identity = None
+        self.__timeout = None
+
+    def client_disconnect(self):
+        """
+        Disconnects the connections of the client.
+        """
+
+        if self.__Client is not None:
+
+            self.submit(self.__Client.aclose()).result()
+
+            self.__Client = None
+
+    async def client_get_connection(self) -> bool:
+        """
+        Returns the current connection status (True or False).
+
+        Returns
+        -------
+        bool
+            Current connection status.
+        """
+
+        try:
+            return await self.__Client.ping()
+
+        except (redis.ConnectionError, ConnectionRefusedError, AttributeError):
+            return False
+
+    def submit(self, coroutine):
+        """
+        Runs a coroutine on the event loop.
+
+        Used by threads outside of the event loop. The event loop is started in a daemon thread
+        on the first call.
+
+        Parameters
+        ----------
+        coroutine : coroutine
+            The coroutine to run.
+
+        Returns
+        -------
+        Future
+            A `concurrent.futures.Future` of the result. Cancelling it cancels the coroutine.
+        """
+
+        with self.__Lock:
+
+            if self.__Loop is None:
+
+                self.__Loop = new_event_loop()
+
+                Thread(target=self.__Loop.run_forever, daemon=True).start()
+
+        return run_coroutine_threadsafe(coroutine, self.__Loop)
+
+    async def __query(self, command: str, dbkey: str, timeout: int = None) -> list:
+        """
+        Used to send a OpenCypher query to a Redis instance.
+
+        Parameters
+        ----------
+        command : str
+            A OpenCypher syntax query.
+
+        dbkey : str
+            The graph key to query.
+
+        timeout : int, optional
+            The timeout of the query in milliseconds, passed as `TIMEOUT` argument. RedisGraph only
+            times out read queries, hence the argument is not passed with write queries and the
+            response is awaited only `TIMEOUT_GRACE` seconds longer. Instances rejecting the argument
+            are queried without it (default is None).
+
+        Returns
+        -------
+        list
+            Encoded query response. Compact responses are returned in the verbose layout.
+
+        Raises
+        ------
+        DataBaseInterfaceTimeoutException
+            If the query timed out.
+        """
+
+        arguments = [G_QUERY, dbkey, command] + ([COMPACT] if self.__Reader is not None else [])
+
+        if timeout and self.__timeout is not False and not is_write_query(command):
+
+            try:
+
+                response = await self.__execute(arguments + [TIMEOUT, int(timeout)], dbkey, timeout)
+                self.__timeout = True
+
+            except redis.ResponseError as error:
+
+                if self.__timeout:
+                    raise
+
+                # Earlier versions of RedisGraph reject the argument, read queries are sent again without it.
+                try:
+                    response = await self.__execute(arguments, dbkey, timeout)
+
+                except redis.ResponseError:
+                    raise error
+
+                self.__timeout = False
+
+        else:
+            response = await self.__execute(arguments, dbkey, timeout)
+
+        # Bumped once the write is done, hence results cached meanwhile are not served afterwards.
+        if is_write_query(command):
+            await self.__Client.incr(dbkey + GRAPH_VERSION)
+
+        if self.__Reader is not None:
+
+            # Missing schemas are requested by the reader through `DataBaseInterface`, hence off the event loop.
+            return await get_running_loop().run_in_executor(None, self.__Reader.read, dbkey, response)
+
+        return response[0]
+
+    async def __execute(self, arguments: list, dbkey: str, timeout: int = None) -> list:
+
+        try:
+
+            return await wait_for(self.__Client.execute_command(*arguments),
+                                  timeout / 1000 + TIMEOUT_GRACE if timeout else None)
+
+        except asyncio.TimeoutError:
+            raise DataBaseInterfaceTimeoutException(dbkey, timeout)
+
+        except redis.ResponseError as error:
+
+            if TIMED_OUT in str(error).lower():
+                raise DataBaseInterfaceTimeoutException(dbkey, timeout)
+
+            raise
+
+    async def __get_identity(self) -> str:
+
+        # Built like the identity of `DataBaseInterface`, see `DataBaseInterface.__get_identity`.
+        if self.__identity is None:
+
+            await self.__Client.set(CACHE_NONCE, uuid4().hex, nx=True)
+
+            try:
+                run_id = (await self.__Client.info('server'))['run_id']
+
+            except redis.ResponseError:
+                run_id = ''
+
+            self.__identity = run_id + (await self.__Client.get(CACHE_NONCE)).decode(UTF_8)
+
+        return self.__identity
+
+    async def db_query(self, query: str, dbkey: str, to_graph=False, timeout: int = None):
+        """
+        Executes a query.
+
+        Queries the graph accessed with `dbkey`. If `to_graph` is `True` the query-response will be returned.
+        Virtual merge graphs are queried with `DataBaseInterface.db_query` only. Responses of read queries
+        are cached until the graph is written, while write queries bump the version of the graph.
+
+        Parameters
+        ----------
+        query : str
+            A OpenCypher query.
+
+        dbkey : str
+            The key of the graph to query.
+
+        to_graph : bool
+            Whether the queries response should be returned.
+
+        timeout : int, optional
+            The timeout of the query in milliseconds (default is None).
+
+        Returns
+        -------
+        tuple optional
+            A tuple of two lists of dictionaries. Represents vertices and edges.
+        """
+
+        if await self.__Client.exists(dbkey + VIEW):
+            raise DataBaseInterfaceViewException(dbkey)
+
+        if not to_graph or is_write_query(query):
+
+            response = await self.__query(query, dbkey, timeout)
+
+            if to_graph:
+                return ResultSet(revise_response(response)).split()
+
+            return
+
+        # Read queries are served from the result cache until the graph is written. The files of its disk tier
+        # are read and written off the event loop.
+        key = (await self.__get_identity(), dbkey, normalize_query(query),
+               int(await self.__Client.get(dbkey + GRAPH_VERSION) or 0))
+        result = await get_running_loop().run_in_executor(None, self.__Cache.get, key)
+
+        if result is None:
+
+            result = ResultSet(revise_response(await self.__query(query, dbkey, timeout))).split()
+            await get_running_loop().run_in_executor(None, self.__Cache.put, key, result)
+
+        return tuple(result)
+
+    async def db_query_many(self, queries: list, dbkey: str, timeout: int = None) -> list:
+        """
+        Executes several queries concurrently.
+
+        Parameters
+        ----------
+        queries : list
+            A list of str. The OpenCypher queries.
+
+        dbkey : str
+            The key of the graph to query.
+
+        timeout : int, optional
+            The timeout of each query in milliseconds (default is None).
+
+        Returns
+        -------
+        list
+            A list of tuples of two lists of dictionaries, in order of the queries.
+        """
+
+        return list(await gather(*[self.db_query(query, dbkey, True, timeout) for query in queries]))
+
+    async def db_explain(self, query: str, dbkey: str) -> bytes:
+        """
+        Returns the execution plan of a query.
+
+        Parameters
+        ----------
+        query : str
+            A OpenCypher query.
+
+        dbkey : str
+            The key of the graph to query.
+
+        Returns
+        -------
+        bytes
+            The encoded execution plan.
+        """
+
+        return await self.__Client.execute_command(G_EXPLAIN, dbkey, query)
@@ -0,0 +1,298 @@
+"""
+Script to store the result cache used by the dbinterface module to serve repeated OpenCypher queries.
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from hashlib import sha1
+from json import dumps, loads
+from os import makedirs, listdir, remove, replace, stat
+from os.path import join
+from tempfile import NamedTemporaryFile
+from re import split, search, sub, IGNORECASE
+from modules.dbinterface.constants import CACHE_MEMORY_BUDGET, CACHE_DISK_BUDGET, CACHE_FILE, CACHE_PART, UTF_8
+
+# Splits a query into string literals and the text between them.
+_LITERALS = r"('(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\")"
+_WRITE_CLAUSES = r'\b(create|merge|set|delete|remove)\b'
+
+
+class ResultCache:
+    """
+    Two-tier cache of decoded query results.
+
+    Results are stored serialized, hence every hit returns a new copy that the caller may modify. The
+    memory tier holds the most recently used results up to `memory_budget` bytes. Results evicted
+    from it are spilled to the disk tier, which holds up to `disk_budget` bytes in one file per result
+    and is kept across sessions. Keys are expected to comprise the identity of the queried instance and
+    the version of the queried graph, stale results are therefore never hit and are evicted in least
+    recently used order.
+
+    Attributes
+    ----------
+    __Memory : OrderedDict
+        Maps keys to serialized results, in order of their last use.
+
+    __Disk : OrderedDict
+        Maps file names of the disk tier to their size, in order of their last use.
+
+    __Lock : Lock
+        Guards the bookkeeping of both tiers, as pages are cached by concurrent fetch threads. Files of the
+        disk tier are read and written without holding it.
+
+    __directory : str
+        The directory of the disk tier.
+
+    __memory_budget : int
+        The number of bytes the memory tier may occupy.
+
+    __disk_budget : int
+        The number of bytes the disk tier may occupy.
+
+    __memory_size : int
+        The number of bytes the memory tier occupies.
+
+    __disk_size : int
+        The number of bytes the disk tier occupies.
+
+    Methods
+    -------
+    get(key)
+        Returns a cached result.
+
+    put(key, value)
+        Caches a result.
+    """
+
+    def __init__(self, directory: str, memory_budget: int = CACHE_MEMORY_BUDGET, disk_budget: int = CACHE_DISK_BUDGET):
+        """
+        Initializes a new `ResultCache` object.
+
+        Files of the disk tier written in earlier sessions are reused.
+
+        Parameters
+        ----------
+        directory : str
+            The directory of the disk tier. Created if missing.
+
+        memory_budget : int, optional
+            The number of bytes the memory tier may occupy (default is CACHE_MEMORY_BUDGET).
+
+        disk_budget : int, optional
+            The number of bytes the disk tier may occupy (default is CACHE_DISK_BUDGET).
+        """
+
+        self.__Memory = OrderedDict()
+        self.__Disk = OrderedDict()
+        self.__Lock = Lock()
+
+        self.__directory = directory
+        self.__memory_budget = memory_budget
+        self.__disk_budget = disk_budget
+        self.__memory_size = 0
+        self.__disk_size = 0
+
+        makedirs(directory, exist_ok=True)
+
+        # Files left partially written by an earlier session are removed.
+        self.__remove([name for name in listdir(directory) if name.endswith(CACHE_PART)])
+
+        files = [(stat(join(directory, name)), name) for name in listdir(directory) if name.endswith(CACHE_FILE)]
+
+        for status, name in sorted(files, key=lambda file: file[0].st_mtime):
+
+            self.__Disk[name] = status.st_size
+            self.__disk_size += status.st_size
+
+    def get(self, key: tuple):
+        """
+        Returns a cached result.
+
+        Results hit on the disk tier are moved to the memory tier.
+
+        Parameters
+        ----------
+        key : tuple
+            The key of the result.
+
+        Returns
+        -------
+        optional
+            A copy of the cached result. None if the key is not cached.
+        """
+
+        with self.__Lock:
+
+            serialized = self.__Memory.get(key)
+
+            if serialized is not None:
+
+                self.__Memory.move_to_end(key)
+
+                return loads(serialized)
+
+            name = self.__file(key)
+
+            if name not in self.__Disk:
+                return None
+
+        try:
+
+            with open(join(self.__directory, name), 'rb') as file:
+                serialized = file.read()
+
+        except FileNotFoundError:
+
+            with self.__Lock:
+                self.__forget(name)
+
+            return None
+
+        with self.__Lock:
+
+            discarded = self.__forget(name)
+            evicted = self.__store(key, serialized)
+
+        self.__remove(discarded)
+        self.__spill(evicted)
+
+        return loads(serialized)
+
+    def put(self, key: tuple, value):
+        """
+        Caches a result.
+
+        Parameters
+        ----------
+        key : tuple
+            The key of the result. Must be JSON serializable.
+
+        value
+            The result. Must be JSON serializable.
+        """
+
+        serialized = dumps(value).encode(UTF_8)
+
+        with self.__Lock:
+
+            if key in self.__Memory:
+                self.__memory_size -= len(self.__Memory.pop(key))
+
+            evicted = self.__store(key, serialized)
+
+        self.__spill(evicted)
+
+    def __store(self, key: tuple, serialized: bytes) -> list:
+
+        # Results exceeding the whole budget are not cached at all.
+        if len(serialized) > self.__memory_budget:
+            return []
+
+        self.__Memory[key] = serialized
+        self.__memory_size += len(serialized)
+
+        evicted = []
+
+        while self.__memory_size > self.__memory_budget:
+
+            evicted.append(self.__Memory.popitem(last=False))
+            self.__memory_size -= len(evicted[-1][1])
+
+        return evicted
+
+    def __spill(self, evicted: list):
+
+        # Files are written outside of the lock, which only guards the bookkeeping of both tiers. Each file
+        # is written under a temporary name first, hence concurrent reads never see a partial file.
+        spilled = []
+
+        for key, serialized in evicted:
+
+            if len(serialized) > self.__disk_budget:
+                continue
+
+            with NamedTemporaryFile(dir=self.__directory, suffix=CACHE_PART, delete=False) as file:
+                file.write(serialized)
+
+            name = self.__file(key)
+            replace(file.name, join(self.__directory, name))
+            spilled.append((name, len(serialized)))
+
+        if not spilled:
+            return
+
+        with self.__Lock:
+
+            for name, size in spilled:
+
+                self.__disk_size += size - self.__Disk.pop(name, 0)
+                self.__Disk[name] = size
+
+            discarded = []
+
+            while self.__disk_size > self.__disk_budget:
+                discarded.extend(self.__forget(next(iter(self.__Disk))))
+
+        self.__remove(discarded)
+
+    def __forget(self, name: str) -> list:
+
+        if name not in self.__Disk:
+            return []
+
+        self.__disk_size -= self.__Disk.pop(name)
+
+        return [name]
+
+    def __remove(self, names: list):
+
+        for name in names:
+
+            try:
+                remove(join(self.__directory, name))
+
+            except OSError:
+                pass
+
+    @staticmethod
+    def __file(key: tuple) -> str:
+
+        return sha1(dumps(key).encode(UTF_8)).hexdigest() + CACHE_FILE
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalizes the whitespace of a OpenCypher query outside of its string literals.
+
+    Parameters
+    ----------
+    query : str
+        A OpenCypher query.
+
+    Returns
+    -------
+    str
+        The query with runs of whitespace collapsed to one space.
+    """
+
+    return ''.join([part if index % 2 else sub(r'\s+', ' ', part)
+                    for index, part in enumerate(split(_LITERALS, query.strip()))])
+
+
+def is_write_query(query: str) -> bool:
+    """
+    Checks if a OpenCypher query may write to a graph.
+
+    Parameters
+    ----------
+    query : str
+        A OpenCypher query.
+
+    Returns
+    -------
+    bool
+        True if a write clause occurs outside of the string literals of the query.
+    """
+
+    return any([search(_WRITE_CLAUSES, part, IGNORECASE)
+                for index, part in enumerate(split(_LITERALS, query)) if not index % 2])
@@ -0,0 +1,209 @@
+"""
+Script to store the reader used by the dbinterface module to read compact responses of OpenCypher queries.
+"""
+
+from modules.dbinterface.cypher import get_schema
+from modules.dbinterface.constants import NULL, UTF_8, PROPERTY_KEYS, VALUE_NULL, VALUE_STRING, VALUE_INTEGER, \
+    VALUE_BOOLEAN, VALUE_DOUBLE, VALUE_ARRAY, VALUE_EDGE, VALUE_NODE, VALUE_PATH, VALUE_MAP, VALUE_POINT
+from modules.dbinterface.exceptons import DataBaseInterfaceValueTypeException
+
+
+class CompactReader:
+    """
+    Reader of compact responses of `GRAPH.QUERY`.
+
+    Compact responses type every cell and send vertices and edges as lists of IDs, which refer to the
+    labels, relationship types and property keys of a graph. The reader resolves these IDs through a
+    schema cache and returns the response in the verbose layout, i.e. a header of `binder.key` names
+    followed by rows of encoded cells, hence `ResultSet` and the revision of responses read both
+    layouts alike. The cached schema of a graph is requested again only if an ID is missing from it,
+    as RedisGraph only appends to the schema of a graph.
+
+    Attributes
+    ----------
+    __Execute : callable
+        Called with a graph key and a OpenCypher query, returns the compact response of the query.
+
+    __Schemas : dict
+        Maps tuples of graph key and schema procedure to the cached names, indexed by their ID.
+
+    Methods
+    -------
+    read(dbkey, response)
+        Returns a compact response in the verbose layout.
+
+    resolve(dbkey, procedure, identifiers)
+        Returns the names of schema IDs.
+
+    invalidate(dbkey)
+        Drops the cached schema of a graph.
+    """
+
+    def __init__(self, execute):
+        """
+        Initializes a new `CompactReader` object.
+
+        Parameters
+        ----------
+        execute : callable
+            Called with a graph key and a OpenCypher query, returns the compact response of the query.
+        """
+
+        self.__Execute = execute
+        self.__Schemas = {}
+
+    def read(self, dbkey: str, response: list) -> list:
+        """
+        Returns a compact response in the verbose layout.
+
+        Columns of vertices or edges are expanded to one column per property key found on any of their
+        rows. Properties missing on a row are filled with `NULL`.
+
+        Parameters
+        ----------
+        dbkey : str
+            The graph key the response was returned for.
+
+        response : list
+            A compact response of `GRAPH.QUERY`.
+
+        Returns
+        -------
+        list
+            The header followed by the rows of the response. Empty if the query returned no columns.
+        """
+
+        # Responses of queries without a return clause only comprise the statistics.
+        if len(response) < 3:
+            return []
+
+        header, records = response[0], response[1]
+        columns = []
+
+        for index in range(len(header)):
+
+            keys = None
+
+            for value_type, value in (record[index] for record in records):
+
+                if value_type == VALUE_NODE or value_type == VALUE_EDGE:
+
+                    keys = {} if keys is None else keys
+
+                    for key, _, _ in value[-1]:
+                        keys.setdefault(key, None)
+
+            columns.append(keys if keys is None else list(keys))
+
+        names = self.resolve(dbkey, PROPERTY_KEYS, [key for keys in columns if keys for key in keys])
+        revised = [[]]
+
+        for (_, name), keys in zip(header, columns):
+
+            if keys is None:
+                revised[0].append(_encode(name))
+
+            else:
+                revised[0].extend([_encode(name) + b'.' + names[key].encode(UTF_8) for key in keys])
+
+        for record in records:
+
+            row = []
+
+            for (value_type, value), keys in zip(record, columns):
+
+                if keys is None:
+                    row.append(_scalar(value_type, value))
+
+                elif value_type == VALUE_NODE or value_type == VALUE_EDGE:
+
+                    properties = {key: _scalar(key_type, key_value) for key, key_type, key_value in value[-1]}
+                    row.extend([properties.get(key, NULL.encode(UTF_8)) for key in keys])
+
+                else:
+                    row.extend([NULL.encode(UTF_8)] * len(keys))
+
+            revised.append(row)
+
+        return revised
+
+    def resolve(self, dbkey: str, procedure: str, identifiers: list) -> list:
+        """
+        Returns the names of schema IDs.
+
+        Parameters
+        ----------
+        dbkey : str
+            The graph key the IDs refer to.
+
+        procedure : str
+            The schema procedure listing the names, one of `LABELS`, `PROPERTY_KEYS` and
+            `RELATIONSHIP_TYPES`.
+
+        identifiers : list
+            The IDs to resolve. The cached schema is requested again if any ID is missing from it.
+
+        Returns
+        -------
+        list
+            The cached names, indexed by their ID.
+        """
+
+        names = self.__Schemas.get((dbkey, procedure), [])
+
+        if identifiers and max(identifiers) >= len(names):
+
+            names = [_encode(record[0][1]).decode(UTF_8)
+                     for record in self.__Execute(dbkey, get_schema(procedure))[1]]
+            self.__Schemas[(dbkey, procedure)] = names
+
+        return names
+
+    def invalidate(self, dbkey: str):
+        """
+        Drops the cached schema of a graph.
+
+        Called if a graph is deleted or replaced, as the IDs of a new graph do not refer to the same names.
+
+        Parameters
+        ----------
+        dbkey : str
+            The graph key.
+        """
+
+        for key in [key for key in self.__Schemas if key[0] == dbkey]:
+            self.__Schemas.pop(key, None)
+
+
+def _scalar(value_type: int, value) -> bytes:
+
+    if value_type == VALUE_NULL:
+        return NULL.encode(UTF_8)
+
+    if value_type == VALUE_STRING or value_type == VALUE_BOOLEAN or value_type == VALUE_DOUBLE:
+        return _encode(value)
+
+    if value_type == VALUE_INTEGER:
+        return str(value).encode(UTF_8)
+
+    if value_type == VALUE_ARRAY or value_type == VALUE_PATH:
+        return b'[' + b', '.join([_scalar(*item) for item in value]) + b']'
+
+    # Vertices and edges nested in arrays or paths are represented by their internal ID.
+    if value_type == VALUE_NODE or value_type == VALUE_EDGE:
+        return str(value[0]).encode(UTF_8)
+
+    # Maps are sent as flat list of keys, each followed by its typed value.
+    if value_type == VALUE_MAP:
+        return b'{' + b', '.join([_encode(key) + b': ' + _scalar(*item)
+                                  for key, item in zip(value[::2], value[1::2])]) + b'}'
+
+    if value_type == VALUE_POINT:
+        return b'point({latitude: ' + _encode(value[0]) + b', longitude: ' + _encode(value[1]) + b'})'
+
+    raise DataBaseInterfaceValueTypeException(value_type)
+
+
+def _encode(value) -> bytes:
+
+    return value.encode(UTF_8) if isinstance(value, str) else value
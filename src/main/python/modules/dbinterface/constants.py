@@ -8,22 +8,139 @@ WORK_DIRECTORY = 'wrk/'
 
 DATA_SEPARATOR = '__'
 MERGE_SEPARATOR = '___'
+COMPOSITE_SEPARATOR = '|'
 DISPLAY_SEPARATOR = ','
 ID = 'id'
 
 CREATE = ' create '
+SET = ' set '
+IN = ' in '
+UNWIND = ' unwind '
+MERGE = ' merge '
+AS = ' as '
+CYPHER = 'CYPHER '
+ROW = 'row'
+ROWS = 'rows'
 VERTEX = 'vertex'
 SOURCE = 'source'
 TARGET = 'target'
 EDGE = 'edge'
 MATCH = ' match '
 DISTINCT = ' return distinct '
+RETURN = ' return '
+WHERE = ' where '
+AND = ' and '
+OR = ' or '
+WITH = ' with '
+ORDER = ' order by '
+DESC = ' desc'
 LIMIT = ' limit '
 ONE = '1'
+NULL = 'NULL'
+CALL = 'CALL '
+LABELS = 'db.labels()'
+PROPERTY_KEYS = 'db.propertyKeys()'
+RELATIONSHIP_TYPES = 'db.relationshipTypes()'
+
+# Value types of a compact reply. Strings, booleans and doubles are sent as strings and read as such.
+VALUE_NULL = 1
+VALUE_STRING = 2
+VALUE_INTEGER = 3
+VALUE_BOOLEAN = 4
+VALUE_DOUBLE = 5
+VALUE_ARRAY = 6
+VALUE_EDGE = 7
+VALUE_NODE = 8
+VALUE_PATH = 9
+VALUE_MAP = 10
+VALUE_POINT = 11
+
+PAGE_SIZE = 10000
+POOL_SIZE = 8
+ASYNC_POOL_SIZE = 32
+# Timeout of queries in milliseconds, enforced by RedisGraph.
+QUERY_TIMEOUT = 60000
+# Seconds waited for the response of a query beyond its timeout, as writes are not timed out by RedisGraph.
+TIMEOUT_GRACE = 1
+FETCH_WORKERS = 6
+CASEFOLD = 'casefold'
+WHITESPACE = 'whitespace'
+VERSION = 'version'
+VERSION_SUFFIX = r'\.\d+$'
+
+PYTHON_KERNEL = 'python'
+NUMPY_KERNEL = 'numpy'
+PARALLEL_KERNEL = 'parallel'
+# Partitions per worker process of the parallel kernel, to balance buckets of different sizes.
+PARTITIONS_PER_WORKER = 4
+
+CONCAT_POLICY = 'concat'
+FIRST_POLICY = 'first'
+DISTINCT_POLICY = 'distinct'
+COUNT_POLICY = 'count'
+MIN_POLICY = 'min'
+MAX_POLICY = 'max'
+MEAN_POLICY = 'mean'
+MERGE_POLICIES = (CONCAT_POLICY, FIRST_POLICY, DISTINCT_POLICY, COUNT_POLICY, MIN_POLICY, MAX_POLICY, MEAN_POLICY)
+# Policies that cannot be applied to merged values again.
+AGGREGATE_POLICIES = (COUNT_POLICY, MEAN_POLICY)
+
+BATCH_SIZE = 1000
+CLIENT_ENGINE = 'client'
+SERVER_ENGINE = 'server'
+AUTO_ENGINE = 'auto'
+DISK_ENGINE = 'disk'
+MEMORY_BUDGET = 2 ** 30
+RUN_FILE = '.jsonl'
+ENGINE_THRESHOLD = 1000000
+COLLISION_RATIO = 0.01
+
+SKETCH = '__sketch'
+VIEW = '__view'
+BACKUP = '__backup'
+GRAPH_VERSION = '__version'
+CACHE_DIRECTORY = WORK_DIRECTORY + 'cache/'
+CACHE_FILE = '.json'
+CACHE_PART = '.part'
+CACHE_NONCE = '__cache' + GRAPH_VERSION
+CACHE_MEMORY_BUDGET = 2 ** 28
+CACHE_DISK_BUDGET = 2 ** 30
+MINHASH = SKETCH + '__minhash'
+MINHASH_PERMUTATIONS = 128
+MINHASH_SEED = 1
+# Digest size in bytes of the hashes of the MinHash permutations.
+MINHASH_HASH_SIZE = 8
+COLLISION_GROUPS = 10
+ESTIMATE_VERTICES = 'vertices'
+ESTIMATE_EDGES = 'edges'
+ESTIMATE_VALUES = 'values'
+ESTIMATE_BUCKETS = 'buckets'
+ESTIMATE_COLLISIONS = 'collisions'
+ESTIMATE_MEMORY = 'memory'
+ESTIMATE_ENGINE = 'engine'
+
+NODES = '_nodes'
+EDGES = '_edges'
+
+MANIFEST = '__manifest'
+MANIFEST_VALUES = MANIFEST + '__values'
+MANIFEST_SOURCES = MANIFEST + '__sources'
+MANIFEST_META = MANIFEST + '__meta'
+MANIFEST_NAME = 'name'
+MANIFEST_PROPERTY = 'property'
+MANIFEST_SELECTION = 'selection'
+MANIFEST_INDEX = 'index'
+MANIFEST_POLICIES = 'policies'
+MANIFEST_PREDICATE = 'predicate'
+MANIFEST_PROJECTION = 'projection'
+POLICY_SEPARATOR = ':'
 
 G_QUERY = 'GRAPH.QUERY'
 G_DELETE = 'GRAPH.DELETE'
 G_EXPLAIN = 'GRAPH.EXPLAIN'
+COMPACT = '--compact'
+TIMEOUT = 'TIMEOUT'
+TIMED_OUT = 'timed out'
 QUIT = 'QUIT'
 SAVE = 'SAVE'
 KEYS = 'KEYS *'
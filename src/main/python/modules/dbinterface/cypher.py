@@ -1,4 +1,9 @@
-from modules.dbinterface.constants import MATCH, DISTINCT, VERTEX, LIMIT, ONE, EDGE, TARGET, SOURCE
+from re import sub, split, fullmatch
+from modules.dbinterface.constants import MATCH, DISTINCT, VERTEX, LIMIT, ONE, EDGE, TARGET, SOURCE, RETURN, WHERE, \
+    AND, SET, IN, ID, UNWIND, CYPHER, ROW, ROWS, MERGE_SEPARATOR, MERGE, AS, OR, WITH, ORDER, DESC, NULL, \
+    CALL, COMPOSITE_SEPARATOR
+from modules.dbinterface.exceptons import DataBaseInterfacePredicateException
+from modules.dbinterface.cache import is_write_query
 
 
 def get_vertex_limited():
@@ -64,3 +69,522 @@ def get_values(*args: str) -> str:
     """
 
     return MATCH + '(v)' + DISTINCT + ', '.join(['v.' + arg for arg in args])
+
+
+def get_entities_paged(lower: int, upper: int, predicate: str = None, vertex_properties: list = None,
+                       edge_properties: list = None) -> str:
+    """
+    Used to query the entities of a graph whose source vertex is within a window of vertex IDs.
+
+    The source vertices are matched by their ID first, which RedisGraph seeks instead of scanning
+    all edges, and expanded to their outgoing edges. Each edge is returned exactly once together
+    with its source and target vertex, hence the union of all windows up to the highest vertex ID
+    covers all (connected) entities.
+
+    Parameters
+    ----------
+    lower : int
+        The lowest source vertex ID of the window (inclusive).
+
+    upper : int
+        The highest source vertex ID of the window (exclusive).
+
+    predicate : str, optional
+        A OpenCypher predicate on the binder `vertex`. Only edges whose source and target vertex
+        satisfy the predicate are returned (default is None).
+
+    vertex_properties : list, optional
+        The properties of the vertices to return. All properties are returned if None (default is None).
+
+    edge_properties : list, optional
+        The properties of the edges to return. All properties are returned if None (default is None).
+
+    Returns
+    -------
+    str
+        The constructed parameterized OpenCypher query to retrieve all (connected) entities of the window.
+    """
+
+    return _parameters(lower=lower, upper=upper) + \
+        MATCH + '(' + SOURCE + ')' + \
+        WHERE + 'id(' + SOURCE + ') >= $lower' + AND + 'id(' + SOURCE + ') < $upper' + \
+        (AND + _bind(predicate, SOURCE) if predicate else '') + \
+        MATCH + '(' + SOURCE + ')-[' + EDGE + ']->(' + TARGET + ')' + \
+        (WHERE + _bind(predicate, TARGET) if predicate else '') + \
+        RETURN + ', '.join([_projection(SOURCE, vertex_properties),
+                            _projection(TARGET, vertex_properties),
+                            _projection(EDGE, edge_properties)])
+
+
+def get_vertices_by_id(label: str, identifiers: list) -> str:
+    """
+    Used to query all vertices with one of the specified IDs.
+
+    Parameters
+    ----------
+    label : str
+        The label of the vertices.
+
+    identifiers : list
+        A list of str. The values of the `id` property to match.
+
+    Returns
+    -------
+    str
+        The constructed parameterized OpenCypher query to retrieve the vertices.
+    """
+
+    return _parameters(identifiers=identifiers) + \
+        MATCH + '(' + VERTEX + ':' + label + ')' + WHERE + VERTEX + '.' + ID + IN + '$identifiers' + RETURN + VERTEX
+
+
+def get_edges_by_source(label: str, identifiers: list) -> str:
+    """
+    Used to query all edges with one of the specified source IDs.
+
+    The source vertices are matched by their `id` property.
+
+    Parameters
+    ----------
+    label : str
+        The label of the source vertices.
+
+    identifiers : list
+        A list of str. The values of the `id` property of the source vertices to match.
+
+    Returns
+    -------
+    str
+        The constructed parameterized OpenCypher query to retrieve the edges.
+    """
+
+    return _parameters(identifiers=identifiers) + \
+        MATCH + '(' + SOURCE + ':' + label + ')-[' + EDGE + ']->()' + \
+        WHERE + SOURCE + '.' + ID + IN + '$identifiers' + RETURN + EDGE
+
+
+def get_vertex_id_bound() -> str:
+    """
+    Used to query the highest vertex ID of a graph.
+
+    Returns
+    -------
+    str
+        The constructed OpenCypher query to retrieve the highest vertex ID.
+    """
+
+    return MATCH + '(' + VERTEX + ')' + RETURN + 'max(id(' + VERTEX + '))'
+
+
+def get_schema(procedure: str) -> str:
+    """
+    Used to call a schema procedure of a graph.
+
+    Parameters
+    ----------
+    procedure : str
+        One of `LABELS`, `PROPERTY_KEYS` and `RELATIONSHIP_TYPES`.
+
+    Returns
+    -------
+    str
+        The constructed OpenCypher query to list the labels, property keys or relationship types.
+    """
+
+    return CALL + procedure
+
+
+def get_keys_paged(lower: int, upper: int, *args: str, predicate: str = None) -> str:
+    """
+    Used to query the `id` and the specified properties of all vertices within a window of vertex IDs.
+
+    Parameters
+    ----------
+    lower : int
+        The lowest vertex ID of the window (inclusive).
+
+    upper : int
+        The highest vertex ID of the window (exclusive).
+
+    args : str
+        Arguments should be only strings.
+
+    predicate : str, optional
+        A OpenCypher predicate on the binder `vertex`. Only vertices satisfying the predicate
+        are returned (default is None).
+
+    Returns
+    -------
+    str
+        The constructed parameterized OpenCypher query to retrieve the merge keys of the window.
+    """
+
+    return _parameters(lower=lower, upper=upper) + \
+        MATCH + '(' + VERTEX + ')' + \
+        WHERE + 'id(' + VERTEX + ') >= $lower' + AND + 'id(' + VERTEX + ') < $upper' + \
+        (AND + _bind(predicate, VERTEX) if predicate else '') + \
+        RETURN + ', '.join([VERTEX + '.' + _name(arg) for arg in (ID,) + args])
+
+
+def get_counts(*args, predicate: str = None) -> str:
+    """
+    Used to count all vertices and the distinct values of the merge keys given in args.
+
+    Parameters
+    ----------
+    args : str or tuple
+        Properties or tuples of properties (composite keys), whose values are counted as joined tuples.
+
+    predicate : str, optional
+        A OpenCypher predicate on the binder `vertex`. Only vertices satisfying the predicate
+        are counted (default is None).
+
+    Returns
+    -------
+    str
+        The constructed OpenCypher query to retrieve the counts.
+    """
+
+    return MATCH + '(' + VERTEX + ')' + (WHERE + _bind(predicate, VERTEX) if predicate else '') + RETURN + \
+        ', '.join(['count(' + VERTEX + ')'] + ['count(DISTINCT ' + _key(VERTEX, arg) + ')' for arg in args])
+
+
+def get_edge_count(predicate: str = None) -> str:
+    """
+    Used to count all edges of a graph.
+
+    Parameters
+    ----------
+    predicate : str, optional
+        A OpenCypher predicate on the binder `vertex`. Only edges whose source and target vertex
+        satisfy the predicate are counted (default is None).
+
+    Returns
+    -------
+    str
+        The constructed OpenCypher query to retrieve the number of edges.
+    """
+
+    if predicate:
+        return MATCH + '(' + SOURCE + ')-[' + EDGE + ']->(' + TARGET + ')' + \
+            WHERE + _bind(predicate, SOURCE) + AND + _bind(predicate, TARGET) + RETURN + 'count(' + EDGE + ')'
+
+    return MATCH + '()-[' + EDGE + ']->()' + RETURN + 'count(' + EDGE + ')'
+
+
+def get_values_paged(lower: int, upper: int, *args: str) -> str:
+    """
+    Used to query the distinct values of the specified properties within a window of vertex IDs.
+
+    Parameters
+    ----------
+    lower : int
+        The lowest vertex ID of the window (inclusive).
+
+    upper : int
+        The highest vertex ID of the window (exclusive).
+
+    args : str
+        Arguments should be only strings.
+
+    Returns
+    -------
+    str
+        The constructed parameterized OpenCypher query to retrieve the distinct values of the window.
+    """
+
+    return _parameters(lower=lower, upper=upper) + \
+        MATCH + '(' + VERTEX + ')' + \
+        WHERE + 'id(' + VERTEX + ') >= $lower' + AND + 'id(' + VERTEX + ') < $upper' + \
+        DISTINCT + ', '.join([VERTEX + '.' + _name(arg) for arg in args])
+
+
+def get_keyed_count(*args, predicate: str = None) -> str:
+    """
+    Used to count all vertices storing a value for any of the merge keys given in args.
+
+    Parameters
+    ----------
+    args : str or tuple
+        Properties or tuples of properties (composite keys). A composite key is only stored if all of
+        its properties are.
+
+    predicate : str, optional
+        A OpenCypher predicate on the binder `vertex`. Only vertices satisfying the predicate
+        are counted (default is None).
+
+    Returns
+    -------
+    str
+        The constructed OpenCypher query to retrieve the number of vertices.
+    """
+
+    return MATCH + '(' + VERTEX + ')' + \
+        WHERE + '(' + OR.join([_stored(VERTEX, arg) for arg in args]) + ')' + \
+        (AND + _bind(predicate, VERTEX) if predicate else '') + \
+        RETURN + 'count(' + VERTEX + ')'
+
+
+def get_value_sizes(key, limit: int, predicate: str = None) -> str:
+    """
+    Used to query the values of a merge key shared by the most vertices.
+
+    Parameters
+    ----------
+    key : str or tuple
+        The property or tuple of properties (composite key) to group the vertices by.
+
+    limit : int
+        The number of values to return.
+
+    predicate : str, optional
+        A OpenCypher predicate on the binder `vertex`. Only vertices satisfying the predicate
+        are grouped (default is None).
+
+    Returns
+    -------
+    str
+        The constructed OpenCypher query to retrieve the values and their number of vertices.
+    """
+
+    return MATCH + '(' + VERTEX + ')' + \
+        WHERE + _stored(VERTEX, key) + (AND + _bind(predicate, VERTEX) if predicate else '') + \
+        RETURN + _key(VERTEX, key) + ', count(' + VERTEX + ')' + AS + 'size' + \
+        ORDER + 'size' + DESC + LIMIT + str(limit)
+
+
+def get_size_distribution(key, predicate: str = None) -> str:
+    """
+    Used to count the values of a merge key by their number of vertices.
+
+    The number of values summed over all rows is the number of distinct values of the key.
+
+    Parameters
+    ----------
+    key : str or tuple
+        The property or tuple of properties (composite key) to group the vertices by.
+
+    predicate : str, optional
+        A OpenCypher predicate on the binder `vertex`. Only vertices satisfying the predicate
+        are grouped (default is None).
+
+    Returns
+    -------
+    str
+        The constructed OpenCypher query to retrieve each number of vertices and its number of values.
+    """
+
+    return MATCH + '(' + VERTEX + ')' + \
+        WHERE + _stored(VERTEX, key) + (AND + _bind(predicate, VERTEX) if predicate else '') + \
+        WITH + _key(VERTEX, key) + AS + 'value, count(' + VERTEX + ')' + AS + 'size' + \
+        RETURN + 'size, count(value)'
+
+
+def create_index(label: str, property_: str) -> str:
+    """
+    Used to create an index on a property of all vertices with a label.
+
+    Parameters
+    ----------
+    label : str
+        The label of the vertices.
+
+    property_ : str
+        The property to index.
+
+    Returns
+    -------
+    str
+        The constructed OpenCypher query to create the index.
+    """
+
+    return 'CREATE INDEX ON :' + label + '(' + property_ + ')'
+
+
+def merge_vertices(label: str, rows: list, concatenated: list, assigned: list) -> str:
+    """
+    Used to merge a batch of vertices into a graph.
+
+    The rows are passed as query parameter and unwound. A vertex is created for each new value of the
+    `id` property, rows with the `id` of an existing vertex are merged into it.
+
+    Parameters
+    ----------
+    label : str
+        The label of the vertices.
+
+    rows : list
+        A list of dictionaries. Each dictionary has to contain the key `id`.
+
+    concatenated : list
+        Properties whose values are concatenated with the values of an existing vertex.
+
+    assigned : list
+        Properties whose values overwrite the values of an existing vertex.
+
+    Returns
+    -------
+    str
+        The constructed parameterized OpenCypher query to merge the vertices.
+    """
+
+    return unwind(rows) + \
+        MERGE + '(' + VERTEX + ':' + label + ' {' + ID + ': ' + ROW + '.' + ID + '})' + \
+        SET + ', '.join([_concatenation(VERTEX, property_) for property_ in concatenated] +
+                        [VERTEX + '.' + _name(property_) + ' = ' + ROW + '.' + _name(property_)
+                         for property_ in assigned])
+
+
+def merge_edges(label: str, relation: str, rows: list, concatenated: list, assigned: list = None) -> str:
+    """
+    Used to merge a batch of edges into a graph.
+
+    The rows are passed as query parameter and unwound. An edge is created for each new pair of
+    `source` and `target`, rows with the pair of an existing edge are merged into it. The source and target
+    vertices are matched by their `id` property.
+
+    Parameters
+    ----------
+    label : str
+        The label of the source and target vertices.
+
+    relation : str
+        The relationship type of the edges.
+
+    rows : list
+        A list of dictionaries. Each dictionary has to contain the keys `source` and `target`.
+
+    concatenated : list
+        Properties whose values are concatenated with the values of an existing edge.
+
+    assigned : list, optional
+        Properties whose values overwrite the values of an existing edge (default is None).
+
+    Returns
+    -------
+    str
+        The constructed parameterized OpenCypher query to merge the edges.
+    """
+
+    return unwind(rows) + \
+        MATCH + '(' + SOURCE + ':' + label + ' {' + ID + ': ' + ROW + '.' + SOURCE + '}), ' + \
+        '(' + TARGET + ':' + label + ' {' + ID + ': ' + ROW + '.' + TARGET + '})' + \
+        MERGE + '(' + SOURCE + ')-[' + EDGE + ':' + relation + ']->(' + TARGET + ')' + \
+        SET + ', '.join([EDGE + '.' + SOURCE + ' = ' + ROW + '.' + SOURCE,
+                         EDGE + '.' + TARGET + ' = ' + ROW + '.' + TARGET] +
+                        [_concatenation(EDGE, property_) for property_ in concatenated] +
+                        [EDGE + '.' + _name(property_) + ' = ' + ROW + '.' + _name(property_)
+                         for property_ in assigned or []])
+
+
+def unwind(rows: list) -> str:
+    """
+    Used to unwind a batch of rows passed as query parameter.
+
+    The returned prefix binds each row to `row`, hence one query shape processes batches of any
+    size and content and RedisGraph reuses its cached execution plan.
+
+    Parameters
+    ----------
+    rows : list
+        A list of dictionaries.
+
+    Returns
+    -------
+    str
+        The parameterized OpenCypher prefix to unwind the rows.
+    """
+
+    return _parameters(**{ROWS: rows}) + UNWIND + '$' + ROWS + AS + ROW
+
+
+def _bind(predicate: str, binder: str) -> str:
+
+    # Predicates are inserted into the queries verbatim and are stored with merge manifests, hence they must
+    # not write to the graph.
+    if is_write_query(predicate):
+        raise DataBaseInterfacePredicateException(predicate)
+
+    # Predicates are written on the binder `vertex`. String literals are split off to keep them unchanged,
+    # properties, labels and parameters named `vertex` are not rebound.
+    parts = split(r"('(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\")", predicate)
+
+    return '(' + ''.join([sub(r'(?<![.:$])\b' + VERTEX + r'\b', binder, part) if index % 2 == 0 else part
+                          for index, part in enumerate(parts)]) + ')'
+
+
+def _key(binder: str, key) -> str:
+
+    # The values of a composite key are joined like `encode_key` joins them.
+    properties = (key,) if isinstance(key, str) else key
+
+    return (' + ' + _literal(COMPOSITE_SEPARATOR) + ' + ').join([binder + '.' + _name(property_)
+                                                              for property_ in properties])
+
+
+def _stored(binder: str, key) -> str:
+
+    if isinstance(key, str):
+        return binder + '.' + _name(key) + ' <> ' + _literal(NULL)
+
+    # A composite key is only stored if all of its properties are.
+    return '(' + AND.join([binder + '.' + _name(property_) + ' <> ' + _literal(NULL) for property_ in key]) + ')'
+
+
+def _projection(binder: str, properties: list) -> str:
+
+    if properties is None:
+        return binder
+
+    return ', '.join([binder + '.' + _name(property_) for property_ in properties])
+
+
+def _parameters(**parameters) -> str:
+
+    if not parameters:
+        return ''
+
+    # Values are passed in the parameter header, hence queries of the same shape share one query text.
+    return CYPHER + ' '.join([name + '=' + _value(value) for name, value in parameters.items()])
+
+
+def _value(value) -> str:
+
+    if isinstance(value, dict):
+        return '{' + ', '.join([_name(key) + ': ' + _value(item) for key, item in value.items()]) + '}'
+
+    if isinstance(value, (list, tuple)):
+        return '[' + ', '.join([_value(item) for item in value]) + ']'
+
+    # Booleans are passed as OpenCypher booleans instead of the strings 'True' and 'False'.
+    if isinstance(value, bool):
+        return str(value).lower()
+
+    if isinstance(value, (int, float)):
+        return str(value)
+
+    return _literal(value)
+
+
+def _name(name: str) -> str:
+
+    # Property names and map keys, which are not plain identifiers, e.g. `gene symbol`, are quoted.
+    if fullmatch(r'[A-Za-z_][A-Za-z0-9_]*', name):
+        return name
+
+    return '`' + name.replace('`', '``') + '`'
+
+
+def _literal(value: str) -> str:
+
+    return "'" + str(value).replace('\\', '\\\\').replace("'", "\\'") + "'"
+
+
+def _concatenation(binder: str, property_: str) -> str:
+
+    entity_value = binder + '.' + _name(property_)
+    row_value = ROW + '.' + _name(property_)
+
+    return entity_value + ' = CASE WHEN ' + row_value + ' IS NULL THEN ' + entity_value + \
+        ' WHEN ' + entity_value + ' IS NULL THEN ' + row_value + \
+        ' ELSE ' + entity_value + ' + ' + _literal(MERGE_SEPARATOR) + ' + ' + row_value + ' END'
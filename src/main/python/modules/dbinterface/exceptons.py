@@ -17,3 +17,68 @@ class FileInterfaceEmptyFileException(Exception):
     def __init__(self):
 
         super().__init__('No file given.')
+
+
+class DataBaseInterfaceMergeKernelException(Exception):
+
+    def __init__(self, kernel):
+
+        super().__init__('The merge kernel ' + kernel + ' is not supported.')
+
+
+class DataBaseInterfaceManifestException(Exception):
+
+    def __init__(self, graph_key):
+
+        super().__init__('No merge manifest is stored for graph ' + graph_key + '.')
+
+
+class DataBaseInterfaceMergeEngineException(Exception):
+
+    def __init__(self, engine):
+
+        super().__init__('The merge engine ' + engine + ' is not supported.')
+
+
+class DataBaseInterfaceMergePolicyException(Exception):
+
+    def __init__(self, policy, engine):
+
+        super().__init__('The merge policy ' + policy + ' is not supported by the merge engine ' + engine + '.')
+
+
+class DataBaseInterfacePredicateException(Exception):
+
+    def __init__(self, predicate):
+
+        super().__init__('The predicate ' + predicate + ' contains a write clause. Only read predicates are supported.')
+
+
+class DataBaseInterfaceCanonicalizerException(Exception):
+
+    def __init__(self, canonicalizer):
+
+        super().__init__('The canonicalizer ' + canonicalizer + ' is not supported.')
+
+
+class DataBaseInterfaceViewException(Exception):
+
+    def __init__(self, view):
+
+        super().__init__('The graph ' + view + ' is a virtual merge graph. Only read queries are supported, '
+                         'materialize it to merge or sketch it.')
+
+
+class DataBaseInterfaceValueTypeException(Exception):
+
+    def __init__(self, value_type):
+
+        super().__init__('The value type ' + str(value_type) + ' of a compact response is not supported. '
+                         'Disable compact responses to read the response.')
+
+
+class DataBaseInterfaceTimeoutException(Exception):
+
+    def __init__(self, graph_key, timeout):
+
+        super().__init__('The query against graph ' + graph_key + ' timed out after ' + str(timeout) + ' ms.')
@@ -1,15 +1,40 @@
 from itertools import chain
-from os.path import basename, abspath, join, dirname
+from queue import Queue
+from threading import Event
+from concurrent.futures import ThreadPoolExecutor
+from os.path import basename, abspath, join, dirname, exists
 from os import remove, mkdir
+from tempfile import TemporaryDirectory
+from json import dumps, loads
+from zlib import crc32
+from uuid import uuid4
+from sys import getsizeof
 from subprocess import Popen, PIPE
 from tkinter import messagebox
 from csv import DictWriter
-from modules.dbinterface.cypher import get_vertex_limited, get_edge_limited, get_entities, get_values
-from modules.dbinterface.constants import WORK_DIRECTORY, REDIS_BULK_DIRECTORY, PYTHON_EXEC, G_EXPLAIN
+from modules.dbinterface.cypher import get_vertex_limited, get_edge_limited, get_entities_paged, \
+    get_vertices_by_id, get_edges_by_source, get_vertex_id_bound, get_keys_paged, get_counts, get_edge_count, \
+    create_index, merge_vertices, merge_edges, get_values_paged, get_keyed_count, get_value_sizes, get_size_distribution
+from modules.dbinterface.constants import WORK_DIRECTORY, REDIS_BULK_DIRECTORY, PYTHON_EXEC, G_EXPLAIN, PAGE_SIZE, \
+    NULL, POOL_SIZE, FETCH_WORKERS, PYTHON_KERNEL, NUMPY_KERNEL, PARALLEL_KERNEL, NODES, EDGES, \
+    MANIFEST_VALUES, MANIFEST_SOURCES, MANIFEST_META, MANIFEST_NAME, MANIFEST_PROPERTY, MANIFEST_SELECTION, \
+    MANIFEST_INDEX, MANIFEST_POLICIES, MANIFEST_PREDICATE, MANIFEST_PROJECTION, POLICY_SEPARATOR, CONCAT_POLICY, \
+    MERGE_POLICIES, AGGREGATE_POLICIES, BATCH_SIZE, CLIENT_ENGINE, SERVER_ENGINE, AUTO_ENGINE, DISK_ENGINE, \
+    MEMORY_BUDGET, RUN_FILE, ENGINE_THRESHOLD, COLLISION_RATIO, COLLISION_GROUPS, ESTIMATE_VERTICES, \
+    ESTIMATE_EDGES, ESTIMATE_VALUES, ESTIMATE_BUCKETS, ESTIMATE_COLLISIONS, ESTIMATE_MEMORY, ESTIMATE_ENGINE, VIEW, \
+    MINHASH
 from igraph import Graph, plot
-from modules.dbinterface.exceptons import FileInterfaceFileTypeException, FileInterfaceEmptyFileException
+from modules.dbinterface.resultset import ResultSet, revise_response
+from modules.dbinterface.compact import CompactReader
+from modules.dbinterface.cache import ResultCache, normalize_query, is_write_query
+from modules.dbinterface.merge import DisjointSet, Normalizer, MinHash, merge_columnar, merge_entities, \
+    merge_parallel, flatten_keys, encode_key, decode_key, join_values
+from modules.dbinterface.exceptons import FileInterfaceFileTypeException, FileInterfaceEmptyFileException, \
+    DataBaseInterfaceMergeKernelException, DataBaseInterfaceManifestException, DataBaseInterfaceMergeEngineException, \
+    DataBaseInterfaceMergePolicyException, DataBaseInterfaceViewException
 from modules.dbinterface.constants import QUIT, G_QUERY, UTF_8, KEYS, G_DELETE,  MERGE_SEPARATOR, SOURCE, TARGET, ID, \
-    DATA_SEPARATOR, DISPLAY_SEPARATOR, VERTEX, EDGE
+    DATA_SEPARATOR, DISPLAY_SEPARATOR, COMPOSITE_SEPARATOR, VERTEX, EDGE, COMPACT, \
+    GRAPH_VERSION, CACHE_DIRECTORY, CACHE_NONCE, BACKUP
 from modules.gui.container import OpenFile
 
 import redis
@@ -31,6 +56,23 @@ class DataBaseInterface:
     __FileInterface : FileInterface
         Interface used to bulk upload graphs.
 
+    __Cache : ResultCache
+        Caches decoded query results of the connected instance by graph key, query and graph version.
+
+    __Reader : CompactReader
+        Reads compact responses through the schema cache of the connected instance. None if verbose
+        responses are requested.
+
+    __Overlaps : dict
+        The overlaps returned by `db_get_overlaps`. None if sketches were stored or deleted since.
+
+    __compact : bool
+        If compact responses are requested.
+
+    __identity : str
+        Identifies the contents of the connected instance in the keys of cached results, see
+        `__get_identity`. None until the first result is cached.
+
     __host : str
         The host used to initialize the Redis client.
 
@@ -48,6 +90,12 @@ class DataBaseInterface:
     client_get_connection()
         Returns the current connection status.
 
+    client_get_cache()
+        Returns the result cache of the connected instance.
+
+    client_get_reader()
+        Returns the reader of compact responses of the connected instance.
+
     db_save()
         Saves the database to disk.
 
@@ -60,9 +108,12 @@ class DataBaseInterface:
     db_delete_key(dbkey)
         Deletes the graph specified by dbkey.
 
-    db_merge(selection, source_graphs, target_graph)
+    db_merge(selection, source_graphs, target_graph, page_size, kernel, engine)
         Calculates the merge graph of a list of source_graphs with respect to a list of properties.
 
+    db_merge_incremental(selection, source_graph, target_graph, page_size)
+        Folds a new source graph into an existing merge graph.
+
     db_query(query, dbkey, to_graph)
         Queries a specified graph.
 
@@ -73,7 +124,7 @@ class DataBaseInterface:
         Writes a new graph to the database.
     """
 
-    def __init__(self, file_interface: 'FileInterface'):
+    def __init__(self, file_interface: 'FileInterface', compact: bool = False):
         """
         Initializes a new DataBaseInterface instance.
 
@@ -83,10 +134,19 @@ class DataBaseInterface:
         ----------
         file_interface : FileInterface
             Instance of the `FileInterface` class.
+
+        compact : bool, optional
+            If queries should request compact responses, which send property keys as IDs and values
+            typed instead of as strings. Requires RedisGraph 2.0 or later (default is False).
         """
 
         self.__Client = None
         self.__FileInterface = file_interface
+        self.__Cache = None
+        self.__Reader = None
+        self.__Overlaps = None
+        self.__compact = compact
+        self.__identity = None
 
         self.__host = None
         self.__port = None
@@ -95,7 +155,9 @@ class DataBaseInterface:
         """
         Tries to establish a connection to the Redis instance specified with host and port.
 
-        The established connection is a `StrictRedis` instance and is set as `__Client`.
+        The established connection is a `StrictRedis` instance and is set as `__Client`. The client
+        draws its connections from a bounded pool of `POOL_SIZE` connections, hence it can be shared by
+        concurrent threads.
 
         Parameters
         ----------
@@ -106,7 +168,14 @@ class DataBaseInterface:
             String to identify a port.
         """
 
-        self.__Client = redis.StrictRedis(host=host, port=port)
+        self.__Client = redis.StrictRedis(
+            connection_pool=redis.BlockingConnectionPool(host=host, port=port, max_connections=POOL_SIZE)
+        )
+        # The schema cache is bound to one instance, as IDs of equally named graphs differ between instances.
+        self.__Reader = CompactReader(self.__query_compact) if self.__compact else None
+        self.__Cache = ResultCache(join(CACHE_DIRECTORY, str(host) + '_' + str(port)))
+        self.__Overlaps = None
+        self.__identity = None
         self.__host = host
         self.__port = port
 
@@ -116,6 +185,7 @@ class DataBaseInterface:
         """
 
         self.__Client.execute_command(QUIT)
+        self.__Client.connection_pool.disconnect()
 
         self.__Client = None
 
@@ -143,7 +213,36 @@ class DataBaseInterface:
         except AttributeError:
             return False
 
-    def __query(self, command: str, dbkey: str, report=False) -> list:
+    def client_get_cache(self) -> ResultCache:
+        """
+        Returns the result cache of the connected instance.
+
+        Shared with `AsyncDataBaseInterface`, as both cache results by the same keys and account for the
+        files of the same directory.
+
+        Returns
+        -------
+        ResultCache
+            The result cache. None if not connected.
+        """
+
+        return self.__Cache
+
+    def client_get_reader(self) -> CompactReader:
+        """
+        Returns the reader of compact responses of the connected instance.
+
+        Shared with `AsyncDataBaseInterface`, hence the schemas of graphs are cached once.
+
+        Returns
+        -------
+        CompactReader
+            The reader. None if not connected or verbose responses are requested.
+        """
+
+        return self.__Reader
+
+    def __query(self, command: str, dbkey: str, report=False, check=True) -> list:
         """
         Used to send a OpenCypher query to a Redis instance.
 
@@ -161,20 +260,453 @@ class DataBaseInterface:
         report : bool
             If the response of the query should be reported to the user.
 
+        check : bool
+            If the connection status should be checked before the query is sent. Disabled for
+            repeated queries of a merge, which check the status only once.
+
         Returns
         -------
         list
-            Encoded query response.
+            Encoded query response. Compact responses are returned in the verbose layout.
         """
 
-        if self.client_get_connection():
+        if not check or self.client_get_connection():
+
+            if self.__Reader is not None:
+
+                response = self.__query_compact(dbkey, command)
+                statistics = response[-1]
+                response = self.__Reader.read(dbkey, response)
 
-            response = self.__Client.execute_command(G_QUERY, dbkey, command)
+            else:
+
+                response = self.__Client.execute_command(G_QUERY, dbkey, command)
+                statistics = response[1]
+                response = response[0]
+
+            # Bumped once the write is done, hence results cached meanwhile are not served afterwards.
+            if is_write_query(command):
+                self.__bump_version(dbkey)
 
             if report:
-                self.__show_report(response[1])
+                self.__show_report(statistics)
+
+            return response
+
+    def __query_compact(self, dbkey: str, command: str) -> list:
+
+        return self.__Client.execute_command(G_QUERY, dbkey, command, COMPACT)
+
+    def __query_cached(self, command: str, dbkey: str, version: int, decode):
+        """
+        Used to serve a read query from the result cache.
+
+        The query is sent and its response decoded only if no result is cached for the identity of the
+        instance, the graph key, the normalized query and the graph version.
+
+        Parameters
+        ----------
+        command : str
+            A OpenCypher syntax query, which must not write to the graph.
+
+        dbkey : str
+            The graph key to query.
+
+        version : int
+            The version of the graph, as returned by `__get_version`.
+
+        decode : callable
+            Called with the encoded response, returns the decoded result to cache.
+
+        Returns
+        -------
+        optional
+            The decoded result.
+        """
+
+        key = (self.__get_identity(), dbkey, normalize_query(command), version)
+        result = self.__Cache.get(key)
+
+        if result is None:
+
+            result = decode(self.__query(command, dbkey, check=False))
+            self.__Cache.put(key, result)
+
+        return result
+
+    def __get_identity(self) -> str:
+        """
+        Returns the identity of the contents of the connected instance.
+
+        Versions of graphs restart from 0 once the instance lost its contents, hence cached results of the
+        disk tier are only served for the same identity. The identity comprises the run ID of the instance,
+        which changes on every restart, and a random nonce stored with the graphs, which is lost on a flush.
+
+        Returns
+        -------
+        str
+            The identity of the instance.
+        """
+
+        if self.__identity is None:
+
+            self.__Client.set(CACHE_NONCE, uuid4().hex, nx=True)
+
+            try:
+                run_id = self.__Client.info('server')['run_id']
+
+            # Instances may disable INFO, the nonce alone still identifies flushed instances.
+            except redis.ResponseError:
+                run_id = ''
+
+            self.__identity = run_id + self.__Client.get(CACHE_NONCE).decode(UTF_8)
+
+        return self.__identity
+
+    def __get_version(self, dbkey: str) -> int:
+        """
+        Returns the version of a graph.
+
+        The version is stored with the graph key and bumped by every write to the graph through this
+        interface, hence it is shared by all clients of the instance.
+
+        Parameters
+        ----------
+        dbkey : str
+            The graph key.
+
+        Returns
+        -------
+        int
+            The version of the graph, 0 if it was never written.
+        """
+
+        return int(self.__Client.get(dbkey + GRAPH_VERSION) or 0)
+
+    def __bump_version(self, dbkey: str):
+
+        self.__Client.incr(dbkey + GRAPH_VERSION)
+
+    def __fetch_entities(self, dbkey: str, page_size: int, predicate: str = None, projection: dict = None):
+        """
+        Fetches all (connected) entities of a graph page by page.
+
+        The vertex IDs of the graph are partitioned into windows of `page_size` consecutive IDs.
+        The edges whose source vertex is within a window are queried and decoded separately, hence
+        the size of each response is bounded by the edges of `page_size` vertices. Only the response
+        is bounded, as the pages yielded are kept by consumers collecting all entities, see
+        `__collect_entities`. The memory of DISK_ENGINE is bounded instead, as it spills each page
+        to run files, hence AUTO_ENGINE chooses it for source graphs exceeding the memory budget.
+
+        Parameters
+        ----------
+        dbkey : str
+            The graph key to query.
+
+        page_size : int
+            The number of consecutive source vertex IDs queried per page.
+
+        predicate : str, optional
+            A OpenCypher predicate on the binder `vertex`. Only edges between vertices satisfying the
+            predicate are queried (default is None).
+
+        projection : dict, optional
+            The vertex and edge properties to query, as returned by `__resolve_projection`. All properties
+            are queried if None (default is None).
+
+        Yields
+        ------
+        tuple
+            A tuple of two lists of dictionaries. Represents the vertices and edges of one page.
+        """
+
+        bound = self.__query(get_vertex_id_bound(), dbkey, check=False)[1][0].decode(UTF_8)
+
+        if bound == NULL:
+            return
+
+        for lower in range(0, int(float(bound)) + 1, page_size):
+
+            # Pages are read once per merge, hence they are not cached.
+            vertices, edges = ResultSet(self.__query(
+                get_entities_paged(lower, lower + page_size, predicate,
+                                   *(projection[VERTEX], projection[EDGE]) if projection else ()),
+                dbkey, check=False
+            )).split()
+
+            # Windows may be empty as vertex IDs of deleted vertices are not contiguous or vertices have no edges.
+            if vertices or edges:
+
+                yield vertices, edges
+
+    def __fetch_keys(self, dbkey: str, selection: list, page_size: int, predicate: str = None):
+        """
+        Fetches the `id` and the selected properties of all vertices of a graph page by page.
+
+        The vertex IDs of the graph are partitioned into windows of `page_size` consecutive IDs.
+        Only the columns required to unify the vertices are queried.
+
+        Parameters
+        ----------
+        dbkey : str
+            The graph key to query.
+
+        selection : list
+            The properties to query.
+
+        page_size : int
+            The number of consecutive vertex IDs queried per page.
+
+        predicate : str, optional
+            A OpenCypher predicate on the binder `vertex`. Only vertices satisfying the predicate
+            are queried (default is None).
+
+        Yields
+        ------
+        list
+            A list of dictionaries. Represents the vertices of one page.
+        """
+
+        bound = self.__query(get_vertex_id_bound(), dbkey, check=False)[1][0].decode(UTF_8)
+
+        if bound == NULL:
+            return
+
+        for lower in range(0, int(float(bound)) + 1, page_size):
+
+            vertices = ResultSet(self.__query(get_keys_paged(lower, lower + page_size, *flatten_keys(selection),
+                                                             predicate=predicate),
+                                              dbkey, check=False)).entities(VERTEX)
+
+            if vertices:
+
+                yield vertices
+
+    def __fetch_values(self, dbkey: str, selection: list, page_size: int):
+        """
+        Fetches the distinct values of the selected properties of a graph page by page.
+
+        The vertex IDs of the graph are partitioned into windows of `page_size` consecutive IDs.
+        Values are not decoded, as they are only counted. The values of a composite key are joined.
+
+        Parameters
+        ----------
+        dbkey : str
+            The graph key to query.
+
+        selection : list
+            The properties to query.
+
+        page_size : int
+            The number of consecutive vertex IDs queried per page.
+
+        Yields
+        ------
+        set
+            The encoded values of one page.
+        """
+
+        bound = self.__query(get_vertex_id_bound(), dbkey, check=False)[1][0].decode(UTF_8)
+
+        if bound == NULL:
+            return
+
+        for lower in range(0, int(float(bound)) + 1, page_size):
+
+            values = set()
+
+            for row in self.__query(get_values_paged(lower, lower + page_size, *flatten_keys(selection)),
+                                    dbkey, check=False)[1:]:
+
+                offset = 0
+
+                # The values of a composite key are counted as one value.
+                for key in selection:
+
+                    width = 1 if isinstance(key, str) else len(key)
+                    value = row[offset:offset + width]
+                    offset += width
+
+                    if NULL.encode(UTF_8) not in value:
+                        values.add(COMPOSITE_SEPARATOR.encode(UTF_8).join(value))
+
+            if values:
+                yield values
+
+    @staticmethod
+    def __fetch_concurrently(fetch, dbkeys: list):
+        """
+        Fetches the pages of several graphs concurrently.
+
+        Each graph is fetched and decoded page by page by a worker thread of a pool of at most
+        `FETCH_WORKERS` threads. Decoded pages are passed to the caller through a bounded queue,
+        hence the caller processes pages while further pages are still requested.
+
+        Parameters
+        ----------
+        fetch
+            A generator function called with a graph key. Yields the decoded pages of the graph,
+            e.g. `__fetch_entities`.
+
+        dbkeys : list
+            The graph keys to query.
+
+        Yields
+        ------
+        object
+            A decoded page of any of the graphs. Pages are yielded in order of completion.
+        """
+
+        pages = Queue(maxsize=len(dbkeys))
+        cancelled = Event()
+        finished = 0
+
+        def produce_(dbkey):
+
+            try:
+
+                for page in fetch(dbkey):
+
+                    if cancelled.is_set():
+                        break
+
+                    pages.put(page)
+
+            finally:
+
+                # Signals that the graph is completely fetched.
+                pages.put(None)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(len(dbkeys), FETCH_WORKERS))) as executor:
+
+            futures = [executor.submit(produce_, dbkey) for dbkey in dbkeys]
+
+            try:
+
+                while finished < len(dbkeys):
+
+                    page = pages.get()
+
+                    if page is None:
+                        finished += 1
+
+                    else:
+                        yield page
+
+                # Re-raises exceptions of the worker threads.
+                for future in futures:
+                    future.result()
+
+            finally:
+
+                cancelled.set()
+
+                # Releases workers blocked on the queue if the caller stopped early.
+                while finished < len(dbkeys):
+
+                    if pages.get() is None:
+                        finished += 1
+
+    def __read_manifest(self, target_graph: str) -> dict:
+        """
+        Reads the merge manifest stored with a merge graph.
+
+        The value map of the manifest is not read, as only the values of new source graphs
+        are looked up.
+
+        Parameters
+        ----------
+        target_graph : str
+            The key of the merge graph.
+
+        Returns
+        -------
+        dict
+            The merge-property name, the selected properties, the next merged ID index, the merge policies,
+            the predicate, the projection and the source graphs.
+        """
+
+        meta = {key.decode(UTF_8): value.decode(UTF_8)
+                for key, value in self.__Client.hgetall(target_graph + MANIFEST_META).items()}
+
+        if not meta:
+            raise DataBaseInterfaceManifestException(target_graph)
+
+        return \
+            {
+                MANIFEST_NAME: meta[MANIFEST_NAME],
+                MANIFEST_PROPERTY: meta[MANIFEST_PROPERTY],
+                MANIFEST_SELECTION: [decode_key(key) for key in meta[MANIFEST_SELECTION].split(MERGE_SEPARATOR)],
+                MANIFEST_INDEX: int(meta[MANIFEST_INDEX]),
+                MANIFEST_POLICIES: dict(policy.split(POLICY_SEPARATOR)
+                                        for policy in meta.get(MANIFEST_POLICIES, '').split(MERGE_SEPARATOR) if policy),
+                MANIFEST_PREDICATE: meta.get(MANIFEST_PREDICATE) or None,
+                MANIFEST_PROJECTION: loads(meta.get(MANIFEST_PROJECTION, 'null')),
+                MANIFEST_SOURCES: [source.decode(UTF_8)
+                                   for source in self.__Client.smembers(target_graph + MANIFEST_SOURCES)]
+            }
+
+    def db_has_manifest(self, dbkey: str) -> bool:
+        """
+        Checks if a merge manifest is stored with a graph key.
+
+        Only merge graphs calculated with `db_merge` store a manifest, hence only these can be extended
+        with `db_merge_incremental`.
+
+        Parameters
+        ----------
+        dbkey : str
+            The graph key to check.
+
+        Returns
+        -------
+        bool
+            True if a merge manifest is stored with the key.
+        """
+
+        return bool(self.__Client.exists(dbkey + MANIFEST_META))
+
+    def __write_manifest(self, target_graph: str, manifest: dict, values: dict, page_size: int):
+        """
+        Stores or updates the merge manifest of a merge graph.
+
+        The manifest consists of three keys: A hash mapping each merge-property value to its merged ID,
+        a set of all source graphs and a hash storing the remaining information.
+
+        Parameters
+        ----------
+        target_graph : str
+            The key of the merge graph.
 
-            return response[0]
+        manifest : dict
+            The merge-property name, the selected properties, the next merged ID index, the merge policies,
+            the predicate, the projection and the (additional) source graphs.
+
+        values : dict
+            Maps (additional) merge-property values to merged IDs.
+
+        page_size : int
+            The number of values written per command.
+        """
+
+        pipeline = self.__Client.pipeline(transaction=False)
+
+        for batch in self.__batches(list(values.items()), page_size):
+            pipeline.hset(target_graph + MANIFEST_VALUES, mapping=dict(batch))
+
+        pipeline.sadd(target_graph + MANIFEST_SOURCES, *manifest[MANIFEST_SOURCES])
+        pipeline.hset(target_graph + MANIFEST_META,
+                      mapping={MANIFEST_NAME: manifest[MANIFEST_NAME],
+                               MANIFEST_PROPERTY: manifest[MANIFEST_PROPERTY],
+                               MANIFEST_SELECTION: MERGE_SEPARATOR.join([encode_key(key)
+                                                                         for key in manifest[MANIFEST_SELECTION]]),
+                               MANIFEST_INDEX: manifest[MANIFEST_INDEX],
+                               MANIFEST_POLICIES: MERGE_SEPARATOR.join([property_ + POLICY_SEPARATOR + policy
+                                                                        for property_, policy
+                                                                        in manifest[MANIFEST_POLICIES].items()]),
+                               MANIFEST_PREDICATE: manifest[MANIFEST_PREDICATE] or '',
+                               MANIFEST_PROJECTION: dumps(manifest[MANIFEST_PROJECTION])})
+        pipeline.execute()
 
     def db_save(self):
         """
@@ -194,13 +726,23 @@ class DataBaseInterface:
         Returns
         -------
         list
-            A list of str. Represents all stored graph keys.
+            A list of str. Represents all stored graph keys and virtual merge graphs. Keys of merge manifests,
+            sketches, graph versions and backups are excluded.
         """
 
         try:
 
             # Currently UTF-8 encoded responses are expected.
-            return [graph.decode(UTF_8) for graph in self.__Client.execute_command(KEYS)]
+            auxiliary = (MANIFEST_VALUES, MANIFEST_SOURCES, MANIFEST_META, MINHASH, GRAPH_VERSION)
+            suffixes = tuple(suffix.encode(UTF_8) for suffix in
+                             auxiliary + (BACKUP, BACKUP + VIEW) + tuple(BACKUP + suffix for suffix in auxiliary))
+
+            # Graph names may contain the separators of auxiliary keys, hence only exact suffixes are excluded.
+            graphs = [graph.decode(UTF_8) for graph in self.__Client.execute_command(KEYS)
+                      if not graph.endswith(suffixes)]
+
+            # A virtual merge graph is stored as hash of its merged IDs only.
+            return [graph[:-len(VIEW)] if graph.endswith(VIEW) else graph for graph in graphs]
 
         except redis.ResponseError:
 
@@ -224,6 +766,10 @@ class DataBaseInterface:
 
             for key in self.db_get_keys():
 
+                # Virtual merge graphs have the properties of their source graphs.
+                if self.__is_view(key):
+                    continue
+
                 try:
                     '''
                     For each graph key query respective properties.
@@ -254,166 +800,1637 @@ class DataBaseInterface:
         """
         Sends a delete-key request to the connected Redis instance.
 
+        The merge manifest stored with the graph, if any, is deleted as well. Virtual merge graphs are
+        deleted without affecting their source graphs.
+
         Parameters
         ----------
         dbkey : str
             The graph-key to delete.
         """
 
-        self.__Client.execute_command(G_DELETE + ' ' + dbkey)
+        # Virtual merge graphs and graphs never written are stored without a graph key.
+        if self.__Client.exists(dbkey):
+            self.__Client.execute_command(G_DELETE + ' ' + dbkey)
+
+        if self.__Reader is not None:
+            self.__Reader.invalidate(dbkey)
+
+        # The version outlives the graph, hence results of a former graph stored with the key are not served.
+        self.__bump_version(dbkey)
+
+        self.__Client.delete(dbkey + VIEW, dbkey + MINHASH, dbkey + MANIFEST_VALUES, dbkey + MANIFEST_SOURCES,
+                             dbkey + MANIFEST_META)
+
+        self.__Overlaps = None
+
+    def __is_view(self, dbkey: str) -> bool:
+        """
+        Checks if a graph key refers to a virtual merge graph.
+
+        Parameters
+        ----------
+        dbkey : str
+            The graph key to check.
+
+        Returns
+        -------
+        bool
+            True if the merged IDs of a virtual merge graph are stored with the key.
+        """
+
+        return bool(self.__Client.exists(dbkey + VIEW))
+
+    def __check_sources(self, source_graphs: list):
+        """
+        Rejects virtual merge graphs as source graphs.
+
+        Virtual merge graphs are stored as hash of their merged IDs, which cannot be queried page by page.
+
+        Parameters
+        ----------
+        source_graphs : list
+            The graph keys to check.
+
+        Raises
+        ------
+        DataBaseInterfaceViewException
+            If a graph key refers to a virtual merge graph.
+        """
+
+        for source_graph in source_graphs:
+
+            if self.__is_view(source_graph):
+                raise DataBaseInterfaceViewException(source_graph)
 
-    def db_merge(self, selection: list, source_graphs: list, target_graph: str):
+    def db_merge(self, selection: list, source_graphs: list, target_graph: str, page_size: int = PAGE_SIZE,
+                 kernel: str = PYTHON_KERNEL, engine: str = AUTO_ENGINE, dry_run: bool = False,
+                 memory_budget: int = MEMORY_BUDGET, policies: dict = None, normalizer: Normalizer = None,
+                 virtual: bool = False, predicate: str = None, projection: dict = None):
         """
         Calculates the merge graph of a set of source graphs.
 
         Calculates the merge graph in dependency of a set of selected property names and source graphs.
         The merge graph is built like a union graph, but with unified vertices and edges dependent on their
-        values with respect to the selected property names. The following steps are performed:
-        1)  Query all possible values of the selected properties.
-        2)  Initialize a dictionary for every such value.
-            The dictionary is accessible by this value.
-        3)  Query all entities (vertices and edges) of the source graphs respective.
-        4)  Store all queried vertices in the dictionary accessible by its respective value of the selected
-            properties. Add the vertices ID as key to access the dictionary.
-        5)  Store all queried edges in the dictionary accessible by its respective source ID.
-        6)  For each dictionary create a new vertex/edge that inherits all values of all entities stored
+        values with respect to the selected property names. Vertices sharing any value of the selected
+        properties are unified transitively. The following steps are performed:
+        1)  Query all entities (vertices and edges) of the source graphs respective. The entities are
+            fetched page by page, each page covering the edges of a window of `page_size` source vertex
+            IDs. Only the responses are bounded by the pages, the entities are held in memory. The source graphs
+            are fetched and decoded concurrently while step 2) is applied to the completed pages, hence
+            each source graph is read exactly once.
+        2)  Unify the subsets of all values of the selected properties of each queried vertex in a disjoint
+            set. Values are added to the disjoint set on their first occurrence. Vertices without any such
+            value are added as singleton subset.
+        3)  Initialize a dictionary for every subset. Store all queried vertices in the dictionary of the
+            subset containing their values.
+        4)  Store all queried edges in the dictionary of the subset of its respective source.
+        5)  For each dictionary create a new vertex/edge that inherits all values of all entities stored
             in the dictionary.
-        7)  Rewrite the created vertices and edges as graph into the database.
+        6)  Rewrite the created vertices and edges as graph into the database. Store a merge manifest
+            with the graph to allow folding further source graphs into it with `db_merge_incremental`.
+
+        Parameters
+        ----------
+        selection : list
+            Specifies the properties for which the merge graph is calculated. A tuple of properties is a
+            composite key, whose values are unified as tuples of the values of its properties.
+            At index 0 a new merge-property name is stored.
+
+        source_graphs : list
+            Specifies the source graphs for which the merge graph is calculated. Virtual merge graphs are
+            rejected, see `__check_sources`.
+
+        target_graph : str
+            The key to store the merge graph with.
+
+        page_size : int
+            The number of consecutive vertex IDs queried per page (default is PAGE_SIZE).
+
+        kernel : str
+            The kernel to perform steps 3) to 5) with. Either PYTHON_KERNEL, which walks the buckets
+            entity by entity, NUMPY_KERNEL, which runs on integer-coded columns, or PARALLEL_KERNEL, which
+            merges hash-partitioned buckets in a pool of worker processes (default is PYTHON_KERNEL).
+
+        engine : str
+            The engine to calculate the merge graph with. Either CLIENT_ENGINE, which performs the steps above,
+            SERVER_ENGINE, which merges the entities on the server with batched queries, DISK_ENGINE, which
+            merges the entities partition by partition from run files on disk, or AUTO_ENGINE, which chooses
+            between the client-side and server-side engine based on the size of the source graphs and the
+            cardinality of the selected properties. AUTO_ENGINE chooses DISK_ENGINE instead of the client-side
+            engine if the entities and merged entities would exceed `memory_budget` (default is AUTO_ENGINE).
+
+        dry_run : bool
+            If the merge graph should only be estimated with `__estimate_merge` instead of being calculated
+            (default is False).
+
+        memory_budget : int
+            The number of bytes the entities of one partition of DISK_ENGINE may occupy. Also bounds the
+            memory of the client-side engine if chosen by AUTO_ENGINE (default is MEMORY_BUDGET).
+
+        policies : dict, optional
+            Maps vertex or edge properties to their merge policy, one of `MERGE_POLICIES`. Properties without
+            a policy are concatenated. SERVER_ENGINE supports CONCAT_POLICY only, hence AUTO_ENGINE chooses
+            DISK_ENGINE instead if other policies are given (default is None).
+
+        normalizer : Normalizer, optional
+            Normalizes the values of the selected properties before they are unified, e.g. to match values
+            differing by case or version suffix or synonyms. The merged values and the manifest store the
+            normalized values (default is None).
+
+        virtual : bool
+            If only the merged IDs should be stored with `__merge_virtually` instead of the merge graph. The
+            virtual merge graph is queried with `db_query` and can be materialized with `db_materialize`
+            (default is False).
+
+        predicate : str, optional
+            A OpenCypher predicate on the binder `vertex`, e.g. `vertex.A__score > 5`. Only vertices satisfying
+            the predicate and edges between them are queried and merged (default is None).
+
+        projection : dict, optional
+            Maps VERTEX and EDGE to lists of properties. Only these properties, the `id` and the selected
+            properties of vertices and the `source` and `target` of edges are queried and merged. Entities
+            without a list are queried completely (default is None).
+
+        Returns
+        -------
+        dict optional
+            The estimate of the merge graph if `dry_run` is `True`.
+        """
+
+        self.__check_sources(source_graphs)
+
+        merge_property = selection.pop(0)
+        merge_property_name = target_graph + DATA_SEPARATOR + merge_property
+
+        projection = self.__resolve_projection(selection, projection)
+
+        if dry_run:
+            return self.__estimate_merge(selection, source_graphs, page_size, engine, memory_budget, predicate,
+                                         projection)
+
+        policies = policies or {}
+
+        if virtual:
+
+            for policy in policies.values():
+
+                if policy not in MERGE_POLICIES:
+                    raise DataBaseInterfaceMergePolicyException(policy, engine)
+
+            self.__merge_virtually(selection, source_graphs, target_graph, merge_property, page_size, policies,
+                                   normalizer, predicate, projection)
+
+            return
+
+        if engine == AUTO_ENGINE:
+
+            vertex_size, _, edge_size = self.__sample_sizes(selection, source_graphs, projection)
+            engine = self.__plan_engine(*self.__count_entities(selection, source_graphs, predicate), vertex_size,
+                                        edge_size, memory_budget)
+
+            if engine == SERVER_ENGINE and any(policy != CONCAT_POLICY for policy in policies.values()):
+                engine = DISK_ENGINE
+
+        for policy in policies.values():
+
+            if policy not in MERGE_POLICIES or (engine == SERVER_ENGINE and policy != CONCAT_POLICY):
+                raise DataBaseInterfaceMergePolicyException(policy, engine)
+
+        if engine == SERVER_ENGINE:
+
+            self.__merge_on_server(selection, source_graphs, target_graph, merge_property, page_size, policies,
+                                   normalizer, predicate, projection)
+
+            return
+
+        elif engine == DISK_ENGINE:
+
+            self.__merge_on_disk(selection, source_graphs, target_graph, merge_property, page_size, memory_budget,
+                                 policies, normalizer, predicate, projection)
+
+            return
+
+        elif engine != CLIENT_ENGINE:
+
+            raise DataBaseInterfaceMergeEngineException(engine)
+
+        # Step 1) to 5)
+        graph = self.__merge_pages(
+            self.__fetch_concurrently(lambda dbkey: self.__fetch_entities(dbkey, page_size, predicate, projection),
+                                      source_graphs),
+            selection, merge_property_name, kernel, policies, normalizer
+        )
+
+        # Step 6)
+        self.__write_merge(graph, selection, source_graphs, target_graph, merge_property, page_size, policies,
+                           predicate, projection)
+
+    def db_merge_batch(self, specs: list, page_size: int = PAGE_SIZE, kernel: str = PYTHON_KERNEL,
+                       dry_run: bool = False, memory_budget: int = MEMORY_BUDGET, policies: dict = None,
+                       normalizer: Normalizer = None, predicate: str = None, projection: dict = None):
+        """
+        Calculates several merge graphs from one fetch of their source graphs.
+
+        Calculates the same merge graphs as the client-side engine of `db_merge` called for each spec,
+        but queries and decodes each source graph only once. The following steps are performed:
+        1)  Query all entities of the union of the source graphs of all specs page by page and keep
+            the decoded pages in memory.
+        2)  For each spec, calculate the merge graph from the pages of its source graphs with steps 2)
+            to 5) of `db_merge`.
+        3)  Write each merge graph and its merge manifest while the merge graph of the next spec is
+            calculated.
+        The pages of all source graphs are held until the last merge graph is calculated. If their estimated
+        peak memory exceeds `memory_budget`, each spec is merged with `db_merge` one after another instead,
+        which plans the engine of each merge graph.
+
+        Parameters
+        ----------
+        specs : list
+            Tuples of a selection, a list of source graphs and a target graph key, as passed to `db_merge`.
+            At index 0 of each selection a new merge-property name is stored.
+
+        page_size : int
+            The number of consecutive vertex IDs queried per page (default is PAGE_SIZE).
+
+        kernel : str
+            The kernel to calculate the merge graphs with, see `db_merge` (default is PYTHON_KERNEL).
+
+        dry_run : bool
+            If the merge graphs are only estimated, see `db_merge` (default is False).
+
+        memory_budget : int
+            The number of bytes the pages of the source graphs and the merge graphs may occupy. Passed to
+            `db_merge` if exceeded (default is MEMORY_BUDGET).
+
+        policies : dict, optional
+            The merge policies of all merge graphs, see `db_merge` (default is None).
+
+        normalizer : Normalizer, optional
+            The normalizer of all merge graphs, see `db_merge` (default is None).
+
+        predicate : str, optional
+            The predicate of all merge graphs, see `db_merge` (default is None).
+
+        projection : dict, optional
+            The projection of all merge graphs, see `db_merge` (default is None). The selected properties
+            of all specs are queried.
+
+        Returns
+        -------
+        list optional
+            The estimates of the merge graphs in order of the specs if `dry_run` is `True`. Merge graphs
+            calculated from shared pages are estimated with CLIENT_ENGINE and the peak memory of the batch.
+        """
+
+        policies = policies or {}
+
+        for policy in policies.values():
+
+            if policy not in MERGE_POLICIES:
+                raise DataBaseInterfaceMergePolicyException(policy, CLIENT_ENGINE)
+
+        batch = specs
+        specs = [(list(selection[1:]), selection[0], source_graphs, target_graph)
+                 for selection, source_graphs, target_graph in specs]
+
+        self.__check_sources(list(chain.from_iterable(spec[2] for spec in specs)))
+
+        selection = list(chain.from_iterable(spec[0] for spec in specs))
+        source_graphs = list(dict.fromkeys(chain.from_iterable(spec[2] for spec in specs)))
+
+        vertex_count, edge_count, _ = self.__count_entities(selection, source_graphs, predicate)
+        vertex_size, _, edge_size = self.__sample_sizes(selection, source_graphs,
+                                                        self.__resolve_projection(selection, projection))
+
+        # The pages of all source graphs, the merge graph being calculated and the merge graph being written.
+        # Each merge graph holds at most the copied entities of the pages.
+        memory = 3 * (vertex_count * vertex_size + edge_count * edge_size)
+        shared = memory <= memory_budget
+
+        if dry_run:
+
+            estimates = [self.db_merge(list(selection_), source_graphs_, target_graph, page_size, kernel,
+                                       CLIENT_ENGINE if shared else AUTO_ENGINE, True, memory_budget,
+                                       predicate=predicate, projection=projection)
+                         for selection_, source_graphs_, target_graph in batch]
+
+            if shared:
+
+                for estimate in estimates:
+                    estimate[ESTIMATE_MEMORY] = memory
+
+            return estimates
+
+        if not shared:
+
+            for selection_, source_graphs_, target_graph in batch:
+
+                self.db_merge(list(selection_), source_graphs_, target_graph, page_size, kernel,
+                              memory_budget=memory_budget, policies=policies, normalizer=normalizer,
+                              predicate=predicate, projection=projection)
+
+            return
+
+        projection = self.__resolve_projection(selection, projection)
+
+        # Step 1)
+        pages = list(self.__fetch_concurrently(
+            lambda dbkey: ((dbkey, page) for page in self.__fetch_entities(dbkey, page_size, predicate, projection)),
+            source_graphs
+        ))
+
+        # Uploads run in a separate thread, as they wait for the bulk upload process.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+
+            futures = []
+
+            for selection, merge_property, source_graphs, target_graph in specs:
+
+                # Step 2)
+                # Edges are copied, as the kernels rewrite their source and target.
+                graph = self.__merge_pages(
+                    ((vertices, [dict(edge) for edge in edges])
+                     for dbkey, (vertices, edges) in pages if dbkey in source_graphs),
+                    selection, target_graph + DATA_SEPARATOR + merge_property, kernel, policies, normalizer
+                )
+
+                # Step 3)
+                futures.append(executor.submit(self.__write_merge, graph, selection, source_graphs, target_graph,
+                                               merge_property, page_size, policies, predicate, projection))
+
+            for future in futures:
+                future.result()
+
+    def db_merge_files(self, selection: list, files: list, target_graph: str, kernel: str = PYTHON_KERNEL,
+                       policies: dict = None, normalizer: Normalizer = None, path: str = None):
+        """
+        Calculates the merge graph of a set of graph files without uploading them.
+
+        The files are parsed with `FileInterface.read_file` one by one and merged like the source graphs of
+        the client-side engine of `db_merge`, hence the merge graph equals the merge graph of the uploaded
+        files. The merge graph is uploaded with the bulk upload and a merge manifest naming the files as
+        source graphs, or exported to a file, without storing any source graph.
+
+        Parameters
+        ----------
+        selection : list
+            Specifies the properties for which the merge graph is calculated, prefixed with the file names
+            like the properties of uploaded files. At index 0 a new merge-property name is stored.
+
+        files : list
+            Tuples of the file type, name, path and the list of properties to parse, see `FileInterface.read_file`.
+
+        target_graph : str
+            The key to store the merge graph with.
+
+        kernel : str
+            The kernel to calculate the merge graph with, see `db_merge` (default is PYTHON_KERNEL).
+
+        policies : dict, optional
+            Maps properties to their merge policy, see `db_merge` (default is None).
+
+        normalizer : Normalizer, optional
+            Normalizes the values of the selected properties before they are unified (default is None).
+
+        path : str, optional
+            The path of a file to export the merge graph to with `FileInterface.write_file` instead of
+            uploading it (default is None).
+        """
+
+        merge_property = selection.pop(0)
+        policies = policies or {}
+
+        for policy in policies.values():
+
+            if policy not in MERGE_POLICIES:
+                raise DataBaseInterfaceMergePolicyException(policy, CLIENT_ENGINE)
+
+        graph = self.__merge_pages(self.__parse_files(files), selection, target_graph + DATA_SEPARATOR + merge_property,
+                                   kernel, policies, normalizer)
+
+        if path:
+
+            self.__FileInterface.write_file(path, (graph[VERTEX], graph[EDGE]))
+
+        else:
+
+            self.__write_merge(graph, selection, [file_name for _, file_name, _, _ in files], target_graph,
+                               merge_property, PAGE_SIZE, policies, None, None)
+
+    def __parse_files(self, files: list):
+        """
+        Parses graph files one by one.
+
+        Empty values are replaced by NULL, as they are stored as null by the bulk upload. The parsers prefix
+        vertex IDs with the file name only, hence the IDs of each file are prefixed with its position as
+        well, so that files of the same name do not share vertices.
+
+        Parameters
+        ----------
+        files : list
+            Tuples of the file type, name, path and the list of properties to parse.
+
+        Yields
+        ------
+        tuple
+            A tuple of two lists of dictionaries. Represents the vertices and edges of one file.
+        """
+
+        for index, (file_type, file_name, file_path, instruction) in enumerate(files):
+
+            graph = self.__FileInterface.read_file(instruction, (file_type, file_name, file_path), 'parse_graph')
+            prefix = str(index) + DATA_SEPARATOR
+
+            vertices = [{key: value if value != '' else NULL for key, value in vertex.items()}
+                        for vertex in graph[VERTEX]]
+            edges = [{key: value if value != '' else NULL for key, value in edge.items()} for edge in graph[EDGE]]
+
+            for vertex in vertices:
+                vertex[ID] = prefix + vertex[ID]
+
+            for edge in edges:
+                edge[SOURCE] = prefix + edge[SOURCE]
+                edge[TARGET] = prefix + edge[TARGET]
+
+            yield vertices, edges
+
+    def __merge_pages(self, pages, selection: list, merge_property_name: str, kernel: str, policies: dict,
+                      normalizer: Normalizer) -> dict:
+        """
+        Calculates a merge graph from pages of entities with steps 2) to 5) of `db_merge`.
+
+        Parameters
+        ----------
+        pages : iterable
+            Tuples of two lists of dictionaries. Represent the vertices and edges of each page.
+
+        selection : list
+            The selected properties.
+
+        merge_property_name : str
+            The name of the new merge-property.
+
+        kernel : str
+            The kernel to perform steps 3) to 5) with.
+
+        policies : dict
+            Maps properties to their merge policy.
+
+        normalizer : Normalizer
+            Normalizes the values of the selected properties before they are unified. May be None.
+
+        Returns
+        -------
+        dict
+            The merge graph. Stores two lists of dictionaries.
+        """
+
+        # Step 2)
+        disjoint_set, assignments, edges_, merged_values, vertex_properties, edge_properties = \
+            self.__collect_entities(pages, selection, normalizer)
+
+        # Step 3) to 5)
+        if kernel == PYTHON_KERNEL:
+
+            graph = self.__merge_buckets(assignments, edges_, disjoint_set, merged_values,
+                                         vertex_properties, edge_properties, merge_property_name,
+                                         flatten_keys(selection), policies)
+
+        elif kernel == NUMPY_KERNEL:
+
+            graph = merge_columnar(assignments, edges_, disjoint_set, merged_values,
+                                   vertex_properties, edge_properties, merge_property_name,
+                                   flatten_keys(selection), policies)
+
+        elif kernel == PARALLEL_KERNEL:
+
+            graph = merge_parallel(assignments, edges_, disjoint_set, merged_values,
+                                   vertex_properties, edge_properties, merge_property_name,
+                                   flatten_keys(selection), policies)
+
+        else:
+
+            raise DataBaseInterfaceMergeKernelException(kernel)
+
+        return graph
+
+    def __write_merge(self, graph: dict, selection: list, source_graphs: list, target_graph: str,
+                      merge_property: str, page_size: int, policies: dict, predicate: str, projection: dict):
+        """
+        Writes a merge graph and its merge manifest with step 6) of `db_merge`.
+
+        Parameters
+        ----------
+        graph : dict
+            The merge graph.
+
+        selection : list
+            The selected properties.
+
+        source_graphs : list
+            The source graphs.
+
+        target_graph : str
+            The key to store the merge graph with.
+
+        merge_property : str
+            The name of the new merge-property.
+
+        page_size : int
+            The number of values written per command.
+
+        policies : dict
+            Maps properties to their merge policy.
+
+        predicate : str
+            The predicate the source graphs were queried with. May be None.
+
+        projection : dict
+            The projection the source graphs were queried with. May be None.
+        """
+
+        merge_property_name = target_graph + DATA_SEPARATOR + merge_property
+
+        self.db_write(graph, target_graph)
+
+        self.__write_manifest(target_graph,
+                              {MANIFEST_NAME: merge_property, MANIFEST_PROPERTY: merge_property_name,
+                               MANIFEST_SELECTION: selection, MANIFEST_INDEX: len(graph[VERTEX]),
+                               MANIFEST_POLICIES: policies, MANIFEST_PREDICATE: predicate,
+                               MANIFEST_PROJECTION: projection, MANIFEST_SOURCES: source_graphs},
+                              {value: merged_vertex[ID] for merged_vertex in graph[VERTEX]
+                               for value in merged_vertex[merge_property_name].split(MERGE_SEPARATOR)
+                               if value != NULL},
+                              page_size)
+
+    def __count_entities(self, selection: list, source_graphs: list, predicate: str = None) -> tuple:
+        """
+        Counts the entities of the source graphs with server-side aggregates.
+
+        Parameters
+        ----------
+        selection : list
+            The selected properties.
+
+        source_graphs : list
+            The source graphs.
+
+        predicate : str, optional
+            A OpenCypher predicate on the binder `vertex`, see `db_merge`. Only vertices satisfying the
+            predicate and edges between them are counted (default is None).
+
+        Returns
+        -------
+        tuple
+            The number of vertices, edges and distinct values of the selected properties summed over
+            all source graphs.
+        """
+
+        vertex_count = 0
+        edge_count = 0
+        value_count = 0
+
+        for source_graph in source_graphs:
+
+            counts = [int(float(count.decode(UTF_8)))
+                      for count in self.__query(get_counts(*selection, predicate=predicate), source_graph,
+                                                check=False)[1]]
+
+            vertex_count += counts[0]
+            value_count += sum(counts[1:])
+            edge_count += int(float(self.__query(get_edge_count(predicate), source_graph,
+                                                 check=False)[1][0].decode(UTF_8)))
+
+        return vertex_count, edge_count, value_count
+
+    @staticmethod
+    def __plan_engine(vertex_count: int, edge_count: int, value_count: int, vertex_size: int, edge_size: int,
+                      memory_budget: int) -> str:
+        """
+        Chooses the engine to calculate a merge graph with.
+
+        The client-side engine holds all entities of the source graphs in memory, hence the server-side
+        engine is chosen if the source graphs comprise more than `ENGINE_THRESHOLD` entities. As the
+        server-side engine merges rows one by one into the merged entities, it is only chosen if the
+        selected properties have at least `COLLISION_RATIO` distinct values per vertex. Otherwise a few
+        merged vertices would be rewritten for most rows. Source graphs whose entities and merged entities
+        exceed `memory_budget` are merged with the out-of-core engine instead of the client-side engine.
+
+        Parameters
+        ----------
+        vertex_count : int
+            The number of vertices of the source graphs.
+
+        edge_count : int
+            The number of edges of the source graphs.
+
+        value_count : int
+            The number of distinct values of the selected properties.
+
+        vertex_size : int
+            The size in bytes of a decoded vertex, see `__sample_sizes`.
+
+        edge_size : int
+            The size in bytes of a decoded edge, see `__sample_sizes`.
+
+        memory_budget : int
+            The number of bytes the client-side engine may occupy.
+
+        Returns
+        -------
+        str
+            Either CLIENT_ENGINE, SERVER_ENGINE or DISK_ENGINE.
+        """
+
+        if vertex_count + edge_count > ENGINE_THRESHOLD and value_count >= COLLISION_RATIO * vertex_count:
+
+            return SERVER_ENGINE
+
+        if DataBaseInterface.__client_memory(vertex_count, edge_count, vertex_size, edge_size) > memory_budget:
+
+            return DISK_ENGINE
+
+        return CLIENT_ENGINE
+
+    @staticmethod
+    def __client_memory(vertex_count: int, edge_count: int, vertex_size: int, edge_size: int) -> int:
+
+        # The entities of the source graphs and at most as many merged entities.
+        return 2 * (vertex_count * vertex_size + edge_count * edge_size)
+
+    def __estimate_merge(self, selection: list, source_graphs: list, page_size: int, engine: str,
+                         memory_budget: int, predicate: str = None, projection: dict = None) -> dict:
+        """
+        Estimates the size and the cost of a merge graph without fetching any entity.
+
+        The following estimates are calculated from server-side aggregates, which apply the predicate:
+        1)  The number of distinct values. The distinct values of each merge key are counted per source
+            graph. The values of several keys and source graphs are united with the MinHash sketches stored
+            by `db_sketch`. Values without a sketch, and all values if a predicate is given, are counted as
+            disjoint, which overestimates the number of distinct values.
+        2)  The number of merged vertices. Each distinct value yields at most one merged vertex, each vertex
+            without any value yields exactly one.
+        3)  The number of merged edges. Equal edges of several source graphs are unified, hence the number
+            of edges of the source graphs is an upper bound.
+        4)  The distribution of the bucket sizes, binned by powers of two, and the `COLLISION_GROUPS` values
+            shared by the most vertices. Both are aggregated per source graph and merge key and summed up,
+            hence transitive unions of values are not accounted for. The values of a composite key are
+            grouped as joined tuples.
+        5)  The peak memory of the client in bytes, extrapolated from the size of the projected properties of
+            one sampled vertex and edge of each source graph.
+
+        Parameters
+        ----------
+        selection : list
+            The selected properties.
+
+        source_graphs : list
+            The source graphs.
+
+        page_size : int
+            The number of consecutive vertex IDs queried per page.
+
+        engine : str
+            The engine to estimate the peak memory for. AUTO_ENGINE estimates it for the planned engine.
+
+        memory_budget : int
+            The memory budget of the client-side engine chosen by AUTO_ENGINE and of DISK_ENGINE in bytes.
+
+        predicate : str, optional
+            A OpenCypher predicate on the binder `vertex`, see `db_merge` (default is None).
+
+        projection : dict, optional
+            The vertex and edge properties to query, as returned by `__resolve_projection` (default is None).
+
+        Returns
+        -------
+        dict
+            The estimated merged vertices, merged edges, distinct values, bucket sizes, largest collision
+            groups, peak memory and the engine.
+        """
+
+        vertex_count, edge_count, value_count = self.__count_entities(selection, source_graphs, predicate)
+        vertex_size, key_size, edge_size = self.__sample_sizes(selection, source_graphs, projection)
+
+        if engine == AUTO_ENGINE:
+            engine = self.__plan_engine(vertex_count, edge_count, value_count, vertex_size, edge_size, memory_budget)
+
+        keyed_count = 0
+        values = []
+        buckets = {}
+        collisions = {}
+
+        for source_graph in source_graphs:
+
+            response = self.__query(get_keyed_count(*selection, predicate=predicate), source_graph, check=False)
+            keyed_count += int(float(response[1][0].decode(UTF_8)))
+
+            # Sketches are calculated from all vertices, hence do not apply to filtered vertices.
+            sketches = {} if predicate else self.__Client.hgetall(source_graph + MINHASH)
+
+            for key in selection:
+
+                # Step 1) and 4)
+                distinct_count = 0
+
+                for size, count in self.__query(get_size_distribution(key, predicate), source_graph, check=False)[1:]:
+
+                    count = int(float(count.decode(UTF_8)))
+                    bucket = 2 ** (int(float(size.decode(UTF_8))).bit_length() - 1)
+                    buckets[bucket] = buckets.get(bucket, 0) + count
+                    distinct_count += count
+
+                for value, size in self.__query(get_value_sizes(key, COLLISION_GROUPS, predicate),
+                                                source_graph, check=False)[1:]:
+
+                    value = value.decode(UTF_8)
+                    collisions[value] = collisions.get(value, 0) + int(float(size.decode(UTF_8)))
+
+                signature = sketches.get(key.encode(UTF_8)) if isinstance(key, str) else None
+                values.append((distinct_count, MinHash.from_bytes(signature) if signature else None))
+
+        distinct_count = self.__unite_values(values)
+
+        # Step 2)
+        merged_vertex_count = vertex_count - keyed_count + min(distinct_count, keyed_count)
+
+        if vertex_count > keyed_count:
+            buckets[1] = buckets.get(1, 0) + vertex_count - keyed_count
+
+        # Step 5)
+        # The entities of the source graphs and the merged entities.
+        memory = (vertex_count + merged_vertex_count) * vertex_size + 2 * edge_count * edge_size
+
+        if engine == SERVER_ENGINE:
+
+            # The IDs and merge keys of all vertices and the buffered pages of each source graph.
+            memory = vertex_count * key_size + \
+                (len(source_graphs) + 1) * page_size * (2 * vertex_size + edge_size)
+
+        elif engine == DISK_ENGINE:
+
+            # The IDs and merge keys of all vertices and the entities of one partition.
+            memory = vertex_count * key_size + min(memory, memory_budget)
+
+        return \
+            {
+                ESTIMATE_VERTICES: merged_vertex_count,
+                ESTIMATE_EDGES: edge_count,
+                ESTIMATE_VALUES: distinct_count,
+                ESTIMATE_BUCKETS: dict(sorted(buckets.items())),
+                ESTIMATE_COLLISIONS: sorted(collisions.items(), key=lambda item: item[1],
+                                            reverse=True)[:COLLISION_GROUPS],
+                ESTIMATE_MEMORY: memory,
+                ESTIMATE_ENGINE: engine
+            }
+
+    @staticmethod
+    def __unite_values(values: list) -> int:
+        """
+        Estimates the number of distinct values of the union of several value sets.
+
+        The value sets with a sketch are united one by one. The size of the union of two sets follows
+        from their sizes and their Jaccard similarity J as (|A| + |B|) / (1 + J), and the sketch of the union
+        is the union of their sketches. Value sets without a sketch are counted as disjoint.
+
+        Parameters
+        ----------
+        values : list
+            Tuples of the number of distinct values of a set and its `MinHash` sketch or None.
+
+        Returns
+        -------
+        int
+            The estimated number of distinct values.
+        """
+
+        union_count = sum(count for count, sketch in values if sketch is None)
+        sketched = [(count, sketch) for count, sketch in values if sketch is not None]
+
+        if sketched:
+
+            count, union = sketched[0]
+
+            for other_count, sketch in sketched[1:]:
+
+                count = (count + other_count) / (1 + union.jaccard(sketch))
+                union = union.union(sketch)
+
+            union_count += count
+
+        return int(round(union_count))
+
+    def __assign_merged_ids(self, selection: list, source_graphs: list, merge_property_name: str,
+                            page_size: int, normalizer: Normalizer, predicate: str) -> tuple:
+        """
+        Assigns the merged ID of each vertex of the source graphs without fetching any other property.
+
+        The `id` and the selected properties of all vertices are queried page by page and their values
+        are unified in a disjoint set. Each subset is assigned a merged ID in order of its first occurrence.
+
+        Parameters
+        ----------
+        selection : list
+            The selected properties.
+
+        source_graphs : list
+            The source graphs.
+
+        merge_property_name : str
+            The name of the new merge-property. Used as prefix for the merged IDs.
+
+        page_size : int
+            The number of consecutive vertex IDs queried per page.
+
+        normalizer : Normalizer
+            Normalizes the values before they are unified. May be None.
+
+        predicate : str
+            A OpenCypher predicate on the binder `vertex`. Only vertices satisfying the predicate are
+            assigned a merged ID. May be None.
+
+        Returns
+        -------
+        tuple
+            A dictionary mapping each vertex ID to its merged ID, a dictionary mapping merged IDs to their
+            merged value and the number of merged IDs.
+        """
+
+        disjoint_set, assignments, _, merged_values, _, _ = \
+            self.__collect_entities(
+                ((vertices, []) for vertices in
+                 self.__fetch_concurrently(lambda dbkey: self.__fetch_keys(dbkey, selection, page_size, predicate),
+                                           source_graphs)),
+                selection,
+                normalizer
+            )
+
+        merged_ids = {}
+        vertex_ids = {}
+        for vertex_id, (vertex, element) in assignments.items():
+
+            root = disjoint_set.find(element)
+
+            if root not in merged_ids:
+                merged_ids[root] = merge_property_name + str(len(merged_ids))
+
+            vertex_ids[vertex_id] = merged_ids[root]
+
+        return \
+            vertex_ids, \
+            {merged_ids[root]: join_values(values) for root, values in merged_values.items()}, \
+            len(merged_ids)
+
+    def __merge_virtually(self, selection: list, source_graphs: list, target_graph: str, merge_property: str,
+                          page_size: int, policies: dict, normalizer: Normalizer, predicate: str, projection: dict):
+        """
+        Virtual merge engine.
+
+        Stores the merged ID of each vertex of the source graphs instead of the merge graph. The entities
+        are merged when the virtual merge graph is queried, see `db_query`. The following steps are performed:
+        1)  Query the `id` and the selected properties of all vertices of the source graphs page by page
+            and unify the values in a disjoint set.
+        2)  Assign a merged ID to each subset.
+        3)  Store a hash mapping each vertex ID to its merged ID and a merge manifest with the key.
+
+        Parameters
+        ----------
+        selection : list
+            The selected properties.
+
+        source_graphs : list
+            The source graphs.
+
+        target_graph : str
+            The key to store the virtual merge graph with.
+
+        merge_property : str
+            The name of the new merge-property.
+
+        page_size : int
+            The number of consecutive vertex IDs queried per page and the number of IDs written per command.
+
+        policies : dict
+            The merge policies. Stored with the manifest only, as they are applied once the graph is materialized.
+
+        normalizer : Normalizer
+            Normalizes the values of the selected properties before they are unified. May be None.
+
+        predicate : str
+            A OpenCypher predicate on the binder `vertex`, see `db_merge`. May be None.
+
+        projection : dict
+            The vertex and edge properties to query, as returned by `__resolve_projection`. May be None.
+        """
+
+        merge_property_name = target_graph + DATA_SEPARATOR + merge_property
+
+        # Step 1) and 2)
+        vertex_ids, merged_values, index = self.__assign_merged_ids(selection, source_graphs, merge_property_name,
+                                                                    page_size, normalizer, predicate)
+
+        # Step 3)
+        pipeline = self.__Client.pipeline(transaction=False)
+
+        for batch in self.__batches(list(vertex_ids.items()), page_size):
+            pipeline.hset(target_graph + VIEW, mapping=dict(batch))
+
+        pipeline.execute()
+
+        self.__write_manifest(target_graph,
+                              {MANIFEST_NAME: merge_property, MANIFEST_PROPERTY: merge_property_name,
+                               MANIFEST_SELECTION: selection, MANIFEST_INDEX: index,
+                               MANIFEST_POLICIES: policies, MANIFEST_PREDICATE: predicate,
+                               MANIFEST_PROJECTION: projection, MANIFEST_SOURCES: source_graphs},
+                              {value: merged_id for merged_id, values in merged_values.items()
+                               for value in values.split(MERGE_SEPARATOR)},
+                              page_size)
+
+    def __merge_on_server(self, selection: list, source_graphs: list, target_graph: str, merge_property: str,
+                          page_size: int, policies: dict, normalizer: Normalizer, predicate: str, projection: dict):
+        """
+        Server-side merge engine.
+
+        Calculates the same merge graph as the client-side engine of `db_merge`, but merges the entities on
+        the server. Only the IDs and merge keys of the vertices are held in memory. The following steps
+        are performed:
+        1)  Query the `id` and the selected properties of all vertices of the source graphs page by page
+            and unify the values in a disjoint set.
+        2)  Assign a merged ID to each subset.
+        3)  Query all entities of the source graphs page by page. Rewrite the vertices and edges of each
+            page to their merged IDs and send them as batches of `BATCH_SIZE` rows to the server, which
+            merges all rows with the same merged ID (vertices) or pair of merged IDs (edges).
+        4)  Store a merge manifest with the graph.
+
+        Parameters
+        ----------
+        selection : list
+            The selected properties.
+
+        source_graphs : list
+            The source graphs.
+
+        target_graph : str
+            The key to store the merge graph with.
+
+        merge_property : str
+            The name of the new merge-property.
+
+        page_size : int
+            The number of consecutive vertex IDs queried per page.
+
+        policies : dict
+            The merge policies. Stored with the manifest only, as all properties are concatenated.
+
+        normalizer : Normalizer
+            Normalizes the values of the selected properties before they are unified. May be None.
+
+        predicate : str
+            A OpenCypher predicate on the binder `vertex`, see `db_merge`. May be None.
+
+        projection : dict
+            The vertex and edge properties to query, as returned by `__resolve_projection`. May be None.
+        """
+
+        merge_property_name = target_graph + DATA_SEPARATOR + merge_property
+        label = target_graph + NODES
+
+        # Step 1) and 2)
+        vertex_ids, merged_values, index = self.__assign_merged_ids(selection, source_graphs, merge_property_name,
+                                                                    page_size, normalizer, predicate)
+
+        # Step 3)
+        try:
+            self.__query(create_index(label, ID), target_graph, check=False)
+
+        # The index was created by an earlier merge into the target graph.
+        except redis.ResponseError:
+            pass
+
+        pending = set(vertex_ids)
+
+        for vertices, edges in self.__fetch_concurrently(lambda dbkey: self.__fetch_entities(dbkey, page_size,
+                                                                                              predicate, projection),
+                                                         source_graphs):
+
+            rows = []
+
+            for vertex in vertices:
+
+                # Vertices adjacent to several edges are returned on several pages.
+                if vertex[ID] not in pending:
+                    continue
+
+                pending.discard(vertex[ID])
+
+                row = dict(vertex)
+                row[ID] = vertex_ids[vertex[ID]]
+                row[merge_property_name] = merged_values.get(row[ID], NULL)
+
+                for property_ in flatten_keys(selection):
+                    row[property_] = NULL
+
+                rows.append(row)
+
+            for batch in self.__batches(rows, BATCH_SIZE):
+
+                properties = set().union(*[row.keys() for row in batch])
+                assigned = [merge_property_name] + flatten_keys(selection)
+
+                self.__query(merge_vertices(label, batch, sorted(properties.difference([ID] + assigned)), assigned),
+                             target_graph, check=False)
+
+            for edge in edges:
+                edge[SOURCE] = vertex_ids[edge[SOURCE]]
+                edge[TARGET] = vertex_ids[edge[TARGET]]
+
+            for batch in self.__batches(edges, BATCH_SIZE):
+
+                properties = set().union(*[edge.keys() for edge in batch])
+
+                self.__query(merge_edges(label, target_graph + EDGES, batch,
+                                         sorted(properties.difference([SOURCE, TARGET]))),
+                             target_graph, check=False)
+
+        # Step 4)
+        written_ids = set(vertex_ids[vertex_id] for vertex_id in vertex_ids if vertex_id not in pending)
+
+        self.__write_manifest(target_graph,
+                              {MANIFEST_NAME: merge_property, MANIFEST_PROPERTY: merge_property_name,
+                               MANIFEST_SELECTION: selection, MANIFEST_INDEX: index,
+                               MANIFEST_POLICIES: policies, MANIFEST_PREDICATE: predicate,
+                               MANIFEST_PROJECTION: projection, MANIFEST_SOURCES: source_graphs},
+                              {value: merged_id for merged_id, values in merged_values.items()
+                               if merged_id in written_ids for value in values.split(MERGE_SEPARATOR)},
+                              page_size)
+
+    def __merge_on_disk(self, selection: list, source_graphs: list, target_graph: str, merge_property: str,
+                        page_size: int, memory_budget: int, policies: dict, normalizer: Normalizer, predicate: str,
+                        projection: dict):
+        """
+        Out-of-core merge engine.
+
+        Calculates the same merge graph as the client-side engine of `db_merge`, but holds only the IDs and
+        merge keys of the vertices and the entities of one partition in memory. The following steps are
+        performed:
+        1)  Query the `id` and the selected properties of all vertices of the source graphs page by page
+            and unify the values in a disjoint set.
+        2)  Assign a merged ID to each subset.
+        3)  Choose the number of partitions, such that the entities of each partition and their merged
+            entities fit into `memory_budget`.
+        4)  Query all entities of the source graphs page by page. Rewrite the vertices and edges of each
+            page to their merged IDs and append them to the run file of their partition, chosen by the hash
+            of the merged ID (vertices) or merged source ID (edges).
+        5)  Load the run files partition by partition, merge all entities sharing a merged ID or pair of
+            merged IDs and stream the merged entities to the csv files of the bulk upload.
+        6)  Upload the csv files and store a merge manifest with the graph.
+
+        Parameters
+        ----------
+        selection : list
+            The selected properties.
+
+        source_graphs : list
+            The source graphs.
+
+        target_graph : str
+            The key to store the merge graph with.
+
+        merge_property : str
+            The name of the new merge-property.
+
+        page_size : int
+            The number of consecutive vertex IDs queried per page.
+
+        memory_budget : int
+            The number of bytes the entities of one partition may occupy.
+
+        policies : dict
+            Maps properties to their merge policy.
+
+        normalizer : Normalizer
+            Normalizes the values of the selected properties before they are unified. May be None.
+
+        predicate : str
+            A OpenCypher predicate on the binder `vertex`, see `db_merge`. May be None.
+
+        projection : dict
+            The vertex and edge properties to query, as returned by `__resolve_projection`. May be None.
+        """
+
+        merge_property_name = target_graph + DATA_SEPARATOR + merge_property
+
+        # Step 1) and 2)
+        vertex_ids, merged_values, index = self.__assign_merged_ids(selection, source_graphs, merge_property_name,
+                                                                    page_size, normalizer, predicate)
+
+        # Step 3)
+        vertex_count, edge_count, _ = self.__count_entities(selection, source_graphs, predicate)
+        vertex_size, _, edge_size = self.__sample_sizes(selection, source_graphs, projection)
+
+        partition_count = max(1, -(-self.__client_memory(vertex_count, edge_count, vertex_size, edge_size)
+                                   // memory_budget))
+
+        try:
+            mkdir(WORK_DIRECTORY)
+        except FileExistsError:
+            pass
+
+        with TemporaryDirectory(dir=WORK_DIRECTORY) as directory:
+
+            vertex_runs = [join(directory, str(partition) + NODES + RUN_FILE) for partition in range(partition_count)]
+            edge_runs = [join(directory, str(partition) + EDGES + RUN_FILE) for partition in range(partition_count)]
+
+            # Step 4)
+            pending = set(vertex_ids)
+            vertex_properties = set(flatten_keys(selection) + [merge_property_name])
+            edge_properties = set()
+
+            for vertices, edges in self.__fetch_concurrently(lambda dbkey: self.__fetch_entities(dbkey, page_size,
+                                                                                              predicate, projection),
+                                                             source_graphs):
+
+                # Lines are grouped by run file, hence each run file is opened once per page.
+                lines = {}
+
+                for vertex in vertices:
+
+                    # Vertices adjacent to several edges are returned on several pages.
+                    if vertex[ID] not in pending:
+                        continue
+
+                    pending.discard(vertex[ID])
+
+                    vertex[ID] = vertex_ids[vertex[ID]]
+                    vertex_properties.update(vertex.keys())
+
+                    lines.setdefault(vertex_runs[self.__partition(vertex[ID], partition_count)], []) \
+                        .append(dumps(vertex) + '\n')
+
+                for edge in edges:
+
+                    edge[SOURCE] = vertex_ids[edge[SOURCE]]
+                    edge[TARGET] = vertex_ids[edge[TARGET]]
+                    edge_properties.update(edge.keys())
+
+                    lines.setdefault(edge_runs[self.__partition(edge[SOURCE], partition_count)], []) \
+                        .append(dumps(edge) + '\n')
+
+                for run, run_lines in lines.items():
+
+                    with open(run, 'a') as run_file:
+                        run_file.writelines(run_lines)
+
+            written_ids = set(vertex_ids[vertex_id] for vertex_id in vertex_ids if vertex_id not in pending)
+            del vertex_ids, pending
+
+            # Step 5)
+            def merge_vertices_():
+
+                for run in vertex_runs:
+
+                    if not exists(run):
+                        continue
+
+                    buckets = {}
+                    with open(run) as vertices:
+                        for line in vertices:
+                            vertex = loads(line)
+                            buckets.setdefault(vertex[ID], []).append(vertex)
+
+                    for merged_id, bucket in buckets.items():
+
+                        merged_vertex = self.__merge_dictionaries(bucket, vertex_properties, policies)
+                        merged_vertex[ID] = merged_id
+                        merged_vertex[merge_property_name] = merged_values.get(merged_id, NULL)
+
+                        for property_ in flatten_keys(selection):
+                            merged_vertex[property_] = NULL
+
+                        yield merged_vertex
+
+            def merge_edges_():
+
+                for run in edge_runs:
+
+                    if not exists(run):
+                        continue
+
+                    buckets = {}
+                    with open(run) as edges:
+                        for line in edges:
+                            edge = loads(line)
+                            buckets.setdefault((edge[SOURCE], edge[TARGET]), []).append(edge)
+
+                    for (source, target), bucket in buckets.items():
+
+                        merged_edge = self.__merge_dictionaries(bucket, edge_properties, policies)
+                        merged_edge[SOURCE] = source
+                        merged_edge[TARGET] = target
+
+                        yield merged_edge
+
+            self.__FileInterface.write_bulk({VERTEX: merge_vertices_(), EDGE: merge_edges_()}, target_graph,
+                                            sorted(vertex_properties.difference([ID])), sorted(edge_properties))
+
+        # Step 6)
+        self.__upload_bulk(target_graph)
+
+        self.__write_manifest(target_graph,
+                              {MANIFEST_NAME: merge_property, MANIFEST_PROPERTY: merge_property_name,
+                               MANIFEST_SELECTION: selection, MANIFEST_INDEX: index,
+                               MANIFEST_POLICIES: policies, MANIFEST_PREDICATE: predicate,
+                               MANIFEST_PROJECTION: projection, MANIFEST_SOURCES: source_graphs},
+                              {value: merged_id for merged_id, values in merged_values.items()
+                               if merged_id in written_ids for value in values.split(MERGE_SEPARATOR)},
+                              page_size)
+
+    @staticmethod
+    def __partition(merged_id: str, partition_count: int) -> int:
+
+        return crc32(merged_id.encode(UTF_8)) % partition_count
+
+    def db_merge_incremental(self, selection: list, source_graph: str, target_graph: str,
+                             page_size: int = PAGE_SIZE, normalizer: Normalizer = None):
+        """
+        Folds a new source graph into an existing merge graph.
+
+        Only the entities of the new source graph are queried and processed. The merge manifest stored
+        with the merge graph by `db_merge` maps each merge-property value to its merged vertex. The
+        following steps are performed:
+        1)  Read the merge manifest of the target graph.
+        2)  Query all entities of the source graph page by page and unify the values of the selected
+            properties of each vertex with a disjoint set.
+        3)  Look up the merged ID of each value in the manifest. Subsets without a known value are
+            assigned a new merged ID. If the values of a subset are known for several merged vertices,
+            these would have to be unified and the merge graph is recomputed with `db_merge` instead.
+            Virtual merge graphs are recomputed as well, as only their merged IDs are stored. The former
+            merge graph is kept until the recomputed one is stored, see `__rebuild`.
+        4)  Query the affected merged vertices and their outgoing edges from the target graph.
+        5)  Update the affected merged vertices and edges and create all new ones. They are sent as
+            batches of `BATCH_SIZE` rows, which are matched through the index on `id`.
+        6)  Update the merge manifest.
+
+        Parameters
+        ----------
+        selection : list
+            Specifies the properties of the source graph for which the merge graph is calculated. A tuple
+            of properties is a composite key.
+
+        source_graph : str
+            The graph key of the source graph to fold into the merge graph. Virtual merge graphs are rejected,
+            see `__check_sources`.
+
+        target_graph : str
+            The key of the merge graph.
+
+        page_size : int
+            The number of consecutive vertex IDs queried per page (default is PAGE_SIZE).
+
+        normalizer : Normalizer, optional
+            Normalizes the values before they are looked up. Has to normalize like the normalizer the merge
+            graph was calculated with, as the manifest stores normalized values (default is None).
+        """
+
+        self.__check_sources([source_graph])
+
+        # Step 1)
+        manifest = self.__read_manifest(target_graph)
+
+        if source_graph in manifest[MANIFEST_SOURCES]:
+            return
+
+        if self.__is_view(target_graph):
+
+            self.__rebuild(target_graph, lambda: self.db_merge(
+                [manifest[MANIFEST_NAME]] + manifest[MANIFEST_SELECTION] + selection,
+                manifest[MANIFEST_SOURCES] + [source_graph],
+                target_graph,
+                page_size,
+                policies=manifest[MANIFEST_POLICIES],
+                normalizer=normalizer,
+                virtual=True,
+                predicate=manifest[MANIFEST_PREDICATE],
+                projection=manifest[MANIFEST_PROJECTION]
+            ))
+
+            return
+
+        merge_property_name = manifest[MANIFEST_PROPERTY]
+
+        # Step 2)
+        disjoint_set, assignments, edges_, merged_values, vertex_properties, edge_properties = \
+            self.__collect_entities(
+                self.__fetch_entities(source_graph, page_size, manifest[MANIFEST_PREDICATE],
+                                      self.__resolve_projection(manifest[MANIFEST_SELECTION] + selection,
+                                                                manifest[MANIFEST_PROJECTION])),
+                selection,
+                normalizer
+            )
+
+        # Step 3)
+        known_ids = {}
+        delta_values = list(chain.from_iterable(merged_values.values()))
+
+        for batch in self.__batches(delta_values, page_size):
+
+            for value, merged_id in zip(batch, self.__Client.hmget(target_graph + MANIFEST_VALUES,
+                                                                   [encode_key(value) for value in batch])):
+
+                if merged_id is not None:
+                    known_ids.setdefault(disjoint_set.find(value), set()).add(merged_id.decode(UTF_8))
+
+        policies = manifest[MANIFEST_POLICIES]
+
+        if any(len(merged_ids) > 1 for merged_ids in known_ids.values()) or \
+                any(policy in AGGREGATE_POLICIES for policy in policies.values()):
+
+            self.__rebuild(target_graph, lambda: self.db_merge(
+                [manifest[MANIFEST_NAME]] + manifest[MANIFEST_SELECTION] + selection,
+                manifest[MANIFEST_SOURCES] + [source_graph],
+                target_graph,
+                page_size,
+                policies=policies,
+                normalizer=normalizer,
+                predicate=manifest[MANIFEST_PREDICATE],
+                projection=manifest[MANIFEST_PROJECTION]
+            ))
+
+            return
+
+        # Subsets known for the same merged vertex are unified, as they are merged into it.
+        subsets = {}
+        for root, merged_ids in known_ids.items():
+            subsets.setdefault(merged_ids.pop(), []).append(root)
+
+        known_ids = {disjoint_set.union(*roots): merged_id for merged_id, roots in subsets.items()}
+
+        merged_values = {}
+        for value in delta_values:
+            merged_values.setdefault(disjoint_set.find(value), []).append(value)
+
+        index = manifest[MANIFEST_INDEX]
+        buckets = {}
+        vertex_buckets = {}
+        for vertex_id, (vertex, element) in assignments.items():
+
+            root = disjoint_set.find(element)
+
+            if root not in buckets:
+
+                if root in known_ids:
+
+                    merged_id = known_ids[root]
+
+                else:
+
+                    merged_id = merge_property_name + str(index)
+                    index += 1
+
+                buckets[root] = {VERTEX: [], EDGE: {}, ID: merged_id}
+
+            buckets[root][VERTEX].append(vertex)
+            vertex_buckets[vertex_id] = buckets[root]
+
+        # Step 4)
+        existing_ids = [bucket[ID] for root, bucket in buckets.items() if root in known_ids]
+        existing_vertices = {}
+        existing_edges = {}
+
+        for batch in self.__batches(existing_ids, page_size):
+
+            vertices, edges = ResultSet(self.__query(get_vertices_by_id(target_graph + NODES, batch),
+                                                     target_graph)).split()
+            existing_vertices.update({vertex[ID]: vertex for vertex in vertices})
+
+            vertices, edges = ResultSet(self.__query(get_edges_by_source(target_graph + NODES, batch),
+                                                     target_graph)).split()
+            existing_edges.update({(edge[SOURCE], edge[TARGET]): edge for edge in edges})
+
+        # Step 5)
+        vertex_rows = []
+        edge_rows = []
+
+        for edge in edges_:
+            bucket = vertex_buckets[edge[SOURCE]]
+            edge[SOURCE] = bucket[ID]
+            edge[TARGET] = vertex_buckets[edge[TARGET]][ID]
+            bucket[EDGE].setdefault((edge[SOURCE], edge[TARGET]), []).append(edge)
+
+        for root, bucket in buckets.items():
+
+            existing_vertex = existing_vertices.get(bucket[ID])
+            values = set(encode_key(value) for value in merged_values.get(root, []))
+
+            if existing_vertex:
+
+                values.update(existing_vertex.pop(merge_property_name).split(MERGE_SEPARATOR))
+                values.discard(NULL)
+                del existing_vertex[ID]
+
+                merged_vertex = self.__merge_dictionaries([existing_vertex] + bucket[VERTEX],
+                                                          vertex_properties.union(existing_vertex.keys()), policies)
+
+            else:
+
+                merged_vertex = self.__merge_dictionaries(bucket[VERTEX], vertex_properties, policies)
+
+            merged_vertex[ID] = bucket[ID]
+            merged_vertex[merge_property_name] = MERGE_SEPARATOR.join(sorted(values)) if values else NULL
+
+            for property_ in flatten_keys(selection):
+                merged_vertex[property_] = NULL
+
+            vertex_rows.append(merged_vertex)
+
+        for root, bucket in buckets.items():
+
+            for (edge_source, edge_target), edges in bucket[EDGE].items():
+
+                existing_edge = existing_edges.get((edge_source, edge_target))
+
+                if existing_edge:
+
+                    merged_edge = self.__merge_dictionaries([existing_edge] + edges,
+                                                            edge_properties.union(existing_edge.keys()), policies)
+
+                else:
+
+                    merged_edge = self.__merge_dictionaries(edges, edge_properties, policies)
+
+                merged_edge[SOURCE] = edge_source
+                merged_edge[TARGET] = edge_target
+
+                edge_rows.append(merged_edge)
+
+        # Merged vertices and edges are matched by the index on `id`, as they are merged with batched queries.
+        # Properties missing on a row are assigned null, which keeps them missing.
+        label = target_graph + NODES
+
+        try:
+            self.__query(create_index(label, ID), target_graph)
+
+        # The index was created by an earlier merge.
+        except redis.ResponseError:
+            pass
+
+        for batch in self.__batches(vertex_rows, BATCH_SIZE):
+
+            properties = set().union(*[row.keys() for row in batch]).difference([ID])
+
+            self.__query(merge_vertices(label, batch, [], sorted(properties)), target_graph, check=False)
+
+        for batch in self.__batches(edge_rows, BATCH_SIZE):
+
+            properties = set().union(*[row.keys() for row in batch]).difference([SOURCE, TARGET])
+
+            self.__query(merge_edges(label, target_graph + EDGES, batch, [], sorted(properties)),
+                         target_graph, check=False)
+
+        # Step 6)
+        self.__write_manifest(target_graph,
+                              {MANIFEST_NAME: manifest[MANIFEST_NAME], MANIFEST_PROPERTY: merge_property_name,
+                               MANIFEST_SELECTION: manifest[MANIFEST_SELECTION] + selection,
+                               MANIFEST_INDEX: index, MANIFEST_POLICIES: policies,
+                               MANIFEST_PREDICATE: manifest[MANIFEST_PREDICATE],
+                               MANIFEST_PROJECTION: manifest[MANIFEST_PROJECTION], MANIFEST_SOURCES: [source_graph]},
+                              {encode_key(value): buckets[disjoint_set.find(value)][ID] for value in delta_values},
+                              page_size)
+
+    def __rebuild(self, target_graph: str, merge):
+        """
+        Replaces a merge graph with a recomputed one.
+
+        The graph and the keys stored with it are renamed to a backup key while the merge graph is
+        recomputed, as `db_merge` stores it with the key of the former graph. The backup is deleted once
+        the merge graph is stored. If the merge failed, the backup is renamed back over the partially
+        stored merge graph, hence the former graph is stored with either key at any time.
 
         Parameters
         ----------
-        selection : list
-            Specifies the properties for which the merge graph is calculated.
-            At index 0 a new merge-property name is stored.
-
-        source_graphs : list
-            Specifies the source graphs for which the merge graph is calculated.
-
         target_graph : str
-            The key to store the merge graph with.
+            The key of the merge graph.
+
+        merge : callable
+            Called without arguments, recomputes the merge graph and stores it with `target_graph`.
         """
 
-        def extract_(entity, *args):
+        backup = target_graph + BACKUP
 
-            merge_property_values = set()
+        self.db_delete_key(backup)
+        self.__rename_graph(target_graph, backup)
 
-            for key in args:
+        try:
+            merge()
 
-                try:
-                    merge_property_values.add(entity[key])
+        except BaseException:
 
-                except KeyError:
-                    pass
+            self.__rename_graph(backup, target_graph)
 
-            merge_property_values.discard('NULL')
+            raise
 
-            return merge_property_values.pop()
+        self.db_delete_key(backup)
 
-        # Step 1)
-        merge_property_name = target_graph + DATA_SEPARATOR + selection.pop(0)
+    def __rename_graph(self, dbkey: str, new_dbkey: str):
+        """
+        Renames a graph and the keys stored with it in one transaction.
 
-        distinct_values = set()
+        Keys stored with `new_dbkey` are overwritten, or deleted if no key of `dbkey` replaces them.
 
-        for source_graph in source_graphs:
-            ''' For each source graph query all values of the properties specified as `selection`.
-            '''
-            values = set(value.decode(UTF_8) for value in
-                         chain.from_iterable(self.__query(get_values(*selection), source_graph)[1:]))
-            distinct_values.update(values)
-        distinct_values.discard('NULL')
+        Parameters
+        ----------
+        dbkey : str
+            The graph key to rename.
 
-        # Step 2)
-        buckets = {}
-        index = 0
-        for value in distinct_values:
-            ''' 
-            Each bucket stores:
-            - a list of vertices represented as dictionaries.
-            - a dictionary to store lists of edges represented as dictionaries.
-            - a string, the new ID. 
-            '''
-            buckets[value] = {VERTEX: [], EDGE: {}, ID: (merge_property_name + str(index))}
-            index += 1
+        new_dbkey : str
+            The new graph key.
+        """
 
-        # Step 3)
-        response = ([], [])
-        vertex_properties = set()
-        edge_properties = set()
+        suffixes = ['', VIEW, MINHASH, MANIFEST_VALUES, MANIFEST_SOURCES, MANIFEST_META]
+        renamed = [suffix for suffix in suffixes if self.__Client.exists(dbkey + suffix)]
 
-        for source_graph in source_graphs:
+        pipeline = self.__Client.pipeline(transaction=True)
 
-            vertices, edges = \
-                self.__split_mapping(
-                    self.__response_to_dict(
-                        self.__query(get_entities(), source_graph),
-                        decode=True
-                    )
-                )
+        for suffix in suffixes:
 
-            vertex_properties.update(list(vertices[0].keys()))
-            edge_properties.update(list(edges[0].keys()))
+            if suffix in renamed:
+                pipeline.rename(dbkey + suffix, new_dbkey + suffix)
 
-            response[0].extend(vertices)
-            response[1].extend(edges)
+            else:
+                pipeline.delete(new_dbkey + suffix)
 
-        # Step 4)
-        for vertex in response[0]:
-            bucket = buckets[extract_(vertex, *selection)]
-            bucket[VERTEX].append(vertex)
-            buckets[vertex[ID]] = bucket
+        pipeline.execute()
 
-        # Step 5)
-        for edge in response[1]:
-            edge_source = edge[SOURCE]
-            edge_target = edge[TARGET]
-            edge[SOURCE] = buckets[edge_source][ID]
-            edge[TARGET] = buckets[edge_target][ID]
-            edge_id = edge[SOURCE] + edge[TARGET]
+        if self.__Reader is not None:
 
-            bucket = buckets[edge_source]
+            self.__Reader.invalidate(dbkey)
+            self.__Reader.invalidate(new_dbkey)
 
-            if edge_id in bucket[EDGE]:
+        self.__bump_version(dbkey)
+        self.__bump_version(new_dbkey)
+        self.__Overlaps = None
 
-                bucket[EDGE][edge_id].append(edge)
+    def db_materialize(self, view: str, target_graph: str = None, page_size: int = PAGE_SIZE,
+                       kernel: str = PYTHON_KERNEL, engine: str = AUTO_ENGINE, normalizer: Normalizer = None):
+        """
+        Calculates the merge graph of a virtual merge graph.
 
-            else:
+        The merge graph is calculated with `db_merge` from the source graphs, selection, merge policies,
+        predicate and projection stored in the manifest of the virtual merge graph.
 
-                bucket[EDGE][edge_id] = [edge]
+        Parameters
+        ----------
+        view : str
+            The key of the virtual merge graph.
 
-        # Step 6)
-        # The new graph is represented as two lists of dictionaries.
-        graph = {VERTEX: [], EDGE: []}
-        for value in distinct_values:
+        target_graph : str, optional
+            The key to store the merge graph with. The virtual merge graph is replaced with `__rebuild` if no
+            key is given (default is None).
 
-            bucket = buckets[value]
+        page_size : int
+            The number of consecutive vertex IDs queried per page (default is PAGE_SIZE).
 
-            if bucket[VERTEX]:
+        kernel : str
+            The kernel to calculate the merge graph with, see `db_merge` (default is PYTHON_KERNEL).
 
-                merged_vertex = self.__merge_dictionaries(bucket['vertex'], vertex_properties)
-                merged_vertex[ID] = bucket[ID]
-                merged_vertex[merge_property_name] = value
+        engine : str
+            The engine to calculate the merge graph with, see `db_merge` (default is AUTO_ENGINE).
 
-                for property_ in selection:
-                    merged_vertex[property_] = 'NULL'
+        normalizer : Normalizer, optional
+            Has to normalize like the normalizer the virtual merge graph was calculated with (default is None).
+        """
 
-                graph[VERTEX].append(merged_vertex)
+        manifest = self.__read_manifest(view)
 
-                for edge_id in bucket[EDGE]:
-                    merged_edge = self.__merge_dictionaries(bucket['edge'][edge_id], edge_properties)
-                    merged_edge[TARGET] = set(merged_edge[TARGET].split(MERGE_SEPARATOR)).pop()
-                    merged_edge[SOURCE] = set(merged_edge[SOURCE].split(MERGE_SEPARATOR)).pop()
+        def merge_(graph):
+            self.db_merge([manifest[MANIFEST_NAME]] + manifest[MANIFEST_SELECTION],
+                          manifest[MANIFEST_SOURCES],
+                          graph,
+                          page_size,
+                          kernel,
+                          engine,
+                          policies=manifest[MANIFEST_POLICIES],
+                          normalizer=normalizer,
+                          predicate=manifest[MANIFEST_PREDICATE],
+                          projection=manifest[MANIFEST_PROJECTION])
 
-                    graph[EDGE].append(merged_edge)
+        # The virtual merge graph is kept until the merge graph replacing it is stored.
+        if not target_graph or target_graph == view:
+            self.__rebuild(view, lambda: merge_(view))
 
-        # Step 7)
-        self.db_write(graph, target_graph)
+        else:
+            merge_(target_graph)
 
     def db_query(self, query: str, dbkey: str, to_graph=False):
         """
         Executes a query.
 
         Queries the graph accessed with `dbkey`. If `to_graph` is `True` the
-        query-response will be returned.
+        query-response will be returned. Queries of virtual merge graphs are
+        federated over their source graphs with `__query_view`. Responses of
+        read queries are cached until the graph is written, while write
+        queries bump the version of the graph.
 
         Parameters
         ----------
@@ -432,28 +2449,129 @@ class DataBaseInterface:
             A tuple of two lists of dictionaries. Represents vertices and edges.
         """
 
+        if self.__is_view(dbkey):
+
+            if not to_graph:
+                raise DataBaseInterfaceViewException(dbkey)
+
+            return self.__query_view(query, dbkey)
+
         if to_graph:
 
-            return \
-                self.__split_mapping(
-                    self.__response_to_dict(
-                        self.__revise_response(
-                            self.__query(query, dbkey)
-                        ),
-                        decode=False
-                    )
-                )
+            def decode(response):
+                return ResultSet(revise_response(response)).split()
+
+            if is_write_query(query):
+                return decode(self.__query(query, dbkey))
+
+            # Read queries are served from the result cache until the graph is written.
+            if self.client_get_connection():
+                return tuple(self.__query_cached(query, dbkey, self.__get_version(dbkey), decode))
 
         else:
 
             self.__query(query, dbkey)
 
+    def __query_view(self, query: str, view: str) -> tuple:
+        """
+        Executes a query against a virtual merge graph.
+
+        The query is executed against each source graph of the virtual merge graph. The returned vertices
+        are rewritten to their merged IDs, which are looked up in the hash stored by `__merge_virtually`, and
+        vertices sharing a merged ID are unified. Edges are rewritten and unified accordingly. Properties
+        are unified by their distinct values, merge policies are applied once the graph is materialized.
+
+        Parameters
+        ----------
+        query : str
+            A OpenCypher query.
+
+        view : str
+            The key of the virtual merge graph.
+
+        Returns
+        -------
+        tuple
+            A tuple of two lists of dictionaries. Represents vertices and edges.
+        """
+
+        vertices = []
+        edges = []
+
+        for source_graph in self.__read_manifest(view)[MANIFEST_SOURCES]:
+
+            response = self.__query(query, source_graph)
+
+            # Empty responses consist of the header only.
+            if response and len(response) > 1:
+
+                vertices_, edges_ = ResultSet(revise_response(response)).split()
+
+                vertices.extend(vertices_)
+                edges.extend(edges_)
+
+        vertex_ids = set(vertex[ID] for vertex in vertices)
+        vertex_ids.update(chain.from_iterable((edge[SOURCE], edge[TARGET]) for edge in edges))
+
+        merged_ids = {}
+        for batch in self.__batches(list(vertex_ids), PAGE_SIZE):
+
+            for vertex_id, merged_id in zip(batch, self.__Client.hmget(view + VIEW, batch)):
+
+                # Vertices of source graphs added after the virtual merge are not merged.
+                merged_ids[vertex_id] = merged_id.decode(UTF_8) if merged_id is not None else vertex_id
+
+        merged_vertices = {}
+        for vertex in vertices:
+
+            vertex[ID] = merged_ids[vertex[ID]]
+            merged_vertices.setdefault(vertex[ID], []).append(vertex)
+
+        merged_edges = {}
+        for edge in edges:
+
+            edge[SOURCE] = merged_ids[edge[SOURCE]]
+            edge[TARGET] = merged_ids[edge[TARGET]]
+            merged_edges.setdefault((edge[SOURCE], edge[TARGET]), []).append(edge)
+
+        return \
+            [self.__unify_displayed(entities) for entities in merged_vertices.values()], \
+            [self.__unify_displayed(entities) for entities in merged_edges.values()]
+
+    @staticmethod
+    def __unify_displayed(entities):
+        """
+        Unifies the entities of a virtual merge graph that share a merged ID.
+
+        Parameters
+        ----------
+        entities : list
+            A list of dictionaries. Represents the entities sharing a merged ID, as displayed.
+
+        Returns
+        -------
+        dict
+            The unified entity. Each property holds the sorted distinct values of all entities, joined with
+            `DISPLAY_SEPARATOR`.
+        """
+
+        unified = {}
+
+        for entity in entities:
+
+            for key, value in entity.items():
+                unified.setdefault(key, set()).update(value.split(DISPLAY_SEPARATOR))
+
+        return {key: DISPLAY_SEPARATOR.join(sorted(values.difference([''])))
+                for key, values in unified.items()}
+
     def db_explain(self, query: str, dbkey: str):
         """
         Sends a explain-query request to the connected Redis instance.
 
         Each OpenCypher query has a execution plan.
         This plan can be requested with the `GRAPH.EXPLAIN` command.
+        For virtual merge graphs the execution plans of all source graphs are returned.
 
         Parameters
         ----------
@@ -469,9 +2587,14 @@ class DataBaseInterface:
             The encoded execution plan steps.
         """
 
+        if self.__is_view(dbkey):
+
+            return b'\n'.join(self.__Client.execute_command(G_EXPLAIN, source_graph, query)
+                               for source_graph in self.__read_manifest(dbkey)[MANIFEST_SOURCES])
+
         return self.__Client.execute_command(G_EXPLAIN, dbkey, query)
 
-    def db_write(self, graph: dict, graph_key: str):
+    def db_write(self, graph: dict, graph_key: str, sketch: bool = False):
         """
         Stores a graph with the specified key at the connected database.
 
@@ -489,9 +2612,131 @@ class DataBaseInterface:
 
         graph_key : str
             Specifies the graph key to store the graph with.
+
+        sketch : bool
+            If MinHash sketches of the vertex properties should be stored with the graph, see `db_sketch`
+            (default is False).
         """
 
         self.__FileInterface.write_bulk(graph, graph_key)
+        self.__upload_bulk(graph_key)
+
+        if sketch:
+
+            sketches = {}
+
+            for vertex in graph[VERTEX]:
+
+                for property_, value in vertex.items():
+
+                    if property_ != ID and value != NULL:
+                        sketches.setdefault(property_, set()).add(value)
+
+            self.__store_sketches(graph_key, {property_: self.__sketch([values])
+                                              for property_, values in sketches.items()})
+
+    def db_sketch(self, dbkey: str, properties: list = None, page_size: int = PAGE_SIZE):
+        """
+        Calculates and stores MinHash sketches of the vertex properties of a graph.
+
+        The distinct values of each property are scanned page by page and added to its sketch,
+        hence only one page of values is held in memory at once. The sketches are stored as hash
+        with the graph and are compared by `db_get_overlaps`.
+
+        Parameters
+        ----------
+        dbkey : str
+            The graph key to sketch. Virtual merge graphs are rejected, see `__check_sources`.
+
+        properties : list, optional
+            The vertex properties to sketch. All vertex properties are sketched if None (default is None).
+
+        page_size : int
+            The number of consecutive vertex IDs scanned per page (default is PAGE_SIZE).
+        """
+
+        self.__check_sources([dbkey])
+
+        if properties is None:
+
+            properties = [property_ for property_ in
+                          [key.decode(UTF_8).split('.')[1] for key in self.__query(get_vertex_limited(), dbkey)[0]]
+                          if property_ != ID]
+
+        self.__store_sketches(dbkey, {property_: self.__sketch(self.__fetch_values(dbkey, [property_], page_size))
+                                      for property_ in properties})
+
+    def db_get_overlaps(self) -> dict:
+        """
+        Estimates the overlap of the vertex properties of all sketched graphs.
+
+        The Jaccard similarity of the value sets of each pair of properties of different graphs is
+        estimated from their MinHash sketches, hence no values are fetched. The overlaps are only
+        estimated again once sketches were stored with `db_sketch` or `db_write`, or deleted with a graph.
+
+        Returns
+        -------
+        dict
+            Maps each sketched property to a tuple of the property of another graph it overlaps
+            most with and the estimated Jaccard similarity.
+        """
+
+        if self.__Overlaps is not None:
+            return self.__Overlaps
+
+        sketches = {}
+
+        for key in self.__Client.keys('*' + MINHASH):
+
+            graph = key.decode(UTF_8)[:-len(MINHASH)]
+
+            for property_, signature in self.__Client.hgetall(key).items():
+                sketches[(graph, property_.decode(UTF_8))] = MinHash.from_bytes(signature)
+
+        overlaps = {}
+
+        for (graph, property_), sketch in sketches.items():
+
+            candidates = [(other_property, sketch.jaccard(other_sketch))
+                          for (other_graph, other_property), other_sketch in sketches.items() if other_graph != graph]
+
+            if candidates:
+                overlaps[property_] = max(candidates, key=lambda candidate: candidate[1])
+
+        self.__Overlaps = overlaps
+
+        return overlaps
+
+    def __store_sketches(self, dbkey: str, sketches: dict):
+
+        if sketches:
+
+            self.__Client.hset(dbkey + MINHASH, mapping={property_: sketch.to_bytes()
+                                                         for property_, sketch in sketches.items()})
+
+            self.__Overlaps = None
+
+    @staticmethod
+    def __sketch(pages) -> MinHash:
+
+        sketch = MinHash()
+
+        for values in pages:
+            sketch.update(values)
+
+        return sketch
+
+    def __upload_bulk(self, graph_key: str):
+        """
+        Uploads the csv files written by `FileInterface.write_bulk` with the redis bulk upload script.
+
+        The csv files are removed afterwards.
+
+        Parameters
+        ----------
+        graph_key : str
+            Specifies the graph key to store the graph with.
+        """
 
         exec_redis_bulk = PYTHON_EXEC + join(abspath(dirname(__file__)), REDIS_BULK_DIRECTORY)
         nodes = WORK_DIRECTORY + graph_key + '_nodes.csv'
@@ -516,157 +2761,297 @@ class DataBaseInterface:
             except FileNotFoundError:
                 pass
 
+            # The bulk upload creates a new schema for the graph key.
+            if self.__Reader is not None:
+                self.__Reader.invalidate(graph_key)
+
+            self.__bump_version(graph_key)
+
     @staticmethod
-    def __unify_sets(sets):
+    def __collect_entities(pages, selection, normalizer=None):
+        """
+        Collects all entities of a sequence of pages and unifies the values of their selected properties.
 
-        unions = []
+        Parameters
+        ----------
+        pages : iterable
+            Tuples of two lists of dictionaries. Represent the vertices and edges of each page.
 
-        while sets:
+        selection : list
+            The properties to unify the values of.
 
-            union = sets.pop(0)
-            changed = True
+        normalizer : Normalizer, optional
+            Normalizes the values before they are unified (default is None).
 
-            while changed:
+        Returns
+        -------
+        tuple
+            The disjoint set of all values, a dictionary mapping each vertex ID to a tuple of the vertex and
+            its element of the disjoint set, the list of all edges, a dictionary mapping the root of each
+            subset to its values and the sets of all vertex and edge properties.
+        """
 
-                changed = False
+        disjoint_set = DisjointSet()
+        distinct_values = set()
+        assignments = {}
+        edges_ = []
+        vertex_properties = set()
+        edge_properties = set()
 
-                for remaining in sets:
+        for vertices, edges in pages:
 
-                    if union.intersection(remaining):
-                        union = union.union(remaining)
-                        sets.remove(remaining)
+            if vertices:
+                vertex_properties.update(vertices[0].keys())
 
-                        changed = True
+            if edges:
+                edge_properties.update(edges[0].keys())
 
-            unions.append(union)
+            for vertex in vertices:
 
-        return unions
+                # Vertices adjacent to several edges are returned on several pages.
+                if vertex[ID] in assignments:
+                    continue
 
-    @staticmethod
-    def __merge_dictionaries(dictionaries, keys):
+                values = DataBaseInterface.__extract_values(vertex, selection, normalizer)
 
-        merged_dictionary = {}
+                if values:
 
-        for key in keys:
+                    for value in values:
+                        disjoint_set.add(value)
 
-            values = []
+                    distinct_values.update(values)
+                    assignments[vertex[ID]] = (vertex, disjoint_set.union(*values))
 
-            for dictionary in dictionaries:
+                else:
 
-                try:
-                    values.append(dictionary[key])
+                    disjoint_set.add(vertex[ID])
+                    assignments[vertex[ID]] = (vertex, vertex[ID])
 
-                except KeyError:
-                    pass
+            edges_.extend(edges)
 
-            merged_dictionary[key] = MERGE_SEPARATOR.join(values)
+        # The merged value of each subset comprises all of its values.
+        merged_values = {}
+        for value in distinct_values:
+            merged_values.setdefault(disjoint_set.find(value), []).append(value)
 
-        return merged_dictionary
+        return disjoint_set, assignments, edges_, merged_values, vertex_properties, edge_properties
 
     @staticmethod
-    def __response_to_dict(response, decode=True):
+    def __extract_values(entity, selection, normalizer=None):
+
+        merge_property_values = set()
 
-        def get_binder_intervals():
+        for key in selection:
 
-            start = 0
+            try:
+
+                if isinstance(key, str):
+
+                    merge_property_values.add(entity[key])
 
-            end = 0
+                else:
 
-            intervals = []
+                    # The values of a composite key are unified as tuple, hence hashed as one value.
+                    value = tuple(entity[property_] for property_ in key)
 
-            symbol = binder[0]
+                    if NULL not in value:
+                        merge_property_values.add(value)
 
-            for index in range(1, len(binder) + 1):
+            except KeyError:
+                pass
 
-                if index > len(binder) - 1:
-                    intervals.append(range(start, end + 1))
+        merge_property_values.discard(NULL)
 
-                    break
+        if normalizer:
 
-                next_symbol = binder[index]
+            merge_property_values = \
+                set(normalizer(value) if isinstance(value, str) else tuple(normalizer(part) for part in value)
+                    for value in merge_property_values)
+            merge_property_values.discard('')
 
-                if next_symbol != symbol:
+        return merge_property_values
 
-                    end += 1
+    @staticmethod
+    def __resolve_projection(selection, projection):
+        """
+        Resolves the properties to query of a projection.
 
-                    intervals.append(range(start, end))
+        The `id` and the selected properties of vertices and the `source` and `target` of edges are
+        required to merge the entities, hence are always queried.
 
-                    symbol = next_symbol
+        Parameters
+        ----------
+        selection : list
+            The selected properties.
 
-                    start = end
+        projection : dict
+            Maps VERTEX and EDGE to lists of properties. May be None.
 
-                else:
+        Returns
+        -------
+        dict
+            Maps VERTEX and EDGE to the lists of properties to query, or to None if all properties are
+            queried. None if no projection is given.
+        """
+
+        if not projection:
+            return None
+
+        required = {VERTEX: [ID] + flatten_keys(selection), EDGE: [SOURCE, TARGET]}
+
+        # Duplicates are dropped, as each column has to be returned once.
+        return {entity: list(dict.fromkeys(required[entity] + projection[entity]))
+                if projection.get(entity) is not None else None
+                for entity in (VERTEX, EDGE)}
+
+    @staticmethod
+    def __batches(items, size):
+
+        for index in range(0, len(items), size):
+
+            yield items[index:index + size]
+
+    @staticmethod
+    def __merge_buckets(assignments, edges, disjoint_set, merged_values, vertex_properties, edge_properties,
+                        merge_property_name, selection, policies):
+
+        # Step 3) of `db_merge`. Each subset is a bucket.
+        buckets = {}
+        vertex_buckets = {}
+        index = 0
+        for vertex_id, (vertex, element) in assignments.items():
+            ''' 
+            Each bucket stores:
+            - a list of vertices represented as dictionaries.
+            - a dictionary to store lists of edges represented as dictionaries.
+            - a string, the new ID. 
+            '''
+            root = disjoint_set.find(element)
 
-                    end += 1
+            if root not in buckets:
+                buckets[root] = {VERTEX: [], EDGE: {}, ID: (merge_property_name + str(index))}
+                index += 1
 
-            return intervals
+            buckets[root][VERTEX].append(vertex)
+            vertex_buckets[vertex_id] = buckets[root]
 
-        def decode_(value):
+        # Step 4) of `db_merge`. Edges are stored in the bucket of their source.
+        for edge in edges:
+            bucket = vertex_buckets[edge[SOURCE]]
+            edge[SOURCE] = bucket[ID]
+            edge[TARGET] = vertex_buckets[edge[TARGET]][ID]
+            edge_id = edge[SOURCE] + edge[TARGET]
 
-            if decode:
+            if edge_id in bucket[EDGE]:
 
-                return value.decode('UTF-8')
+                bucket[EDGE][edge_id].append(edge)
 
             else:
 
-                return value
+                bucket[EDGE][edge_id] = [edge]
+
+        # Step 5) of `db_merge`. The new graph is represented as two lists of dictionaries.
+        graph = {VERTEX: [], EDGE: []}
+        for root, bucket in buckets.items():
+
+            merged_vertex = DataBaseInterface.__merge_dictionaries(bucket[VERTEX], vertex_properties, policies)
+            merged_vertex[ID] = bucket[ID]
+            merged_vertex[merge_property_name] = join_values(merged_values.get(root, [NULL]))
 
-        binder, keys = zip(*[decode_(value).split('.') for value in response[0]])
-        binder_intervals = get_binder_intervals()
+            for property_ in selection:
+                merged_vertex[property_] = NULL
 
-        mapping = \
-            [
-                {keys[index]: decode_(entry[index]) for index in interval}
-                for interval in binder_intervals
-                for entry in response[1:]
-            ]
+            graph[VERTEX].append(merged_vertex)
 
-        return mapping
+            for edge_id in bucket[EDGE]:
+                merged_edge = DataBaseInterface.__merge_dictionaries(bucket[EDGE][edge_id], edge_properties,
+                                                                     policies)
+                merged_edge[TARGET] = set(merged_edge[TARGET].split(MERGE_SEPARATOR)).pop()
+                merged_edge[SOURCE] = set(merged_edge[SOURCE].split(MERGE_SEPARATOR)).pop()
+
+                graph[EDGE].append(merged_edge)
+
+        return graph
 
     @staticmethod
-    def __revise_response(response):
+    def __merge_dictionaries(dictionaries, keys, policies=None):
+
+        return merge_entities(dictionaries, keys, policies)
 
-        def revise_keys():
+    def __sample_sizes(self, selection: list, source_graphs: list, projection: dict = None) -> tuple:
+        """
+        Measures the size in bytes of one sampled vertex and edge of each source graph once decoded.
+
+        Parameters
+        ----------
+        selection : list
+            The selected properties.
 
-            response[0] = ['_'.join([key.replace('e_', '').replace('v_', '')
-                                     for key in key.decode('UTF-8').split(DATA_SEPARATOR)])
-                           for key in response[0]]
+        source_graphs : list
+            The source graphs.
 
-        def revise_values():
+        projection : dict, optional
+            The vertex and edge properties to query, as returned by `__resolve_projection`. Only these
+            properties are measured (default is None).
 
-            for index in range(1, len(response)):
-                response[index] = [DISPLAY_SEPARATOR.join([value
-                                                           for value in
-                                                           set(value.decode('UTF-8').split(MERGE_SEPARATOR))
-                                                           if value != 'NULL'])
-                                   for value in response[index]]
+        Returns
+        -------
+        tuple
+            The largest size of a vertex, of the `id` and selected properties of a vertex and of an edge.
+        """
 
-        def drop_null_keys():
+        vertex_size = 0
+        key_size = 0
+        edge_size = 0
 
-            columns = list(zip(*response))
+        for source_graph in source_graphs:
 
-            dropped = 0
+            vertex_sample = self.__sample_size(get_vertex_limited(), source_graph)
+            edge_sample = self.__sample_size(get_edge_limited(), source_graph)
 
-            for index in range(len(response[0])):
+            if projection and projection[VERTEX] is not None:
+                vertex_sample = {key: size for key, size in vertex_sample.items() if key in projection[VERTEX]}
 
-                if all([value == '' for value in columns[index][1:]]):
+            if projection and projection[EDGE] is not None:
+                edge_sample = {key: size for key, size in edge_sample.items() if key in projection[EDGE]}
 
-                    for entry in response:
-                        entry.pop(index - dropped)
+            vertex_size = max(vertex_size, sum(vertex_sample.values()))
+            key_size = max(key_size, sum(size for key, size in vertex_sample.items()
+                                         if key in [ID] + flatten_keys(selection)))
+            edge_size = max(edge_size, sum(edge_sample.values()))
 
-                    dropped += 1
+        return vertex_size, key_size, edge_size
 
-        revise_keys()
-        revise_values()
-        drop_null_keys()
+    def __sample_size(self, query: str, dbkey: str) -> dict:
+        """
+        Measures the size in bytes of each property of one sampled entity once decoded.
 
-        return response
+        Parameters
+        ----------
+        query : str
+            A OpenCypher query returning at most one entity, e.g. `get_vertex_limited`.
 
-    @staticmethod
-    def __split_mapping(mapping):
+        dbkey : str
+            The graph key to query.
+
+        Returns
+        -------
+        dict
+            Maps each property to the size of its name and value. Empty if the graph has no such entity.
+        """
+
+        response = self.__query(query, dbkey, check=False)
+
+        if len(response) < 2:
+            return {}
+
+        sizes = {}
+        for header, value in zip(response[0], response[1]):
 
-        return (list({v[ID]: v for v in mapping if ID in v}.values()),
-                list({e[SOURCE] + e[TARGET]: e for e in mapping if SOURCE in e and TARGET in e}.values()))
+            key = header.decode(UTF_8).split('.')[1]
+            sizes[key] = getsizeof(key) + getsizeof(value.decode(UTF_8))
+
+        return sizes
 
     @staticmethod
     def __show_report(response):
@@ -840,12 +3225,13 @@ class FileInterface:
             self.__write_png(self.__create_igraph(query[0], query[1]), path)
 
     @staticmethod
-    def write_bulk(graph: dict, graph_key: str):
+    def write_bulk(graph: dict, graph_key: str, vertex_properties: list = None, edge_properties: list = None):
         """
         Writes a graph to two csv files.
 
         Uses the redis bulk upload to write a graph into a RedisGraph database.
         The graph has to be specified as dictionary of two lists storing vertices and edges as dictionaries.
+        If the properties are given, vertices and edges may be any iterables and are written one by one.
 
         Parameters
         ----------
@@ -854,10 +3240,19 @@ class FileInterface:
 
         graph_key : str
             Used as the key to store the graph.
+
+        vertex_properties : list, optional
+            The vertex properties except `id` (default is the properties of the first vertex).
+
+        edge_properties : list, optional
+            The edge properties (default is the properties of the first edge).
         """
 
-        vertex_properties = [key for key in graph[VERTEX][0].keys() if key != ID]
-        edge_properties = list(graph[EDGE][0].keys())
+        if vertex_properties is None:
+            vertex_properties = [key for key in graph[VERTEX][0].keys() if key != ID]
+
+        if edge_properties is None:
+            edge_properties = list(graph[EDGE][0].keys())
 
         try:
             # Create directory to write csv files if not present.
@@ -882,13 +3277,8 @@ class FileInterface:
     @staticmethod
     def __write_graphml(graph, path):
 
-        try:
-
-            file = open(path)
-
-        except FileNotFoundError:
-
-            file = open(path, 'w+')
+        # Existing files are overwritten.
+        file = open(path, 'w+')
 
         try:
 
@@ -0,0 +1,1007 @@
+"""
+Script to store data structures and kernels used by the merge algorithm of the dbinterface module.
+"""
+
+import numpy
+
+from re import compile
+from copy import copy
+from csv import reader
+from json import dumps, loads
+from os import cpu_count, mkdir
+from os.path import join
+from zlib import crc32
+from hashlib import blake2b
+from functools import partial
+from contextlib import ExitStack
+from tempfile import TemporaryDirectory
+from multiprocessing import get_context
+from concurrent.futures import ProcessPoolExecutor
+
+from modules.dbinterface.constants import ID, SOURCE, TARGET, VERTEX, EDGE, NULL, MERGE_SEPARATOR, CONCAT_POLICY, \
+    FIRST_POLICY, DISTINCT_POLICY, COUNT_POLICY, MIN_POLICY, MAX_POLICY, MEAN_POLICY, UTF_8, PARTITIONS_PER_WORKER, \
+    COMPOSITE_SEPARATOR, CASEFOLD, WHITESPACE, VERSION, VERSION_SUFFIX, MINHASH_PERMUTATIONS, MINHASH_SEED, \
+    MINHASH_HASH_SIZE, WORK_DIRECTORY, NODES, EDGES, RUN_FILE
+from modules.dbinterface.exceptons import DataBaseInterfaceCanonicalizerException
+
+
+class DisjointSet:
+    """
+    Disjoint-set forest to compute transitive unions of merge-property values.
+
+    Used by `DataBaseInterface.db_merge` to unify all values that are shared by at least one
+    vertex. Implements union by size and path compression, hence any sequence of operations
+    runs in near-linear time.
+
+    Attributes
+    ----------
+    __Parent : dict
+        Maps each element to its parent element. Roots map to themselves.
+
+    __Size : dict
+        Maps each root to the number of elements of its subset.
+
+    Methods
+    -------
+    add(element)
+        Adds an element as singleton subset.
+
+    find(element)
+        Returns the root of the subset containing element.
+
+    union(*elements)
+        Unifies the subsets containing the elements.
+    """
+
+    def __init__(self, elements=()):
+        """
+        Initializes a new `DisjointSet` object.
+
+        Parameters
+        ----------
+        elements : iterable, optional
+            Hashable elements each added as singleton subset (default is an empty tuple).
+        """
+
+        self.__Parent = {}
+        self.__Size = {}
+
+        for element in elements:
+
+            self.add(element)
+
+    def __contains__(self, element) -> bool:
+
+        return element in self.__Parent
+
+    def __iter__(self):
+
+        return iter(self.__Parent)
+
+    def add(self, element):
+        """
+        Adds an element as singleton subset.
+
+        Elements already contained are not changed.
+
+        Parameters
+        ----------
+        element
+            A hashable element.
+        """
+
+        if element not in self.__Parent:
+
+            self.__Parent[element] = element
+            self.__Size[element] = 1
+
+    def find(self, element):
+        """
+        Returns the root of the subset containing element.
+
+        Every element visited on the path to the root is linked to its grandparent (path halving).
+
+        Parameters
+        ----------
+        element
+            A hashable element. Has to be contained.
+
+        Returns
+        -------
+        object
+            The root element of the subset.
+        """
+
+        parent = self.__Parent
+
+        while parent[element] != element:
+
+            parent[element] = parent[parent[element]]
+            element = parent[element]
+
+        return element
+
+    def union(self, *elements):
+        """
+        Unifies the subsets containing the elements.
+
+        The root of the larger subset becomes the root of the union.
+
+        Parameters
+        ----------
+        elements
+            Hashable elements. Have to be contained.
+
+        Returns
+        -------
+        object
+            The root element of the union or None if no element was given.
+        """
+
+        if not elements:
+            return None
+
+        root = self.find(elements[0])
+
+        for element in elements[1:]:
+
+            other = self.find(element)
+
+            if other == root:
+                continue
+
+            if self.__Size[root] < self.__Size[other]:
+                root, other = other, root
+
+            self.__Parent[other] = root
+            self.__Size[root] += self.__Size.pop(other)
+
+        return root
+
+
+class Normalizer:
+    """
+    Normalizes merge-property values before they are unified.
+
+    Each value is passed through a sequence of canonicalizers and is then looked up in a synonym
+    table, which maps canonicalized synonyms to their canonicalized preferred value. The table is
+    a dictionary, hence a value is normalized in constant time regardless of the size of the table.
+
+    Attributes
+    ----------
+    __Canonicalizers : list
+        The canonicalizers. Each is a function of a string returning a string.
+
+    __Synonyms : dict
+        Maps each canonicalized synonym to its canonicalized preferred value.
+
+    Methods
+    -------
+    add_synonyms(synonyms)
+        Adds synonyms to the synonym table.
+
+    load_synonyms(path, delimiter)
+        Adds the synonyms of a csv file to the synonym table.
+
+    normalize(value)
+        Returns the normalized value.
+    """
+
+    def __init__(self, canonicalizers=(), synonyms: dict = None):
+        """
+        Initializes a new `Normalizer` object.
+
+        Parameters
+        ----------
+        canonicalizers : iterable, optional
+            Functions of a string returning a string, or names of the built-in canonicalizers CASEFOLD,
+            WHITESPACE and VERSION. Applied in order (default is an empty tuple).
+
+        synonyms : dict, optional
+            Maps synonyms to their preferred value (default is None).
+        """
+
+        self.__Canonicalizers = []
+        self.__Synonyms = {}
+
+        for canonicalizer in canonicalizers:
+
+            if isinstance(canonicalizer, str):
+
+                if canonicalizer not in _CANONICALIZERS:
+                    raise DataBaseInterfaceCanonicalizerException(canonicalizer)
+
+                canonicalizer = _CANONICALIZERS[canonicalizer]
+
+            self.__Canonicalizers.append(canonicalizer)
+
+        if synonyms:
+            self.add_synonyms(synonyms)
+
+    def __call__(self, value) -> str:
+
+        return self.normalize(value)
+
+    def add_synonyms(self, synonyms: dict):
+        """
+        Adds synonyms to the synonym table.
+
+        Parameters
+        ----------
+        synonyms : dict
+            Maps synonyms to their preferred value.
+        """
+
+        for synonym, value in synonyms.items():
+
+            self.__Synonyms[self.__canonicalize(synonym)] = self.__canonicalize(value)
+
+    def load_synonyms(self, path: str, delimiter: str = ','):
+        """
+        Adds the synonyms of a csv file to the synonym table.
+
+        Each row stores a preferred value followed by any number of its synonyms.
+
+        Parameters
+        ----------
+        path : str
+            The path of the csv file.
+
+        delimiter : str
+            The delimiter of the csv file (default is ',').
+        """
+
+        with open(path, newline='') as file:
+
+            for row in reader(file, delimiter=delimiter):
+
+                if row:
+                    self.add_synonyms({synonym: row[0] for synonym in row[1:] if synonym})
+
+    def normalize(self, value) -> str:
+        """
+        Returns the normalized value.
+
+        Parameters
+        ----------
+        value
+            A merge-property value.
+
+        Returns
+        -------
+        str
+            The canonicalized value or its canonicalized preferred value if it is a synonym.
+        """
+
+        value = self.__canonicalize(value)
+
+        return self.__Synonyms.get(value, value)
+
+    def __canonicalize(self, value) -> str:
+
+        value = str(value)
+
+        for canonicalizer in self.__Canonicalizers:
+            value = canonicalizer(value)
+
+        return value
+
+
+class MinHash:
+    """
+    MinHash sketch of the distinct values of a property.
+
+    Estimates the Jaccard similarity of the value sets of two properties from their signatures only.
+    Each value is hashed once to a 64-bit integer with BLAKE2b and mapped by `MINHASH_PERMUTATIONS`
+    random permutations of the 64-bit integers, of which the signature stores the minimum. Each
+    permutation multiplies by an odd factor and adds an offset modulo 2 ** 64, hence distinct hashes stay
+    distinct and n values only collide with a probability of about n ** 2 / 2 ** 65. The fraction of equal
+    minimums of two signatures is an unbiased estimate of the Jaccard similarity, with a standard error of
+    at most 1 / sqrt(permutations).
+    Sketches are updated page by page, hence value sets of any size are sketched in constant memory.
+
+    Attributes
+    ----------
+    __Signature : numpy.ndarray
+        The minimum of each permutation over all values.
+
+    __Factors : numpy.ndarray
+        The factors of the permutations.
+
+    __Offsets : numpy.ndarray
+        The offsets of the permutations.
+
+    Methods
+    -------
+    update(values)
+        Adds values to the sketch.
+
+    jaccard(other)
+        Returns the estimated Jaccard similarity of the value sets of two sketches.
+
+    union(other)
+        Returns the sketch of the union of the value sets of two sketches.
+
+    to_bytes()
+        Returns the signature as bytes.
+
+    from_bytes(signature)
+        Returns the sketch of a signature returned by `to_bytes`.
+    """
+
+    def __init__(self, permutations: int = MINHASH_PERMUTATIONS, seed: int = MINHASH_SEED):
+        """
+        Initializes a new empty `MinHash` object.
+
+        Parameters
+        ----------
+        permutations : int
+            The number of permutations (default is MINHASH_PERMUTATIONS).
+
+        seed : int
+            The seed of the permutations. Only sketches with equal seeds are comparable
+            (default is MINHASH_SEED).
+        """
+
+        state = numpy.random.RandomState(seed)
+
+        # Arithmetic on arrays of unsigned 64-bit integers wraps around modulo 2 ** 64.
+        self.__Factors = state.randint(0, 2 ** 64, size=permutations, dtype=numpy.uint64) | numpy.uint64(1)
+        self.__Offsets = state.randint(0, 2 ** 64, size=permutations, dtype=numpy.uint64)
+        self.__Signature = numpy.full(permutations, numpy.iinfo(numpy.uint64).max, dtype=numpy.uint64)
+
+    def update(self, values):
+        """
+        Adds values to the sketch.
+
+        Parameters
+        ----------
+        values : iterable
+            str or bytes. The values of one page.
+        """
+
+        hashes = numpy.fromiter((int.from_bytes(blake2b(value.encode(UTF_8) if isinstance(value, str) else value,
+                                                        digest_size=MINHASH_HASH_SIZE).digest(), 'little')
+                                 for value in values), dtype=numpy.uint64)
+
+        if len(hashes):
+
+            permuted = numpy.outer(hashes, self.__Factors) + self.__Offsets
+            self.__Signature = numpy.minimum(self.__Signature, permuted.min(axis=0))
+
+    def jaccard(self, other: 'MinHash') -> float:
+        """
+        Returns the estimated Jaccard similarity of the value sets of two sketches.
+
+        Parameters
+        ----------
+        other : MinHash
+            A sketch with the same number of permutations and seed.
+
+        Returns
+        -------
+        float
+            The estimated Jaccard similarity between 0 and 1.
+        """
+
+        return float(numpy.mean(self.__Signature == other.__Signature))
+
+    def union(self, other: 'MinHash') -> 'MinHash':
+        """
+        Returns the sketch of the union of the value sets of two sketches.
+
+        Parameters
+        ----------
+        other : MinHash
+            A sketch with the same number of permutations and seed.
+
+        Returns
+        -------
+        MinHash
+            The sketch of the union, as if all values of both sketches were added to one sketch.
+        """
+
+        sketch = copy(self)
+        sketch.__Signature = numpy.minimum(self.__Signature, other.__Signature)
+
+        return sketch
+
+    def to_bytes(self) -> bytes:
+        """
+        Returns the signature as bytes.
+
+        Returns
+        -------
+        bytes
+            The signature as little-endian unsigned 64-bit integers.
+        """
+
+        return self.__Signature.astype('<u8').tobytes()
+
+    @staticmethod
+    def from_bytes(signature: bytes, seed: int = MINHASH_SEED) -> 'MinHash':
+        """
+        Returns the sketch of a signature returned by `to_bytes`.
+
+        Parameters
+        ----------
+        signature : bytes
+            The signature.
+
+        seed : int
+            The seed of the permutations of the signature (default is MINHASH_SEED).
+
+        Returns
+        -------
+        MinHash
+            The sketch.
+        """
+
+        values = numpy.frombuffer(signature, dtype='<u8').astype(numpy.uint64)
+        sketch = MinHash(len(values), seed)
+        sketch.__Signature = values
+
+        return sketch
+
+
+def flatten_keys(selection: list) -> list:
+    """
+    Returns the properties of a selection of merge keys.
+
+    Parameters
+    ----------
+    selection : list
+        The merge keys. Each key is either a property or a tuple of properties (composite key).
+
+    Returns
+    -------
+    list
+        The properties of all keys in order.
+    """
+
+    return [property_ for key in selection for property_ in ((key,) if isinstance(key, str) else key)]
+
+
+def encode_key(key) -> str:
+    """
+    Encodes a merge key or a value of a merge key as string.
+
+    Composite keys and their values are tuples. They are joined with `COMPOSITE_SEPARATOR` to be stored as
+    merged value or with a merge manifest. Values are unified as tuples, hence the encoding does not affect
+    which vertices are merged.
+
+    Parameters
+    ----------
+    key : str or tuple
+        The key or value.
+
+    Returns
+    -------
+    str
+        The encoded key or value.
+    """
+
+    return key if isinstance(key, str) else COMPOSITE_SEPARATOR.join([str(part) for part in key])
+
+
+def decode_key(key: str):
+    """
+    Decodes a merge key encoded by `encode_key`.
+
+    Parameters
+    ----------
+    key : str
+        The encoded key.
+
+    Returns
+    -------
+    str or tuple
+        A property or a tuple of properties.
+    """
+
+    return tuple(key.split(COMPOSITE_SEPARATOR)) if COMPOSITE_SEPARATOR in key else key
+
+
+def join_values(values) -> str:
+    """
+    Joins the merge-property values of a subset to its merged value.
+
+    Parameters
+    ----------
+    values : iterable
+        The values. Values of composite keys are tuples.
+
+    Returns
+    -------
+    str
+        The sorted, encoded values joined with `MERGE_SEPARATOR`.
+    """
+
+    return MERGE_SEPARATOR.join(sorted([encode_key(value) for value in values]))
+
+
+def merge_column(values: list, policy: str = CONCAT_POLICY) -> str:
+    """
+    Merges the values of one property of a bucket of entities.
+
+    The following policies are supported:
+    - CONCAT_POLICY joins all values with `MERGE_SEPARATOR`.
+    - FIRST_POLICY keeps the first value.
+    - DISTINCT_POLICY joins the sorted distinct values with `MERGE_SEPARATOR`. Values that are already
+      joined are split first, hence the policy may be applied to merged values again.
+    - COUNT_POLICY counts the values.
+    - MIN_POLICY, MAX_POLICY and MEAN_POLICY aggregate the numeric values. Other values are ignored.
+
+    Except for CONCAT_POLICY, empty and `NULL` values are ignored. An empty string is returned if no value
+    remains, which is stored as missing value by the bulk upload.
+
+    Parameters
+    ----------
+    values : list
+        The values of the property.
+
+    policy : str
+        The merge policy (default is CONCAT_POLICY).
+
+    Returns
+    -------
+    str
+        The merged value.
+    """
+
+    if policy == CONCAT_POLICY:
+        return MERGE_SEPARATOR.join([str(value) for value in values])
+
+    values = [str(value) for value in values if value not in ('', NULL, None)]
+
+    if policy == FIRST_POLICY:
+        return values[0] if values else ''
+
+    elif policy == DISTINCT_POLICY:
+        return MERGE_SEPARATOR.join(sorted(set(part for value in values
+                                              for part in value.split(MERGE_SEPARATOR)).difference(['', NULL])))
+
+    elif policy == COUNT_POLICY:
+        return str(len(values))
+
+    numbers = []
+    for value in values:
+
+        try:
+            numbers.append(float(value))
+
+        except ValueError:
+            pass
+
+    if not numbers:
+        return ''
+
+    elif policy == MIN_POLICY:
+        return _format_number(min(numbers))
+
+    elif policy == MAX_POLICY:
+        return _format_number(max(numbers))
+
+    else:
+        return _format_number(sum(numbers) / len(numbers))
+
+
+def merge_entities(entities: list, properties, policies: dict = None) -> dict:
+    """
+    Merges a bucket of entities into one entity.
+
+    Each property is merged as one column of values with `merge_column`.
+
+    Parameters
+    ----------
+    entities : list
+        A list of dictionaries. Represents the entities to merge.
+
+    properties : iterable
+        The properties to merge.
+
+    policies : dict, optional
+        Maps properties to their merge policy. Other properties are concatenated (default is None).
+
+    Returns
+    -------
+    dict
+        The merged entity.
+    """
+
+    policies = policies or {}
+
+    return {property_: merge_column([entity[property_] for entity in entities if property_ in entity],
+                                    policies.get(property_, CONCAT_POLICY))
+            for property_ in properties}
+
+
+def merge_parallel(assignments: dict, edges: list, disjoint_set: DisjointSet, merged_values: dict,
+                   vertex_properties: set, edge_properties: set, merge_property_name: str, selection: list,
+                   policies: dict = None, workers: int = None) -> dict:
+    """
+    Parallel merge kernel.
+
+    Builds the merged vertices and edges of a merge graph with a pool of worker processes (map-reduce).
+    The merged IDs are assigned in the calling process, as the subsets of the disjoint set are global.
+    Each entity is appended to the run file of its partition, chosen by the hash of its merged ID (vertices)
+    or merged source ID (edges), hence every merged entity is built by exactly one worker. Each worker
+    receives only the paths of the run files of its partition and loads its entities itself. The merged
+    entities of all partitions are concatenated afterwards. The assignment of merged IDs and the writing of
+    the run files remain serial and bound the speedup. The pool uses the spawn start method, as forking a
+    process with running threads is unsafe.
+
+    Parameters
+    ----------
+    assignments : dict
+        Maps each vertex ID to a tuple of the vertex and its element of the disjoint set.
+
+    edges : list
+        A list of dictionaries. Represents the queried edges.
+
+    disjoint_set : DisjointSet
+        The unified merge-property values.
+
+    merged_values : dict
+        Maps the root of each subset to the list of its merge-property values.
+
+    vertex_properties : set
+        The vertex properties to merge.
+
+    edge_properties : set
+        The edge properties to merge.
+
+    merge_property_name : str
+        The name of the new merge-property. Also used as prefix for the merged IDs.
+
+    selection : list
+        The selected merge-properties. Set to NULL for each merged vertex.
+
+    policies : dict, optional
+        Maps properties to their merge policy. Other properties are concatenated (default is None).
+
+    workers : int, optional
+        The number of worker processes (default is the number of CPUs).
+
+    Returns
+    -------
+    dict
+        A dictionary storing two lists of dictionaries. Represents the merged vertices and edges.
+    """
+
+    workers = workers or cpu_count() or 1
+    partition_count = workers * PARTITIONS_PER_WORKER
+
+    try:
+        mkdir(WORK_DIRECTORY)
+    except FileExistsError:
+        pass
+
+    graph = {VERTEX: [], EDGE: []}
+
+    with TemporaryDirectory(dir=WORK_DIRECTORY) as directory:
+
+        runs = [(join(directory, str(partition) + NODES + RUN_FILE), join(directory, str(partition) + EDGES + RUN_FILE))
+                for partition in range(partition_count)]
+
+        with ExitStack() as stack:
+
+            run_files = [(stack.enter_context(open(vertex_run, 'w')), stack.enter_context(open(edge_run, 'w')))
+                         for vertex_run, edge_run in runs]
+
+            # The merged value of a bucket is written once, with the first vertex of the bucket.
+            merged_ids = {}
+            vertex_ids = {}
+            for vertex_id, (vertex, element) in assignments.items():
+
+                root = disjoint_set.find(element)
+                merged_value = None
+
+                if root not in merged_ids:
+
+                    merged_ids[root] = merge_property_name + str(len(merged_ids))
+                    merged_value = join_values(merged_values.get(root, [NULL]))
+
+                _partition(run_files, merged_ids[root])[0].write(dumps([merged_ids[root], merged_value, vertex]) + '\n')
+                vertex_ids[vertex_id] = merged_ids[root]
+
+            for edge in edges:
+
+                edge[SOURCE] = vertex_ids[edge[SOURCE]]
+                edge[TARGET] = vertex_ids[edge[TARGET]]
+
+                _partition(run_files, edge[SOURCE])[1].write(dumps(edge) + '\n')
+
+        del merged_ids, vertex_ids
+
+        with ProcessPoolExecutor(max_workers=workers, mp_context=get_context('spawn')) as executor:
+
+            merge_partition = partial(_merge_partition, vertex_properties=vertex_properties,
+                                      edge_properties=edge_properties, merge_property_name=merge_property_name,
+                                      selection=selection, policies=policies or {})
+
+            for merged_vertices, merged_edges in executor.map(merge_partition, runs):
+
+                graph[VERTEX].extend(merged_vertices)
+                graph[EDGE].extend(merged_edges)
+
+    return graph
+
+
+def merge_columnar(assignments: dict, edges: list, disjoint_set: DisjointSet, merged_values: dict,
+                   vertex_properties: set, edge_properties: set, merge_property_name: str, selection: list,
+                   policies: dict = None) -> dict:
+    """
+    Columnar merge kernel.
+
+    Builds the merged vertices and edges of a merge graph with NumPy. The roots of the subsets and the
+    vertex IDs are dictionary-encoded as integer codes. Bucket assignment, remapping of edge endpoints and
+    deduplication of edges are computed as vectorized unique/sort operations on the codes, and the
+    properties are merged column by column, see `_merge_columns`.
+
+    Parameters
+    ----------
+    assignments : dict
+        Maps each vertex ID to a tuple of the vertex and its element of the disjoint set.
+
+    edges : list
+        A list of dictionaries. Represents the queried edges.
+
+    disjoint_set : DisjointSet
+        The unified merge-property values.
+
+    merged_values : dict
+        Maps the root of each subset to the list of its merge-property values.
+
+    vertex_properties : set
+        The vertex properties to merge.
+
+    edge_properties : set
+        The edge properties to merge.
+
+    merge_property_name : str
+        The name of the new merge-property. Also used as prefix for the merged IDs.
+
+    selection : list
+        The selected merge-properties. Set to NULL for each merged vertex.
+
+    policies : dict, optional
+        Maps properties to their merge policy. Other properties are concatenated (default is None).
+
+    Returns
+    -------
+    dict
+        A dictionary storing two lists of dictionaries. Represents the merged vertices and edges.
+    """
+
+    vertices = [vertex for vertex, element in assignments.values()]
+    vertex_codes = {vertex_id: code for code, vertex_id in enumerate(assignments)}
+
+    # Roots are encoded in order of their first occurrence.
+    root_codes = {}
+    bucket_codes = numpy.fromiter((root_codes.setdefault(disjoint_set.find(element), len(root_codes))
+                                   for vertex, element in assignments.values()),
+                                  dtype=numpy.int64, count=len(assignments))
+    roots = list(root_codes)
+    bucket_count = len(roots)
+
+    sources = numpy.fromiter((vertex_codes[edge[SOURCE]] for edge in edges), dtype=numpy.int64, count=len(edges))
+    targets = numpy.fromiter((vertex_codes[edge[TARGET]] for edge in edges), dtype=numpy.int64, count=len(edges))
+
+    # Each pair of source and target bucket is encoded as one integer.
+    pairs, edge_codes = numpy.unique(bucket_codes[sources] * bucket_count + bucket_codes[targets],
+                                     return_inverse=True)
+
+    merged_ids = [merge_property_name + str(code) for code in range(bucket_count)]
+
+    merged_vertices = _merge_columns(vertices, vertex_properties, bucket_codes, bucket_count, policies or {})
+
+    for code, merged_vertex in enumerate(merged_vertices):
+
+        merged_vertex[ID] = merged_ids[code]
+        merged_vertex[merge_property_name] = join_values(merged_values.get(roots[code], [NULL]))
+
+        for property_ in selection:
+            merged_vertex[property_] = NULL
+
+    merged_edges = _merge_columns(edges, edge_properties.difference([SOURCE, TARGET]), edge_codes, len(pairs),
+                                  policies or {})
+
+    for merged_edge, source, target in zip(merged_edges, pairs // bucket_count, pairs % bucket_count):
+
+        merged_edge[SOURCE] = merged_ids[source]
+        merged_edge[TARGET] = merged_ids[target]
+
+    return {VERTEX: merged_vertices, EDGE: merged_edges}
+
+
+def _merge_columns(entities: list, properties: set, codes: 'numpy.ndarray', count: int, policies: dict) -> list:
+    """
+    Merges the properties of all entities sharing a code.
+
+    Entities are grouped by a stable sort of their codes. For each property the column of present values
+    is sorted once and reduced at the group boundaries. FIRST_POLICY, COUNT_POLICY, MIN_POLICY,
+    MAX_POLICY and MEAN_POLICY are reduced with NumPy. CONCAT_POLICY and DISTINCT_POLICY join strings,
+    hence their groups are joined one by one in Python.
+
+    Parameters
+    ----------
+    entities : list
+        A list of dictionaries. Represents the entities to merge.
+
+    properties : set
+        The properties to merge.
+
+    codes : numpy.ndarray
+        The code of each entity. Has to cover all integers from 0 to count - 1.
+
+    count : int
+        The number of distinct codes.
+
+    policies : dict
+        Maps properties to their merge policy.
+
+    Returns
+    -------
+    list
+        A list of dictionaries. Represents the merged entity of each code.
+    """
+
+    merged_entities = [{} for code in range(count)]
+
+    if not count:
+        return merged_entities
+
+    order = numpy.argsort(codes, kind='stable')
+    sorted_codes = codes[order]
+
+    for property_ in properties:
+
+        policy = policies.get(property_, CONCAT_POLICY)
+        column = [entities[index].get(property_) for index in order]
+
+        if policy == CONCAT_POLICY:
+            present = numpy.fromiter((value is not None for value in column), dtype=bool, count=len(column))
+
+        elif policy in (MIN_POLICY, MAX_POLICY, MEAN_POLICY):
+            numbers = numpy.fromiter((_parse_number(value) for value in column), dtype=float, count=len(column))
+            present = ~numpy.isnan(numbers)
+
+        else:
+            present = numpy.fromiter((value not in ('', NULL, None) for value in column), dtype=bool,
+                                     count=len(column))
+
+        # The groups of codes with at least one present value and the index of their first value.
+        group_codes, starts = numpy.unique(sorted_codes[present], return_index=True)
+        merged_column = numpy.full(count, '', dtype=object)
+
+        if policy == FIRST_POLICY:
+            merged_column[group_codes] = [str(column[index]) for index in numpy.flatnonzero(present)[starts]]
+
+        elif policy == COUNT_POLICY:
+            merged_column = numpy.bincount(sorted_codes[present], minlength=count).astype(str).astype(object)
+
+        elif policy in (MIN_POLICY, MAX_POLICY, MEAN_POLICY) and len(group_codes):
+
+            values = numbers[present]
+
+            if policy == MIN_POLICY:
+                reduced = numpy.minimum.reduceat(values, starts)
+
+            elif policy == MAX_POLICY:
+                reduced = numpy.maximum.reduceat(values, starts)
+
+            else:
+                reduced = numpy.add.reduceat(values, starts) / numpy.diff(numpy.append(starts, len(values)))
+
+            merged_column[group_codes] = [_format_number(float(number)) for number in reduced]
+
+        elif policy in (CONCAT_POLICY, DISTINCT_POLICY):
+
+            values = [column[index] for index in numpy.flatnonzero(present)]
+
+            for code, start, end in zip(group_codes, starts, numpy.append(starts[1:], len(values))):
+                merged_column[code] = merge_column(values[start:end], policy)
+
+        for merged_entity, value in zip(merged_entities, merged_column):
+            merged_entity[property_] = value
+
+    return merged_entities
+
+
+def _partition(partitions: list, merged_id: str) -> tuple:
+
+    return partitions[crc32(merged_id.encode(UTF_8)) % len(partitions)]
+
+
+def _merge_partition(partition: tuple, vertex_properties: set, edge_properties: set, merge_property_name: str,
+                     selection: list, policies: dict) -> tuple:
+    """
+    Builds the merged vertices and edges of one partition. Runs in a worker process of `merge_parallel`.
+
+    Parameters
+    ----------
+    partition : tuple
+        The paths of the vertex and edge run files of the partition, as written by `merge_parallel`.
+
+    vertex_properties : set
+        The vertex properties to merge.
+
+    edge_properties : set
+        The edge properties to merge.
+
+    merge_property_name : str
+        The name of the new merge-property.
+
+    selection : list
+        The selected merge-properties. Set to NULL for each merged vertex.
+
+    policies : dict
+        Maps properties to their merge policy.
+
+    Returns
+    -------
+    tuple
+        Two lists of dictionaries. Represent the merged vertices and edges of the partition.
+    """
+
+    vertex_run, edge_run = partition
+    buckets = {}
+    edge_buckets = {}
+
+    with open(vertex_run) as vertices:
+        for line in vertices:
+            merged_id, merged_value, vertex = loads(line)
+            buckets.setdefault(merged_id, ([], merged_value))[0].append(vertex)
+
+    with open(edge_run) as edges:
+        for line in edges:
+            edge = loads(line)
+            edge_buckets.setdefault((edge[SOURCE], edge[TARGET]), []).append(edge)
+
+    merged_vertices = []
+    merged_edges = []
+
+    for merged_id, (vertices, merged_value) in buckets.items():
+
+        merged_vertex = merge_entities(vertices, vertex_properties, policies)
+        merged_vertex[ID] = merged_id
+        merged_vertex[merge_property_name] = merged_value
+
+        for property_ in selection:
+            merged_vertex[property_] = NULL
+
+        merged_vertices.append(merged_vertex)
+
+    for (source, target), edges in edge_buckets.items():
+
+        merged_edge = merge_entities(edges, edge_properties.difference([SOURCE, TARGET]), policies)
+        merged_edge[SOURCE] = source
+        merged_edge[TARGET] = target
+
+        merged_edges.append(merged_edge)
+
+    return merged_vertices, merged_edges
+
+
+_VERSION_SUFFIX = compile(VERSION_SUFFIX)
+
+_CANONICALIZERS = {
+    CASEFOLD: str.casefold,
+    WHITESPACE: lambda value: ' '.join(value.split()),
+    VERSION: lambda value: _VERSION_SUFFIX.sub('', value)
+}
+
+
+def _parse_number(value) -> float:
+
+    try:
+        return float(value)
+
+    except (TypeError, ValueError):
+        return numpy.nan
+
+
+def _format_number(number: float) -> str:
+
+    return str(int(number)) if number.is_integer() else str(number)
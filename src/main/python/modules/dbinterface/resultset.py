@@ -0,0 +1,344 @@
+"""
+Script to store the result set used by the dbinterface module to read responses of OpenCypher queries.
+"""
+
+from modules.dbinterface.constants import ID, SOURCE, TARGET, UTF_8, NULL, DATA_SEPARATOR, MERGE_SEPARATOR, \
+    DISPLAY_SEPARATOR
+
+
+class ResultSet:
+    """
+    Lazily decoded response of a OpenCypher query.
+
+    Keeps the raw response of `GRAPH.QUERY` and decodes a cell only once it is accessed. Only the
+    header is decoded on construction. The columns of the response are grouped by their binder, e.g.
+    the header `vertex.id, vertex.name` describes the binder `vertex` with the keys `id` and `name`.
+    Entities are deduplicated by their key columns before their remaining cells are decoded, hence
+    vertices returned on many rows are built once.
+
+    Attributes
+    ----------
+    Header : list
+        The decoded header, each entry a tuple of binder and key.
+
+    __Rows : list
+        The raw rows of the response.
+
+    __Binders : dict
+        Maps each binder to a dictionary mapping its keys to their column index.
+
+    Methods
+    -------
+    binders()
+        Returns the binders of the response.
+
+    keys(binder)
+        Returns the keys of a binder.
+
+    column(binder, key)
+        Iterates the decoded cells of a column.
+
+    rows()
+        Iterates views of the rows.
+
+    entities(binder, *keys)
+        Returns the entities of a binder as dictionaries.
+
+    split()
+        Returns the vertices and edges of the response.
+    """
+
+    def __init__(self, response: list):
+        """
+        Initializes a new `ResultSet` object.
+
+        Parameters
+        ----------
+        response : list
+            A response of `GRAPH.QUERY`. The first row is the header, cells may be bytes or str.
+        """
+
+        self.Header = [tuple(_decode(name).partition('.')[::2]) for name in response[0]] if response else []
+        self.__Rows = response[1:]
+        self.__Binders = {}
+
+        for index, (binder, key) in enumerate(self.Header):
+            self.__Binders.setdefault(binder, {})[key] = index
+
+    def __len__(self) -> int:
+
+        return len(self.__Rows)
+
+    def binders(self) -> list:
+        """
+        Returns the binders of the response.
+
+        Returns
+        -------
+        list
+            The binders in order of their first column.
+        """
+
+        return list(self.__Binders)
+
+    def keys(self, binder: str) -> list:
+        """
+        Returns the keys of a binder.
+
+        Parameters
+        ----------
+        binder : str
+            The binder.
+
+        Returns
+        -------
+        list
+            The keys in order of their columns.
+        """
+
+        return list(self.__Binders[binder])
+
+    def column(self, binder: str, key: str):
+        """
+        Iterates the decoded cells of a column.
+
+        Parameters
+        ----------
+        binder : str
+            The binder of the column.
+
+        key : str
+            The key of the column.
+
+        Yields
+        ------
+        str
+            The decoded cell of each row.
+        """
+
+        index = self.__Binders[binder][key]
+
+        for row in self.__Rows:
+            yield _decode(row[index])
+
+    def rows(self):
+        """
+        Iterates views of the rows.
+
+        Yields
+        ------
+        RowView
+            A view of each row, decoding cells on access.
+        """
+
+        for row in self.__Rows:
+            yield RowView(row, self.__Binders)
+
+    def entities(self, binder: str, *keys: str) -> list:
+        """
+        Returns the entities of a binder as dictionaries.
+
+        Parameters
+        ----------
+        binder : str
+            The binder of the entities.
+
+        keys : str
+            The keys identifying an entity. Rows repeating the cells of these columns are skipped
+            without decoding their other cells. No rows are skipped if no key is given.
+
+        Returns
+        -------
+        list
+            A list of dictionaries. Represents the entities in order of their first row.
+        """
+
+        columns = self.__Binders[binder]
+        identifiers = [columns[key] for key in keys]
+        seen = set()
+        entities = []
+
+        for row in self.__Rows:
+
+            if identifiers:
+
+                identifier = tuple(row[index] for index in identifiers)
+
+                if identifier in seen:
+                    continue
+
+                seen.add(identifier)
+
+            entities.append({key: _decode(row[index]) for key, index in columns.items()})
+
+        return entities
+
+    def split(self) -> tuple:
+        """
+        Returns the vertices and edges of the response.
+
+        Binders with an `id` column are read as vertices, binders with a `source` and `target` column
+        as edges. Vertices are deduplicated by `id` and edges by `source` and `target` across binders.
+
+        Returns
+        -------
+        tuple
+            A tuple of two lists of dictionaries. Represents vertices and edges.
+        """
+
+        vertices = {}
+        edges = {}
+
+        for binder, columns in self.__Binders.items():
+
+            if ID in columns:
+
+                for vertex in self.__unseen(binder, (ID,), vertices):
+                    vertices[vertex[ID]] = vertex
+
+            if SOURCE in columns and TARGET in columns:
+
+                for edge in self.__unseen(binder, (SOURCE, TARGET), edges):
+                    edges[(edge[SOURCE], edge[TARGET])] = edge
+
+        return list(vertices.values()), list(edges.values())
+
+    def __unseen(self, binder: str, keys: tuple, seen: dict):
+
+        columns = self.__Binders[binder]
+        identifiers = [columns[key] for key in keys]
+
+        for row in self.__Rows:
+
+            # Vertices are identified by their ID, edges by the pair of their source and target.
+            identifier = _decode(row[identifiers[0]]) if len(identifiers) == 1 else \
+                tuple(_decode(row[index]) for index in identifiers)
+
+            if identifier not in seen:
+
+                # Marks the identifier before the entity is built, as rows may repeat it.
+                seen[identifier] = None
+
+                yield {key: _decode(row[index]) for key, index in columns.items()}
+
+
+class RowView:
+    """
+    View of one row of a `ResultSet`.
+
+    Cells are decoded on access only.
+
+    Methods
+    -------
+    get(binder, key, default)
+        Returns the decoded cell of a column.
+
+    entity(binder)
+        Returns the cells of a binder as dictionary.
+    """
+
+    def __init__(self, row: list, binders: dict):
+
+        self.__Row = row
+        self.__Binders = binders
+
+    def __getitem__(self, name: str) -> str:
+
+        binder, key = name.split('.', 1)
+
+        return _decode(self.__Row[self.__Binders[binder][key]])
+
+    def get(self, binder: str, key: str, default=None):
+        """
+        Returns the decoded cell of a column.
+
+        Parameters
+        ----------
+        binder : str
+            The binder of the column.
+
+        key : str
+            The key of the column.
+
+        default : optional
+            Returned if the column does not exist (default is None).
+
+        Returns
+        -------
+        str
+            The decoded cell.
+        """
+
+        try:
+            return _decode(self.__Row[self.__Binders[binder][key]])
+
+        except KeyError:
+            return default
+
+    def entity(self, binder: str) -> dict:
+        """
+        Returns the cells of a binder as dictionary.
+
+        Parameters
+        ----------
+        binder : str
+            The binder.
+
+        Returns
+        -------
+        dict
+            Maps the keys of the binder to their decoded cells.
+        """
+
+        return {key: _decode(self.__Row[index]) for key, index in self.__Binders[binder].items()}
+
+
+def revise_response(response: list) -> list:
+    """
+    Revises a response of `GRAPH.QUERY` for display.
+
+    Graph prefixes are dropped from the keys of the header, merged values are unified and joined
+    by `DISPLAY_SEPARATOR` and columns holding no value on any row are dropped. The values are
+    revised in one pass, only merged values are split. Empty columns are found by one scan of the
+    columns and dropped with one selection per row.
+
+    Parameters
+    ----------
+    response : list
+        A response of `GRAPH.QUERY`. Revised in place.
+
+    Returns
+    -------
+    list
+        The revised response.
+    """
+
+    header = ['_'.join([key.replace('e_', '').replace('v_', '') for key in _decode(name).split(DATA_SEPARATOR)])
+              for name in response[0]]
+    rows = [[_revise_value(value) if MERGE_SEPARATOR in value else '' if value == NULL else value
+             for value in map(_decode, row)]
+            for row in response[1:]]
+
+    # Empty strings are falsy, hence a column holds a value if any of its cells is truthy.
+    kept = [index for index, column in enumerate(zip(*rows)) if any(column)]
+
+    if len(kept) == len(header):
+
+        response[:] = [header] + rows
+
+    else:
+
+        response[:] = [[header[index] for index in kept]] + [[row[index] for index in kept] for row in rows]
+
+    return response
+
+
+def _revise_value(value: str) -> str:
+
+    # Merged values are unified in order of their first occurrence.
+    return DISPLAY_SEPARATOR.join([part for part in dict.fromkeys(value.split(MERGE_SEPARATOR)) if part != NULL])
+
+
+def _decode(value) -> str:
+
+    return value.decode(UTF_8) if isinstance(value, bytes) else value
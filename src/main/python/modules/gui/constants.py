@@ -24,6 +24,11 @@ ICON_SIZE_MENU = 15
 TASK_QUEUE_INTERVAL = 600
 CONTAINER_UPDATE_INTERVAL = 0.6
 WIDGET_UPDATE_INTERVAL = 200
+TABLE_WINDOW = 50
+TABLE_ROW_HEIGHT = 20
+TABLE_SCROLL_UNITS = 3
+MOVETO = 'moveto'
+PAGES = 'pages'
 
 ICON_PATH = 'resources/icons.zip'
 BITMAP_PATH = 'resources/icon.ico'
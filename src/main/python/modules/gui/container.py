@@ -1,4 +1,7 @@
+from concurrent.futures import CancelledError
 from modules.gui.constants import CONNECTION_STATUS, DISCONNECTED, QUERY_STATUS, NO_QUERY, CONNECTED, NEW_QUERY, ACTIVE
+from modules.dbinterface.constants import QUERY_TIMEOUT
+from modules.dbinterface.exceptons import DataBaseInterfaceViewException
 
 
 class DataBaseStatus:
@@ -15,6 +18,9 @@ class DataBaseStatus:
     DBInterface : DataBaseInterface
         Interface to communicate with a database.
 
+    AsyncDBInterface : AsyncDataBaseInterface
+        Interface to query a database on an event loop. Queries are sent by `DBInterface` if None.
+
     FileInterface : FileInterface
         Interface to handle import/export of files.
 
@@ -27,6 +33,10 @@ class DataBaseStatus:
     DBProperties : tuple
         Tuple of two lists. [0] node properties. [1] edge properties.
 
+    DBOverlaps : dict
+        Maps sketched node properties to the property of another graph they overlap most with and the
+        estimated Jaccard similarity.
+
     UserSelection : list
         Properties selected by the user.
 
@@ -36,6 +46,9 @@ class DataBaseStatus:
     DBStatus: dict
         Status information of a database; if a connection is established; if a query is responded.
 
+    PendingQuery : Future
+        The future of the running query sent by `AsyncDBInterface`, if any.
+
     Methods
     -------
     shift_key(key)
@@ -49,9 +62,19 @@ class DataBaseStatus:
 
     request_query_response()
         Sends a query-response request to the database.
+
+    cancel_query()
+        Cancels the running query.
+
+    connect(host, port)
+        Connects the interfaces to a database.
+
+    disconnect()
+        Disconnects the interfaces from a database.
     """
 
-    def __init__(self, db_interface: 'DataBaseInterface', file_interface: 'FileInterface'):
+    def __init__(self, db_interface: 'DataBaseInterface', file_interface: 'FileInterface',
+                 async_interface: 'AsyncDataBaseInterface' = None):
         """
         Initializes a new `DataBaseStatus` object.
 
@@ -62,13 +85,19 @@ class DataBaseStatus:
 
         file_interface : FileInterface
             Instance of `FileInterface`
+
+        async_interface : AsyncDataBaseInterface, optional
+            Instance of `AsyncDataBaseInterface`, used to send cancellable queries (default is None).
         """
 
         self.DBInterface = db_interface
+        self.AsyncDBInterface = async_interface
+        self.PendingQuery = None
         self.FileInterface = file_interface
         self.DBKeys = set()
         self.DBActiveKey = None
         self.DBProperties = ([], [])
+        self.DBOverlaps = {}
         self.UserSelection = []
         self.DBQuery = None
         self.DBStatus = {CONNECTION_STATUS: DISCONNECTED, QUERY_STATUS: NO_QUERY}
@@ -128,6 +157,7 @@ class DataBaseStatus:
             self.DBKeys = set(self.DBInterface.db_get_keys()).union(self.DBKeys)
             self.DBKeys.discard(self.DBActiveKey)
             self.DBProperties = self.DBInterface.db_get_attributes()
+            self.DBOverlaps = self.DBInterface.db_get_overlaps()
 
         elif self.DBStatus[CONNECTION_STATUS] == ACTIVE and not client_status:
 
@@ -135,18 +165,92 @@ class DataBaseStatus:
             self.DBKeys = set()
             self.DBActiveKey = None
             self.DBProperties = ([], [])
+            self.DBOverlaps = {}
+
+    def connect(self, host: str, port: str):
+        """
+        Connects the interfaces to the database specified with host and port.
+
+        Parameters
+        ----------
+        host : str
+            String to identify a host.
+
+        port : str
+            String to identify a port.
+        """
+
+        self.DBInterface.client_connect(host, port)
+
+        if self.AsyncDBInterface:
+
+            self.AsyncDBInterface.client_connect(host, port, self.DBInterface.client_get_cache(),
+                                                 self.DBInterface.client_get_reader())
+
+    def disconnect(self):
+        """
+        Disconnects the interfaces from the database.
+        """
+
+        self.cancel_query()
+
+        if self.AsyncDBInterface:
+
+            self.AsyncDBInterface.client_disconnect()
+
+        self.DBInterface.client_disconnect()
 
     def request_query_response(self, query: str):
         """
         Requests a query response from the `DBInterface`.
 
-        Invokes a query against the connected database and updates status information.
+        Invokes a query against the connected database and updates status information. Queries are
+        sent by `AsyncDBInterface` if set, which times them out after `QUERY_TIMEOUT` milliseconds
+        and allows to cancel them with `cancel_query`. Virtual merge graphs are always queried by
+        `DBInterface`, which federates the query over their source graphs.
         """
 
-        self.DBQuery = self.DBInterface.db_query(query, self.DBActiveKey, to_graph=True)
+        if self.AsyncDBInterface:
+
+            self.PendingQuery = self.AsyncDBInterface.submit(
+                self.AsyncDBInterface.db_query(query, self.DBActiveKey, to_graph=True, timeout=QUERY_TIMEOUT)
+            )
+
+            try:
+                self.DBQuery = self.PendingQuery.result()
+
+            except CancelledError:
+                return
+
+            except DataBaseInterfaceViewException:
+                self.DBQuery = self.DBInterface.db_query(query, self.DBActiveKey, to_graph=True)
+
+            finally:
+                self.PendingQuery = None
+
+        else:
+
+            self.DBQuery = self.DBInterface.db_query(query, self.DBActiveKey, to_graph=True)
 
         self.DBStatus[QUERY_STATUS] = NEW_QUERY
 
+    def cancel_query(self) -> bool:
+        """
+        Cancels the running query.
+
+        The query stops occupying a connection of the client. Read queries are stopped by the database
+        once their timeout expired.
+
+        Returns
+        -------
+        bool
+            True if a running query was cancelled.
+        """
+
+        pending = self.PendingQuery
+
+        return pending is not None and pending.cancel()
+
     def annotate_query(self, target_property, map_property, dictionaries):
         """
         Stores additional information to a query.
@@ -156,7 +156,8 @@ class ThreadManager:
     """
     Manages threading of none-GUI-internal tasks.
 
-    Manages a `Queue` of open tasks and initializes new threads if tasks are available.
+    Manages a `Queue` of open tasks and initializes new threads if tasks are available. Manages a second
+    `Queue` of callbacks, which tasks use to run dialogs and widget updates on the Tkinter `mainloop()`.
     """
 
     def __init__(self):
@@ -165,15 +166,27 @@ class ThreadManager:
         """
 
         self.__TaskQueue = Queue()
+        self.__CallbackQueue = Queue()
 
     def check_open_tasks(self):
         """
         Check for open tasks.
 
+        Runs all open callbacks first, as `check_open_tasks` is invoked from the Tkinter `mainloop()`.
         Checks if a open task is in the queue. If a task is open initializes a new thread to execute this task.
         If no task is open `Queue` will raise a Empty exception. This exception is caught silently.
         """
 
+        while True:
+
+            try:
+                callback = self.__CallbackQueue.get_nowait()
+
+            except Empty:
+                break
+
+            self.__catch_callback_exceptions(callback[0], callback[1])
+
         try:
 
             task = self.__TaskQueue.get_nowait()
@@ -207,6 +220,48 @@ class ThreadManager:
 
         self.__TaskQueue.put((target, arg_tuple))
 
+    def stack_callback(self, target, arg_tuple: tuple):
+        """
+        Puts a new callback on the queue.
+
+        Callbacks are run on the Tkinter `mainloop()` with the next `check_open_tasks`. Tasks running in
+        other threads stack callbacks to open dialogs or update widgets, as Tkinter is not thread-safe.
+
+        Parameters
+        ----------
+        target
+            The target function to execute.
+
+        arg_tuple : tuple
+            A tuple of all arguments the target function should be called with.
+        """
+
+        self.__CallbackQueue.put((target, arg_tuple))
+
+    @staticmethod
+    def __catch_callback_exceptions(target, arg_tuple: tuple):
+        """
+        Catches an exception raised in a callback.
+
+        The exception is not raised again, as it would stop `GUIManager` from checking open tasks.
+
+        Parameters
+        ----------
+        target
+            The target function to execute.
+
+        arg_tuple : tuple
+            A tuple of all arguments the target function should be called with.
+        """
+
+        try:
+
+            target(*arg_tuple)
+
+        except Exception:
+
+            alarm('Exception', 'An exception occurred \n\n' + format_exc())
+
     @staticmethod
     def __catch_exceptions(target, arg_tuple: tuple):
         """
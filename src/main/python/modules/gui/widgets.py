@@ -10,9 +10,11 @@ from webbrowser import open_new
 from zipfile import ZipFile
 from copy import deepcopy
 
-from modules.dbinterface.constants import DATA_SEPARATOR, VERTEX, EDGE, ID, SOURCE, TARGET
+from modules.dbinterface.constants import DATA_SEPARATOR, VERTEX, EDGE, ID, SOURCE, TARGET, ESTIMATE_VERTICES, \
+    ESTIMATE_EDGES, ESTIMATE_VALUES, ESTIMATE_BUCKETS, ESTIMATE_COLLISIONS, ESTIMATE_MEMORY, ESTIMATE_ENGINE
+from modules.dbinterface.merge import encode_key
 from modules.gui.constants import ICON_PATH, ICON_STD_SIZE, TITLE_, TITLE, ABOUT_MENU_LABEL, BITMAP_PATH, \
-    QUERY_STATUS, ACTIVE_QUERY, NEW_QUERY
+    QUERY_STATUS, ACTIVE_QUERY, NEW_QUERY, TABLE_WINDOW, TABLE_ROW_HEIGHT, TABLE_SCROLL_UNITS, MOVETO, PAGES
 
 
 def load_icon(iconname, width=ICON_STD_SIZE, height=ICON_STD_SIZE) -> ImageTk.PhotoImage:
@@ -47,7 +49,7 @@ def load_icon(iconname, width=ICON_STD_SIZE, height=ICON_STD_SIZE) -> ImageTk.Ph
         )
 
 
-def _construct_table(parent: Widget, style: str) -> Treeview:
+def _construct_table(parent: Widget, style: str, virtual: bool = False) -> Treeview:
     """
     Constructs a table-style widget with scrollbars.
 
@@ -63,6 +65,10 @@ def _construct_table(parent: Widget, style: str) -> Treeview:
     style : str
         The style to use for the `Treeview`
 
+    virtual : bool
+        If a `VirtualTable` should be constructed, which renders only
+        the visible rows (default is False).
+
     Returns
     -------
     Treeview
@@ -71,11 +77,20 @@ def _construct_table(parent: Widget, style: str) -> Treeview:
 
     outer_frame = Frame(parent)
     inner_frame = Frame(outer_frame)
-    table = Treeview(inner_frame, selectmode=EXTENDED, style=style)
+    table = VirtualTable(inner_frame, style=style) if virtual else \
+        Treeview(inner_frame, selectmode=EXTENDED, style=style)
     hscrollbar = Scrollbar(outer_frame, orient=HORIZONTAL, command=table.xview)
     vscrollbar = Scrollbar(outer_frame, orient=VERTICAL, command=table.yview)
 
-    table.config(xscrollcommand=hscrollbar.set, yscrollcommand=vscrollbar.set)
+    if virtual:
+
+        # The scrollbar spans all rows, not only the rendered ones.
+        table.config(xscrollcommand=hscrollbar.set)
+        table.Scrollbar = vscrollbar
+
+    else:
+
+        table.config(xscrollcommand=hscrollbar.set, yscrollcommand=vscrollbar.set)
 
     table.pack(fill=BOTH, anchor=W, side=LEFT, expand=True)
     vscrollbar.pack(fill=Y, anchor=E, side=RIGHT)
@@ -86,6 +101,197 @@ def _construct_table(parent: Widget, style: str) -> Treeview:
     return table
 
 
+class VirtualTable(Treeview):
+    """
+    Table rendering only the visible window of its rows.
+
+    The rows are kept as dictionaries and only as many items as fit the
+    height of the table are inserted. Scrolling updates the values of
+    these items instead of moving through inserted items, hence rows are
+    displayed in constant time regardless of their number.
+
+    Attributes
+    ----------
+    Scrollbar : Scrollbar
+        The vertical scrollbar set to the position of the window.
+
+    __Rows : list
+        The rows as dictionaries.
+
+    __Columns : list
+        The keys of the displayed columns.
+
+    __Aliases : dict
+        Maps renamed keys to the list of their former keys.
+
+    __style : str
+        The style of the table.
+
+    __offset : int
+        The index of the first rendered row.
+
+    __window : int
+        The number of rendered rows.
+
+    Methods
+    -------
+    display(rows)
+        Displays a new list of rows.
+
+    rename(old_name, new_name)
+        Renames the key of a column.
+
+    yview(*args)
+        Queries or moves the window of rendered rows.
+    """
+
+    def __init__(self, master: Widget, style: str):
+
+        super().__init__(master, selectmode=EXTENDED, style=style)
+
+        self.Scrollbar = None
+
+        self.__Rows = []
+        self.__Columns = []
+        self.__Aliases = {}
+
+        self.__style = style
+        self.__offset = 0
+        self.__window = TABLE_WINDOW
+
+        self.bind('<Configure>', self.__resize)
+
+        for sequence in ['<MouseWheel>', '<Button-4>', '<Button-5>']:
+            self.bind(sequence, self.__wheel)
+
+    def display(self, rows: list):
+        """
+        Displays a new list of rows.
+
+        The columns are given by the keys of the first row.
+
+        Parameters
+        ----------
+        rows : list
+            A list of dictionaries. The list is kept, not copied.
+        """
+
+        self.__Rows = rows
+        self.__Columns = list(rows[0].keys()) if rows else []
+        self.__Aliases = {}
+        self.__offset = 0
+
+        self.delete(*self.get_children())
+
+        self['show'] = 'headings'
+        self.config(columns=self.__Columns)
+
+        for heading in self.__Columns:
+
+            self.heading(heading, text=heading)
+
+        self.__render()
+
+    def rename(self, old_name: str, new_name: str):
+        """
+        Renames the key of a column.
+
+        The rows are read by either key, as they may be renamed afterwards.
+
+        Parameters
+        ----------
+        old_name : str
+            The current key of the column.
+
+        new_name : str
+            The new key of the column.
+        """
+
+        self.__Columns = [new_name if column == old_name else column for column in self.__Columns]
+        self.__Aliases[new_name] = [old_name] + self.__Aliases.pop(old_name, [])
+
+    def yview(self, *args):
+        """
+        Queries or moves the window of rendered rows.
+
+        Called by the vertical scrollbar with the arguments of the Tk `yview` command.
+
+        Parameters
+        ----------
+        args : str
+            Either `moveto` and a fraction or `scroll`, a number and `units` or `pages`.
+
+        Returns
+        -------
+        tuple optional
+            The fractions of the first and last rendered row if no arguments are given.
+        """
+
+        if not args:
+            return self.__fractions()
+
+        if args[0] == MOVETO:
+            self.__scroll_to(int(float(args[1]) * len(self.__Rows)))
+
+        else:
+            self.__scroll_to(self.__offset + int(args[1]) * (self.__window if args[2] == PAGES else 1))
+
+    def __scroll_to(self, offset: int):
+
+        self.__offset = max(0, min(offset, len(self.__Rows) - self.__window))
+        self.__render()
+
+    def __render(self):
+
+        children = self.get_children()
+        visible = self.__Rows[self.__offset:self.__offset + self.__window]
+
+        # The module imports `enumerate` of threading, hence rows are indexed by range.
+        for index, row in zip(range(len(visible)), visible):
+
+            values = [next((row[key] for key in [column] + self.__Aliases.get(column, []) if key in row), '')
+                      for column in self.__Columns]
+
+            if index < len(children):
+                self.item(children[index], values=values)
+
+            else:
+                self.insert('', 'end', iid=index, values=values, tags=['entry'])
+
+        if len(children) > len(visible):
+            self.delete(*children[len(visible):])
+
+        if self.Scrollbar is not None:
+            self.Scrollbar.set(*self.__fractions())
+
+    def __fractions(self) -> tuple:
+
+        if not self.__Rows:
+            return 0.0, 1.0
+
+        return self.__offset / len(self.__Rows), min(1.0, (self.__offset + self.__window) / len(self.__Rows))
+
+    def __resize(self, event):
+
+        row_height = int(Style().lookup(self.__style, 'rowheight') or TABLE_ROW_HEIGHT)
+
+        # One row is occupied by the headings.
+        window = max(1, event.height // row_height - 1)
+
+        if window != self.__window:
+
+            self.__window = window
+            self.__scroll_to(self.__offset)
+
+    def __wheel(self, event):
+
+        upwards = event.num == 4 or event.delta > 0
+
+        self.__scroll_to(self.__offset + (-TABLE_SCROLL_UNITS if upwards else TABLE_SCROLL_UNITS))
+
+        return 'break'
+
+
 def alarm(title: str, message: str):
     """
     Invokes a TopLevel window displaying a message.
@@ -124,6 +330,35 @@ def inform(title: str, message: str):
                         message=message)
 
 
+def _format_estimate(estimate: dict) -> str:
+    """
+    Formats the estimate of a merge graph returned by a dry-run of `DataBaseInterface.db_merge`.
+
+    Parameters
+    ----------
+    estimate : dict
+        The estimate of the merge graph.
+
+    Returns
+    -------
+    str
+        The estimate as readable message.
+    """
+
+    buckets = ', '.join([str(size) + '-' + str(2 * size - 1) + ': ' + str(count) if size > 1 else '1: ' + str(count)
+                         for size, count in estimate[ESTIMATE_BUCKETS].items()])
+
+    collisions = ', '.join([str(value) + ' (' + str(size) + ')' for value, size in estimate[ESTIMATE_COLLISIONS]])
+
+    return '\n'.join(['Merged vertices: ~' + str(estimate[ESTIMATE_VERTICES]),
+                      'Merged edges: at most ' + str(estimate[ESTIMATE_EDGES]),
+                      'Distinct values: ~' + str(estimate[ESTIMATE_VALUES]),
+                      'Bucket sizes: ' + buckets,
+                      'Largest groups: ' + collisions,
+                      'Peak memory (' + estimate[ESTIMATE_ENGINE] + ' engine): ~' +
+                      str(round(estimate[ESTIMATE_MEMORY] / 2 ** 20, 1)) + ' MiB'])
+
+
 class MasterWidget:
     """
     Master widget to assemble sub-level widgets.
@@ -526,7 +761,7 @@ class ClientMenu(SuperMenu):
         host = self._Widgets['HostEntry'].get()
         port = self._Widgets['PortEntry'].get()
 
-        self._ThreadManager.stack_task(self._DB.DBInterface.client_connect, (host, port))
+        self._ThreadManager.stack_task(self._DB.connect, (host, port))
 
     def __disconnect(self):
         """
@@ -536,7 +771,7 @@ class ClientMenu(SuperMenu):
         current status is connected and the user clicks on the `Button`,
         """
 
-        self._ThreadManager.stack_task(self._DB.DBInterface.client_disconnect, ())
+        self._ThreadManager.stack_task(self._DB.disconnect, ())
 
 
 class DatabaseMenu(SuperMenu):
@@ -890,6 +1125,26 @@ class SuperImport(SuperTab):
 
         self.display_container()
 
+    def common_properties(self):
+        """
+        Returns the properties shared by all files that are not excluded by the user.
+        """
+
+        possible_properties = []
+
+        for file in self.Widgets['Table'].get_children():
+
+            if file not in self.Widgets['Table'].selection():
+
+                possible_properties.append(set(child.split(DATA_SEPARATOR)[1]
+                                               for child in self.Widgets['Table'].get_children(file)))
+
+        if possible_properties:
+
+            return list(reduce(lambda set1, set2: set1.intersection(set2), possible_properties))
+
+        return []
+
     def display_container(self):
         """
 
@@ -929,6 +1184,9 @@ class ImportTab(SuperImport):
 
         super().__init__(parent, 'Import', 'Import.Treeview', dbcontainer, threadmanager)
 
+        self.Icons['Merge'] = load_icon('GraphMerge')
+
+        self.Widgets['Merge'] = Button(self.Widgets['Menu'], image=self.Icons['Merge'], command=self.merge)
         self.Widgets['Table'].configure(columns=['path'])
         self.Widgets['Table'].heading('#0', text='Name')
         self.Widgets['Table'].heading('path', text='Path')
@@ -937,6 +1195,65 @@ class ImportTab(SuperImport):
 
         super().open(mode)
 
+    def merge(self):
+        """
+        Merges the opened files on the property chosen as source-property into a merge graph with the
+        key entered as target, without uploading the files.
+        """
+
+        target_graph = str(self.Widgets['TargetEntry'].get()).replace('_', '').replace(' ', '')
+        merge_property = self.Widgets['MapEntry'].get()
+
+        if not target_graph:
+
+            inform('Import', 'Please enter a key for the merge graph.')
+
+        elif not merge_property:
+
+            inform('Import', 'Please choose a property to merge the files on.')
+
+        else:
+
+            def merge_(files):
+
+                try:
+
+                    self.DB.DBInterface.db_merge_files([merge_property] +
+                                                       [file_name + DATA_SEPARATOR + merge_property
+                                                        for _, file_name, _, _ in files],
+                                                       files,
+                                                       target_graph)
+
+                except Exception:
+
+                    self.ThreadManager.stack_callback(release_, (False,))
+
+                    raise
+
+                self.ThreadManager.stack_callback(release_, (True,))
+
+            # The containers are iterated by the main loop, hence they are only changed on the main loop.
+            def release_(merged):
+
+                for file in queued:
+                    self.Container['Out'].remove(file)
+
+                    if merged:
+                        del self.Container['In'][file[1]]
+
+            # Files queued by pending uploads stay with their uploads.
+            pending = len(self.Container['Out'])
+
+            super().upload()
+
+            queued = self.Container['Out'][pending:]
+
+            files = [(file_type, file_name, file_path,
+                      selection + [merge_property] if merge_property not in selection else list(selection))
+                     for file_type, file_name, file_path, selection in queued]
+
+            self.ThreadManager.stack_task(merge_, (files,))
+
     def upload(self):
         """
 
@@ -949,7 +1266,7 @@ class ImportTab(SuperImport):
 
                 graph = self.DB.FileInterface.read_file(selection, (file_type, file_name, file_path), 'parse_graph')
 
-                self.DB.DBInterface.db_write(graph, file_name)
+                self.DB.DBInterface.db_write(graph, file_name, sketch=True)
 
                 del self.Container['In'][file_name]
 
@@ -972,7 +1289,19 @@ class ImportTab(SuperImport):
 
         super().display_state(state)
 
-        super().configure_state(DISABLED, 'TargetEntry', 'MapEntry')
+        if state == 'connected':
+
+            self.configure_state(NORMAL, 'Merge')
+
+        elif state == 'disconnected':
+
+            self.configure_state(DISABLED, 'Merge')
+
+    def display_container(self):
+
+        super().display_container()
+
+        self.Widgets['MapEntry'].configure(values=self.common_properties())
 
 
 class AnnotationTab(SuperImport):
@@ -1058,25 +1387,7 @@ class AnnotationTab(SuperImport):
         except TypeError:
             pass
 
-        possible_properties = []
-
-        for file in self.Widgets['Table'].get_children():
-
-            if file not in self.Widgets['Table'].selection():
-
-                possible_properties.append(set(self.Widgets['Table'].get_children(file)))
-
-        if possible_properties:
-
-            map_properties = reduce(lambda set1, set2: set1.intersection(set2), possible_properties)
-
-            map_properties = [property.split(DATA_SEPARATOR)[1] for property in map_properties]
-
-        else:
-
-            map_properties = []
-
-        self.Widgets['MapEntry'].configure(values=list(map_properties))
+        self.Widgets['MapEntry'].configure(values=self.common_properties())
 
     def adjust_entry_width(self):
 
@@ -1099,10 +1410,11 @@ class PropertiesTab(SuperImport):
 
         super().__init__(parent, 'Properties', 'Edit.Treeview', dbcontainer, threadmanager)
 
-        self.Widgets['Table'].configure(columns=['root', 'type'])
+        self.Widgets['Table'].configure(columns=['root', 'type', 'overlap'])
         self.Widgets['Table'].heading('#0', text='Name')
         self.Widgets['Table'].heading('root', text='Source')
         self.Widgets['Table'].heading('type', text='Type')
+        self.Widgets['Table'].heading('overlap', text='Overlap')
 
     def open(self, mode=None):
 
@@ -1110,15 +1422,27 @@ class PropertiesTab(SuperImport):
 
     def upload(self):
         """
-
-        :return:
+        Sketches the vertex properties of the graphs of the selected properties, or of all graphs if
+        no property is selected, to estimate their overlap.
         """
 
-        pass
+        selected = self.Widgets['Table'].selection() or self.Widgets['Table'].get_children()
+
+        for graph in set(self.Widgets['Table'].item(property_)['values'][0] for property_ in selected):
+
+            self.ThreadManager.stack_task(self.DB.DBInterface.db_sketch, (graph,))
 
     def display_state(self, state):
 
-        self.configure_state(DISABLED, 'Import', 'Upload', 'TargetEntry', 'MapEntry')
+        self.configure_state(DISABLED, 'Import', 'TargetEntry', 'MapEntry')
+
+        if state == 'connected':
+
+            self.configure_state(NORMAL, 'Upload')
+
+        elif state == 'disconnected':
+
+            self.configure_state(DISABLED, 'Upload')
 
         self.display_container()
 
@@ -1173,13 +1497,25 @@ class PropertiesTab(SuperImport):
 
                 self.Widgets['Table'].delete(property_)
 
+            elif property_ in self.DB.DBOverlaps:
+
+                overlap, jaccard = self.DB.DBOverlaps[property_]
+
+                self.Widgets['Table'].set(property_, 'overlap', '{:.0%} '.format(jaccard) + overlap)
+
     def set_selection(self):
 
-        selection = {self.Widgets['Table'].item(selected)['values'][0]: selected
-                     for selected in self.Widgets['Table'].selection()
-                     if self.Widgets['Table'].item(selected)['values'][1] == VERTEX}
+        selection = {}
+
+        for selected in self.Widgets['Table'].selection():
 
-        self.DB.UserSelection = selection
+            if self.Widgets['Table'].item(selected)['values'][1] == VERTEX:
+
+                selection.setdefault(self.Widgets['Table'].item(selected)['values'][0], []).append(selected)
+
+        # Several properties selected for one graph form a composite merge key.
+        self.DB.UserSelection = {graph: properties[0] if len(properties) == 1 else tuple(properties)
+                                 for graph, properties in selection.items()}
 
 
 class EditNotebook:
@@ -1248,8 +1584,10 @@ class QueryTab(SuperEdit):
         super().__init__(parent, 'Query', dbcontainer, threadmanager)
 
         self.Icons['Explain'] = load_icon('Explain')
+        self.Icons['Cancel'] = load_icon('ClearQuery')
 
         self.Widgets['Explain'] = Button(self.Widgets['Menu'], image=self.Icons['Explain'], command=self.__explain_query)
+        self.Widgets['Cancel'] = Button(self.Widgets['Menu'], image=self.Icons['Cancel'], command=self.__cancel_query)
         self.Widgets['Text'] = Text(self.Main, background='snow4', foreground='snow')
 
     def run(self):
@@ -1275,22 +1613,29 @@ class QueryTab(SuperEdit):
         super().pack()
 
         self.Widgets['Explain'].pack(side=RIGHT, padx=px, pady=py)
+        self.Widgets['Cancel'].pack(side=RIGHT, padx=px, pady=py)
         self.Widgets['Text'].pack(side=BOTTOM, expand=True, fill=BOTH, padx=px, pady=py)
 
     def display_state(self, state):
 
         if state == 'connected':
 
-            self.configure_state(NORMAL, 'Run', 'Explain', 'Text')
+            self.configure_state(NORMAL, 'Run', 'Explain', 'Cancel', 'Text')
 
         elif state == 'disconnected':
 
-            self.configure_state(DISABLED, 'Run', 'Explain', 'Text')
+            self.configure_state(DISABLED, 'Run', 'Explain', 'Cancel', 'Text')
 
     def __get_query(self):
 
         return self.Widgets['Text'].get('1.0', END).replace('\n', ' ').replace('\t', ' ')
 
+    def __cancel_query(self):
+
+        if not self.DB.cancel_query():
+
+            inform('Query', 'No running query was found.')
+
     def __explain_query(self):
 
         query = self.__get_query()
@@ -1311,6 +1656,12 @@ class MergeTab(SuperEdit):
 
         super().__init__(parent, 'Merge', dbcontainer, threadmanager)
 
+        # Merges queued to be calculated from one fetch of their source graphs.
+        self.Batch = []
+
+        self.Icons['Batch'] = load_icon('GraphMerge')
+
+        self.Widgets['Batch'] = Button(self.Widgets['Menu'], image=self.Icons['Batch'], command=self.__add_to_batch)
         self.Widgets['SrcKeyFrame'] = Labelframe(self.Widgets['Menu'], text='Source Graph ', labelanchor=W)
         self.Widgets['SrcKeyLabel'] = Label(self.Widgets['SrcKeyFrame'])
         self.Widgets['TgtKeyFrame'] = Labelframe(self.Widgets['Menu'], text='Target Graph ', labelanchor=W)
@@ -1322,7 +1673,30 @@ class MergeTab(SuperEdit):
 
     def run(self):
 
-        if not self.DB.UserSelection:
+        if self.Batch:
+
+            def batch_(specs):
+
+                # Estimated like single merges, the batch is merged one by one if it would exceed memory.
+                estimates = self.DB.DBInterface.db_merge_batch(deepcopy(specs), dry_run=True)
+
+                self.ThreadManager.stack_callback(confirm_batch_, (specs, estimates))
+
+            # Dialogs are opened on the main loop, the merges are run in another thread again.
+            def confirm_batch_(specs, estimates):
+
+                if messagebox.askyesno(TITLE_ + 'Merge',
+                                       '\n\n'.join([spec[2] + ':\n' + _format_estimate(estimate)
+                                                    for spec, estimate in zip(specs, estimates)]) +
+                                       '\n\nRun the merges?'):
+
+                    self.ThreadManager.stack_task(self.DB.DBInterface.db_merge_batch, (specs,))
+
+            self.ThreadManager.stack_task(batch_, (self.Batch,))
+
+            self.Batch = []
+
+        elif not self.DB.UserSelection:
 
             inform('Merge', 'Please select a set of merge properties.')
 
@@ -1342,10 +1716,24 @@ class MergeTab(SuperEdit):
 
                 inform('Merge', 'Please enter a name for the merged properties.')
 
-            elif target_graph in graph_keys:
+            elif target_graph in graph_keys and not self.DB.DBInterface.db_has_manifest(target_graph):
 
                 inform('Merge', 'The entered graph key already exists.')
 
+            elif target_graph in graph_keys:
+
+                if messagebox.askyesno(TITLE_ + 'Merge',
+                                       'The entered graph key already exists. '
+                                       'Fold the selected source graphs into this merge graph?'):
+
+                    def fold_(selection):
+
+                        for source_graph, source_attribute in selection.items():
+
+                            self.DB.DBInterface.db_merge_incremental([source_attribute], source_graph, target_graph)
+
+                    self.ThreadManager.stack_task(fold_, (deepcopy(self.DB.UserSelection),))
+
             else:
 
                 source_attributes = deepcopy(list(self.DB.UserSelection.values()))
@@ -1353,7 +1741,30 @@ class MergeTab(SuperEdit):
 
                 source_graphs = deepcopy(list(self.DB.UserSelection.keys()))
 
-                self.ThreadManager.stack_task(self.DB.DBInterface.db_merge,
+                def merge_(selection, graphs, graph):
+
+                    # The estimate is calculated first to allow aborting merges that would exhaust memory.
+                    estimate = self.DB.DBInterface.db_merge(list(selection), graphs, graph, dry_run=True)
+
+                    self.ThreadManager.stack_callback(confirm_merge_, (selection, graphs, graph, estimate))
+
+                # Dialogs are opened on the main loop, the merge is run in another thread again.
+                def confirm_merge_(selection, graphs, graph, estimate):
+
+                    # Virtual merge graphs store the merged IDs only, to compare merge properties cheaply.
+                    materialize = messagebox.askyesnocancel(TITLE_ + 'Merge',
+                                                            _format_estimate(estimate) + '\n\nRun the merge? '
+                                                            'Select no to create a virtual merge graph.')
+
+                    if materialize is not None:
+
+                        self.ThreadManager.stack_task(run_merge_, (selection, graphs, graph, not materialize))
+
+                def run_merge_(selection, graphs, graph, virtual):
+
+                    self.DB.DBInterface.db_merge(selection, graphs, graph, virtual=virtual)
+
+                self.ThreadManager.stack_task(merge_,
                                               (source_attributes,
                                                source_graphs,
                                                target_graph)
@@ -1363,6 +1774,7 @@ class MergeTab(SuperEdit):
 
         super().pack()
 
+        self.Widgets['Batch'].pack(side=RIGHT, padx=px, pady=py)
         self.Widgets['SrcKeyFrame'].pack(padx=px, pady=py, side=TOP, anchor=NW, fill=X)
         self.Widgets['SrcKeyLabel'].pack(padx=110, pady=py, side=LEFT)
         self.Widgets['SrcAttrFrame'].pack(padx=px, pady=py, side=BOTTOM, anchor=SW, fill=X)
@@ -1376,16 +1788,47 @@ class MergeTab(SuperEdit):
 
         if state == 'connected':
 
-            self.configure_state(NORMAL, 'Run', 'TgtKeyEntry', 'TgtAttrEntry')
+            self.configure_state(NORMAL, 'Run', 'Batch', 'TgtKeyEntry', 'TgtAttrEntry')
 
         elif state == 'disconnected':
 
-            self.configure_state(DISABLED, 'Run', 'TgtKeyEntry', 'TgtAttrEntry')
+            self.configure_state(DISABLED, 'Run', 'Batch', 'TgtKeyEntry', 'TgtAttrEntry')
 
         elif state == 'active':
 
             self.Widgets['SrcKeyLabel'].configure(text='\n'.join(list(self.DB.UserSelection.keys())))
-            self.Widgets['SrcAttrLabel'].configure(text='\n'.join(list(self.DB.UserSelection.values())))
+            self.Widgets['SrcAttrLabel'].configure(text='\n'.join([encode_key(key)
+                                                                   for key in self.DB.UserSelection.values()]))
+
+    def __add_to_batch(self):
+
+        target_attribute = str(self.Widgets['TgtAttrEntry'].get()).replace('_', '').replace(' ', '')
+        target_graph = str(self.Widgets['TgtKeyEntry'].get()).replace('_', '').replace(' ', '')
+
+        graph_keys = deepcopy(self.DB.DBKeys)
+        graph_keys.add(self.DB.DBActiveKey)
+        graph_keys.update(graph for _, _, graph in self.Batch)
+
+        if not self.DB.UserSelection:
+
+            inform('Merge', 'Please select a set of merge properties.')
+
+        elif not target_graph or not target_attribute:
+
+            inform('Merge', 'Please enter a key and a property name for the merge graph.')
+
+        elif target_graph in graph_keys:
+
+            inform('Merge', 'The entered graph key already exists.')
+
+        else:
+
+            self.Batch.append(([target_attribute] + deepcopy(list(self.DB.UserSelection.values())),
+                               deepcopy(list(self.DB.UserSelection.keys())),
+                               target_graph))
+
+            inform('Merge', str(len(self.Batch)) + ' merge graph(s) queued. '
+                                                   'Run to calculate them from one fetch of their source graphs.')
 
 
 class ExportNotebook:
@@ -1424,8 +1867,8 @@ class TableTab(SuperTab):
 
         self.Widgets['Menu'] = Frame(self.Main, style='Menu.TFrame')
         self.Widgets['Export'] = Button(self.Widgets['Menu'], image=self.Icons['Export'], command=self.__export)
-        self.Widgets['VertexTable'] = _construct_table(self.Main, 'Treeview')
-        self.Widgets['EdgeTable'] = _construct_table(self.Main, 'Treeview')
+        self.Widgets['VertexTable'] = _construct_table(self.Main, 'Treeview', virtual=True)
+        self.Widgets['EdgeTable'] = _construct_table(self.Main, 'Treeview', virtual=True)
 
         self.Widgets['VertexTable'].bind('<Button-3>',
                                          lambda event: self.__rename_popup(self.Widgets['VertexTable'], event))
@@ -1489,43 +1932,13 @@ class TableTab(SuperTab):
 
         if self.DB.DBStatus[QUERY_STATUS] == NEW_QUERY:
 
-            def assemble_headings(table, headings):
-
-                table['show'] = 'headings'
-                table.config(columns=headings)
-
-                for heading in headings:
-
-                    table.heading(heading, text=heading)
-
-            def insert_entities(table, entities):
-
-                table_index = 0
-
-                assemble_headings(table, list(entities[0].keys()))
-
-                for entity in entities:
-
-                    table.insert('', 'end', iid=table_index, values=list(entity.values()), tags=['entry'])
-
-                    table_index += 1
-
-            vertex_table = self.Widgets['VertexTable']
-            edge_table = self.Widgets['EdgeTable']
             vertices, edges = self.DB.DBQuery
 
-            vertex_table.delete(*vertex_table.get_children())
-            edge_table.delete(*edge_table.get_children())
-
             self.DB.DBStatus[QUERY_STATUS] = ACTIVE_QUERY
 
-            if vertices:
-
-                insert_entities(vertex_table, vertices)
-
-            if edges:
-
-                insert_entities(edge_table, edges)
+            # Only the visible rows are rendered, further rows are read from the response on scroll.
+            self.Widgets['VertexTable'].display(vertices)
+            self.Widgets['EdgeTable'].display(edges)
 
     def __rename_key(self, new_name, old_name):
 
@@ -1567,6 +1980,7 @@ class TableTab(SuperTab):
             else:
 
                 table.heading(selected_column, text=new_name)
+                table.rename(old_name, new_name)
 
                 self.ThreadManager.stack_task('Rename Key',
                                               self.__rename_key, new_name, old_name
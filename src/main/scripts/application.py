@@ -1,6 +1,8 @@
+from argparse import ArgumentParser
 from modules.gui.container import DataBaseStatus
 from modules.gui.manager import GUIManager, ThreadManager
 from modules.dbinterface.interface import DataBaseInterface, FileInterface
+from modules.dbinterface.asyncinterface import AsyncDataBaseInterface
 from modules.dbinterface.parser.GraphML import GRAPHMLParser
 from modules.dbinterface.parser.JSON import JSONParser
 from modules.dbinterface.parser.CSV import CSVParser
@@ -11,10 +13,16 @@ if __name__ == '__main__':
     Starts BioNGraph
     """
 
+    argumentParser = ArgumentParser(description='Starts BioNGraph')
+    argumentParser.add_argument('--compact', action='store_true',
+                                help='request compact query responses, requires RedisGraph 2.0 or later')
+    arguments = argumentParser.parse_args()
+
     fileInterface = FileInterface()
-    databaseInterface = DataBaseInterface(fileInterface)
+    databaseInterface = DataBaseInterface(fileInterface, compact=arguments.compact)
+    asyncDatabaseInterface = AsyncDataBaseInterface()
     threadManager = ThreadManager()
-    databaseStatusContainer = DataBaseStatus(databaseInterface, fileInterface)
+    databaseStatusContainer = DataBaseStatus(databaseInterface, fileInterface, asyncDatabaseInterface)
 
     graphml = GRAPHMLParser()
     json = JSONParser()
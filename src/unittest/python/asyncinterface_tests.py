@@ -0,0 +1,192 @@
+"""
+Script to test the AsyncDataBaseInterface of the dbinterface module against a RedisGraph stand-in.
+"""
+
+import asyncio
+import os
+import tempfile
+import unittest
+
+from unittest import mock
+
+from modules.dbinterface.asyncinterface import AsyncDataBaseInterface
+from modules.dbinterface.constants import TIMEOUT, COMPACT
+from modules.dbinterface.exceptons import DataBaseInterfaceTimeoutException
+from modules.dbinterface.interface import DataBaseInterface, FileInterface
+from modules.gui.container import DataBaseStatus
+from redisgraph_fake import FakeRedisGraph
+
+import redis
+
+QUERY = 'MATCH (vertex) RETURN vertex'
+
+
+class AsyncClient:
+    """
+    Asynchronous client answering from a `FakeRedisGraph`.
+
+    Attributes
+    ----------
+    Client : FakeRedisGraph
+        The stand-in answering the commands.
+
+    Commands : list
+        The arguments of every `GRAPH.QUERY` command, in order.
+
+    Delay : float
+        The number of seconds every `GRAPH.QUERY` command is delayed.
+
+    Errors : list
+        Exceptions raised instead of answering the next `GRAPH.QUERY` commands, in order.
+    """
+
+    def __init__(self, client: FakeRedisGraph):
+
+        self.Client = client
+        self.Commands = []
+        self.Delay = 0
+        self.Errors = []
+
+    async def execute_command(self, *args):
+
+        self.Commands.append(args)
+
+        if self.Delay:
+            await asyncio.sleep(self.Delay)
+
+        if self.Errors:
+            raise self.Errors.pop(0)
+
+        return self.Client.execute_command(*args[:3])
+
+    async def exists(self, *args):
+
+        return self.Client.exists(*args)
+
+    async def get(self, *args):
+
+        return self.Client.get(*args)
+
+    async def set(self, *args, **kwargs):
+
+        return self.Client.set(*args, **kwargs)
+
+    async def incr(self, *args):
+
+        return self.Client.incr(*args)
+
+    async def info(self, *args):
+
+        return self.Client.info(*args)
+
+    async def aclose(self):
+
+        pass
+
+
+class AsyncInterfaceTest(unittest.TestCase):
+    """
+    Connects a `DataBaseInterface` and an `AsyncDataBaseInterface` to one `FakeRedisGraph` storing the graph A.
+    """
+
+    def setUp(self):
+
+        self.Directory = tempfile.TemporaryDirectory()
+        self.Cwd = os.getcwd()
+        os.chdir(self.Directory.name)
+
+        self.Status = DataBaseStatus(DataBaseInterface(FileInterface()), FileInterface(), AsyncDataBaseInterface())
+        self.Client = FakeRedisGraph()
+        self.Client.add_graph('A', [{'id': 'A__1', 'A__name': 'x'}, {'id': 'A__2', 'A__name': 'y'}], [])
+        self.AsyncClient = AsyncClient(self.Client)
+
+        with self.patch_clients():
+            self.Status.connect('localhost', '6379')
+
+        self.Interface = self.Status.AsyncDBInterface
+
+    def patch_clients(self):
+
+        patches = mock.patch.multiple(redis, StrictRedis=lambda **kwargs: self.Client,
+                                      BlockingConnectionPool=lambda **kwargs: None)
+        patches.start()
+        self.addCleanup(patches.stop)
+
+        return mock.patch.multiple(redis.asyncio, Redis=lambda **kwargs: self.AsyncClient,
+                                   BlockingConnectionPool=lambda **kwargs: None)
+
+    def tearDown(self):
+
+        self.Interface.client_disconnect()
+        os.chdir(self.Cwd)
+        self.Directory.cleanup()
+
+    def query(self, query: str = QUERY, timeout: int = None):
+
+        return self.Interface.submit(self.Interface.db_query(query, 'A', True, timeout)).result()
+
+    def test_timeout_is_passed_with_read_queries(self):
+
+        self.query(timeout=1000)
+        self.query("CREATE (:A_nodes {id: 'A__3'})", timeout=1000)
+
+        self.assertEqual(self.AsyncClient.Commands[0][3:], (TIMEOUT, 1000))
+        self.assertEqual(self.AsyncClient.Commands[1][3:], ())
+
+    def test_unanswered_queries_time_out(self):
+
+        self.AsyncClient.Delay = 1
+
+        with mock.patch('modules.dbinterface.asyncinterface.TIMEOUT_GRACE', 0), \
+                self.assertRaises(DataBaseInterfaceTimeoutException):
+            self.query(timeout=10)
+
+    def test_queries_timed_out_by_instance_raise(self):
+
+        self.AsyncClient.Errors = [redis.ResponseError('Query timed out')]
+
+        with self.assertRaises(DataBaseInterfaceTimeoutException):
+            self.query(timeout=10)
+
+    def test_rejected_timeout_is_not_passed_again(self):
+
+        self.AsyncClient.Errors = [redis.ResponseError('Unknown argument TIMEOUT')]
+
+        self.query(timeout=1000)
+        self.query('MATCH (vertex) RETURN vertex.id', timeout=1000)
+
+        self.assertEqual([command[3:] for command in self.AsyncClient.Commands], [(TIMEOUT, 1000), (), ()])
+
+    def test_other_errors_are_raised(self):
+
+        self.AsyncClient.Errors = [redis.ResponseError('Unknown argument TIMEOUT'), redis.ResponseError('syntax')]
+
+        with self.assertRaisesRegex(redis.ResponseError, 'TIMEOUT'):
+            self.query(timeout=1000)
+
+    def test_results_are_shared_with_database_interface(self):
+
+        vertices, edges = self.Status.DBInterface.db_query(QUERY, 'A', to_graph=True)
+
+        self.assertEqual(self.query(), (vertices, edges))
+        self.assertEqual(self.AsyncClient.Commands, [])
+
+        self.query("CREATE (:A_nodes {id: 'A__3'})")
+
+        self.assertEqual(len(self.Status.DBInterface.db_query(QUERY, 'A', to_graph=True)[0]), 3)
+
+    def test_compact_responses_are_read_by_shared_reader(self):
+
+        reader = mock.Mock()
+        reader.read.return_value = [[b'vertex.id'], [b'A__1']]
+
+        with self.patch_clients():
+            self.Interface.client_connect('localhost', '6379', self.Status.DBInterface.client_get_cache(), reader)
+
+        self.assertEqual(self.query(), ([{'id': 'A__1'}], []))
+        self.assertEqual(self.AsyncClient.Commands[0][3:], (COMPACT,))
+        self.assertEqual(reader.read.call_args[0][0], 'A')
+
+
+if __name__ == '__main__':
+    unittest.main()
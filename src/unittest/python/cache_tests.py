@@ -0,0 +1,171 @@
+"""
+Script to test the result cache of the dbinterface module.
+"""
+
+import os
+import tempfile
+
+from unittest import TestCase, main
+
+from modules.dbinterface.cache import ResultCache, normalize_query, is_write_query
+from modules.dbinterface.constants import CACHE_FILE, CACHE_PART, CACHE_MEMORY_BUDGET, CACHE_DISK_BUDGET
+
+# Serialized as 12 bytes each.
+VALUES = [[1000, 2000], [3000, 4000], [5000, 6000]]
+
+
+class ResultCacheTest(TestCase):
+
+    def setUp(self):
+
+        self.Directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+
+        self.Directory.cleanup()
+
+    def files(self, suffix: str = CACHE_FILE) -> list:
+
+        return [name for name in os.listdir(self.Directory.name) if name.endswith(suffix)]
+
+    def test_default_budgets(self):
+
+        self.assertEqual(ResultCache.__init__.__defaults__, (CACHE_MEMORY_BUDGET, CACHE_DISK_BUDGET))
+        self.assertLess(CACHE_MEMORY_BUDGET, CACHE_DISK_BUDGET)
+
+    def test_missing_keys_are_not_hit(self):
+
+        self.assertIsNone(ResultCache(self.Directory.name).get(('A', 0)))
+
+    def test_hits_are_copies(self):
+
+        cache = ResultCache(self.Directory.name)
+        cache.put(('A', 0), {'vertices': [{'id': 'A__1'}]})
+
+        cache.get(('A', 0))['vertices'].clear()
+
+        self.assertEqual(cache.get(('A', 0)), {'vertices': [{'id': 'A__1'}]})
+
+    def test_keys_differ_by_version(self):
+
+        cache = ResultCache(self.Directory.name)
+        cache.put(('A', 0), VALUES[0])
+
+        self.assertIsNone(cache.get(('A', 1)))
+
+    def test_put_replaces_result(self):
+
+        cache = ResultCache(self.Directory.name, memory_budget=12)
+        cache.put(('A', 0), VALUES[0])
+        cache.put(('A', 0), VALUES[1])
+
+        self.assertEqual(cache.get(('A', 0)), VALUES[1])
+        self.assertEqual(self.files(), [])
+
+    def test_least_recently_used_results_are_spilled_to_disk(self):
+
+        cache = ResultCache(self.Directory.name, memory_budget=24)
+
+        for index, value in enumerate(VALUES[:2]):
+            cache.put(('A', index), value)
+
+        cache.get(('A', 0))
+        cache.put(('A', 2), VALUES[2])
+
+        self.assertEqual(len(self.files()), 1)
+        self.assertEqual([cache.get(('A', index)) for index in range(3)], VALUES)
+
+    def test_disk_hits_move_to_memory(self):
+
+        cache = ResultCache(self.Directory.name, memory_budget=12)
+        cache.put(('A', 0), VALUES[0])
+        cache.put(('A', 1), VALUES[1])
+
+        self.assertEqual(cache.get(('A', 0)), VALUES[0])
+
+        # The hit result left the disk tier, the result it displaced from memory took its place.
+        self.assertEqual(len(self.files()), 1)
+        self.assertEqual(cache.get(('A', 1)), VALUES[1])
+
+    def test_disk_tier_is_bounded(self):
+
+        cache = ResultCache(self.Directory.name, memory_budget=12, disk_budget=12)
+
+        for index, value in enumerate(VALUES):
+            cache.put(('A', index), value)
+
+        self.assertEqual(len(self.files()), 1)
+        self.assertIsNone(cache.get(('A', 0)))
+        self.assertEqual(cache.get(('A', 1)), VALUES[1])
+
+    def test_results_over_budget_are_not_cached(self):
+
+        cache = ResultCache(self.Directory.name, memory_budget=8)
+        cache.put(('A', 0), VALUES[0])
+
+        self.assertIsNone(cache.get(('A', 0)))
+        self.assertEqual(self.files(), [])
+
+    def test_disk_tier_is_kept_across_sessions(self):
+
+        cache = ResultCache(self.Directory.name, memory_budget=12)
+        cache.put(('A', 0), VALUES[0])
+        cache.put(('A', 1), VALUES[1])
+
+        self.assertEqual(ResultCache(self.Directory.name).get(('A', 0)), VALUES[0])
+
+    def test_partial_files_are_removed(self):
+
+        with open(os.path.join(self.Directory.name, 'spill' + CACHE_PART), 'w') as file:
+            file.write('[1')
+
+        ResultCache(self.Directory.name)
+
+        self.assertEqual(self.files(CACHE_PART), [])
+
+    def test_removed_files_are_not_hit(self):
+
+        cache = ResultCache(self.Directory.name, memory_budget=12)
+        cache.put(('A', 0), VALUES[0])
+        cache.put(('A', 1), VALUES[1])
+
+        for name in self.files():
+            os.remove(os.path.join(self.Directory.name, name))
+
+        self.assertIsNone(cache.get(('A', 0)))
+
+
+class NormalizeQueryTest(TestCase):
+
+    def test_whitespace_is_collapsed(self):
+
+        self.assertEqual(normalize_query('  MATCH (vertex)\n\tRETURN   vertex \n'), 'MATCH (vertex) RETURN vertex')
+
+    def test_string_literals_are_kept(self):
+
+        self.assertEqual(normalize_query("MATCH  (vertex) WHERE vertex.name = 'a   b' AND vertex.alias = \"c\\\"  d\""),
+                         "MATCH (vertex) WHERE vertex.name = 'a   b' AND vertex.alias = \"c\\\"  d\"")
+
+
+class IsWriteQueryTest(TestCase):
+
+    def test_write_clauses_are_detected(self):
+
+        for query in ("CREATE (:V_nodes {id: 'V__1'})", 'MATCH (vertex) SET vertex.name = 1',
+                      'MATCH (vertex) DETACH DELETE vertex', 'match (vertex) remove vertex.name',
+                      'UNWIND $rows AS row MERGE (vertex {id: row.id})'):
+
+            with self.subTest(query=query):
+                self.assertTrue(is_write_query(query))
+
+    def test_read_queries_are_not_detected(self):
+
+        for query in ('MATCH (vertex) RETURN vertex', "MATCH (vertex) WHERE vertex.name = 'create' RETURN vertex",
+                      'MATCH (vertex) WHERE vertex.merged = true RETURN vertex.settings'):
+
+            with self.subTest(query=query):
+                self.assertFalse(is_write_query(query))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+Script to test the reader of compact query responses of the dbinterface module.
+"""
+
+from unittest import TestCase, main
+
+from modules.dbinterface.compact import CompactReader
+from modules.dbinterface.constants import PROPERTY_KEYS, VALUE_NULL, VALUE_STRING, VALUE_INTEGER, VALUE_BOOLEAN, \
+    VALUE_DOUBLE, VALUE_ARRAY, VALUE_EDGE, VALUE_NODE, VALUE_PATH, VALUE_MAP, VALUE_POINT
+from modules.dbinterface.exceptons import DataBaseInterfaceValueTypeException
+
+STATISTICS = [b'Query internal execution time: 0.1 milliseconds']
+
+
+class CompactReaderTest(TestCase):
+
+    def setUp(self):
+
+        self.Keys = [b'id', b'name', b'w']
+        self.Calls = []
+
+        self.Reader = CompactReader(self.execute)
+
+    def execute(self, dbkey: str, query: str) -> list:
+
+        self.Calls.append((dbkey, query))
+
+        return [[[1, b'propertyKey']], [[[VALUE_STRING, key]] for key in self.Keys], STATISTICS]
+
+    def read(self, header: list, records: list) -> list:
+
+        return self.Reader.read('A', [[[1, name] for name in header], records, STATISTICS])
+
+    def test_entities_are_expanded_to_property_columns(self):
+
+        vertex = [VALUE_NODE, [0, [0], [[0, VALUE_STRING, b'A__1'], [1, VALUE_STRING, b'x']]]]
+        edge = [VALUE_EDGE, [0, 0, 0, 1, [[2, VALUE_INTEGER, 3]]]]
+        other = [VALUE_NODE, [1, [0], [[0, VALUE_STRING, b'A__2']]]]
+
+        self.assertEqual(self.read([b'vertex', b'edge'], [[vertex, edge], [other, [VALUE_NULL, None]]]),
+                         [[b'vertex.id', b'vertex.name', b'edge.w'],
+                          [b'A__1', b'x', b'3'],
+                          [b'A__2', b'NULL', b'NULL']])
+
+    def test_scalars_are_encoded_like_verbose_responses(self):
+
+        cells = [[VALUE_NULL, None], [VALUE_STRING, b'x'], [VALUE_INTEGER, 7], [VALUE_BOOLEAN, b'true'],
+                 [VALUE_DOUBLE, b'0.5'], [VALUE_ARRAY, [[VALUE_INTEGER, 1], [VALUE_STRING, b'y']]],
+                 [VALUE_MAP, [b'name', [VALUE_STRING, b'z'], b'size', [VALUE_INTEGER, 2]]],
+                 [VALUE_POINT, [b'52.5', b'13.4']],
+                 [VALUE_PATH, [[VALUE_ARRAY, [[VALUE_NODE, [4, [0], []]]]], [VALUE_ARRAY, []]]]]
+
+        self.assertEqual(self.read([str(index).encode() for index in range(len(cells))], [cells])[1],
+                         [b'NULL', b'x', b'7', b'true', b'0.5', b'[1, y]', b'{name: z, size: 2}',
+                          b'point({latitude: 52.5, longitude: 13.4})', b'[[4], []]'])
+
+    def test_unknown_value_types_are_rejected(self):
+
+        with self.assertRaisesRegex(DataBaseInterfaceValueTypeException, 'value type 12'):
+            self.read([b'value'], [[[12, b'?']]])
+
+    def test_responses_without_columns_are_empty(self):
+
+        self.assertEqual(self.Reader.read('A', [STATISTICS]), [])
+
+    def test_schema_is_requested_for_missing_ids_only(self):
+
+        vertex = [VALUE_NODE, [0, [0], [[1, VALUE_STRING, b'x']]]]
+
+        self.read([b'vertex'], [[vertex]])
+        self.read([b'vertex'], [[vertex]])
+        self.assertEqual(self.Calls, [('A', 'CALL ' + PROPERTY_KEYS)])
+
+        self.Keys.append(b'size')
+        self.assertEqual(self.read([b'vertex'], [[[VALUE_NODE, [0, [0], [[3, VALUE_INTEGER, 2]]]]]])[0],
+                         [b'vertex.size'])
+        self.assertEqual(len(self.Calls), 2)
+
+    def test_invalidated_schema_is_requested_again(self):
+
+        self.assertEqual(self.Reader.resolve('A', PROPERTY_KEYS, [0]), ['id', 'name', 'w'])
+
+        self.Keys[0] = b'key'
+        self.Reader.invalidate('A')
+
+        self.assertEqual(self.Reader.resolve('A', PROPERTY_KEYS, [0]), ['key', 'name', 'w'])
+        self.assertEqual(len(self.Calls), 2)
+
+
+if __name__ == '__main__':
+    main()
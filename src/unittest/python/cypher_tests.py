@@ -0,0 +1,115 @@
+"""
+Script to test the OpenCypher query builders of the dbinterface module.
+"""
+
+from unittest import TestCase, main
+
+from modules.dbinterface.cypher import get_entities_paged, get_keys_paged, get_vertices_by_id, merge_vertices, \
+    merge_edges, unwind, _bind, _literal, _value
+from modules.dbinterface.exceptons import DataBaseInterfacePredicateException
+
+
+class LiteralTest(TestCase):
+
+    def test_quotes_are_escaped(self):
+
+        self.assertEqual(_literal("it's"), "'it\\'s'")
+
+    def test_backslashes_are_escaped(self):
+
+        self.assertEqual(_literal('a\\b'), "'a\\\\b'")
+
+    def test_escaped_quote_does_not_close_literal(self):
+
+        self.assertEqual(_literal("\\'"), "'\\\\\\''")
+
+    def test_values_are_escaped_recursively(self):
+
+        self.assertEqual(_value({'id': "a'b", 'size': 2, 'ids': ['c\\', 1.5]}),
+                         "{id: 'a\\'b', size: 2, ids: ['c\\\\', 1.5]}")
+
+    def test_booleans_are_literals(self):
+
+        self.assertEqual(_value([True, False]), '[true, false]')
+
+    def test_map_keys_are_quoted(self):
+
+        self.assertEqual(_value({'gene symbol': 'x', 'a`b': 1, 'A__name': 'y'}),
+                         "{`gene symbol`: 'x', `a``b`: 1, A__name: 'y'}")
+
+
+class QueryTest(TestCase):
+
+    def test_identifiers_are_escaped(self):
+
+        query = get_vertices_by_id('A_nodes', ["x') return 1 //"])
+
+        self.assertIn("['x\\') return 1 //']", query)
+        self.assertTrue(query.startswith('CYPHER identifiers='))
+
+    def test_rows_are_escaped(self):
+
+        query = unwind([{'id': "a'", 'name': 'b\\'}])
+
+        self.assertIn("rows=[{id: 'a\\'', name: 'b\\\\'}]", query)
+
+    def test_property_names_are_quoted(self):
+
+        query = merge_vertices('T_nodes', [{'id': 'T__m0', 'gene symbol': 'x'}], ['gene symbol'], ['T__m'])
+
+        self.assertIn("rows=[{id: 'T__m0', `gene symbol`: 'x'}]", query)
+        self.assertIn('vertex.`gene symbol` = CASE WHEN row.`gene symbol` IS NULL', query)
+        self.assertIn('vertex.T__m = row.T__m', query)
+
+        query = merge_edges('T_nodes', 'T_edges', [{'source': 'a', 'target': 'b'}], [], ['edge weight'])
+
+        self.assertIn('edge.`edge weight` = row.`edge weight`', query)
+
+    def test_selected_properties_are_quoted(self):
+
+        query = get_keys_paged(0, 10, 'gene symbol', predicate="vertex.`gene symbol` <> 'x'")
+
+        self.assertIn('return vertex.id, vertex.`gene symbol`', query)
+
+        query = get_entities_paged(0, 10, None, ['gene symbol'], ['edge weight'])
+
+        self.assertIn('source.`gene symbol`', query)
+        self.assertIn('edge.`edge weight`', query)
+
+
+class BindTest(TestCase):
+
+    def test_binder_is_replaced(self):
+
+        self.assertEqual(_bind("vertex.name = 'x'", 'source'), "(source.name = 'x')")
+
+    def test_literals_are_kept(self):
+
+        self.assertEqual(_bind("vertex.name = 'vertex' or vertex.sym = \"vertex\"", 'target'),
+                         "(target.name = 'vertex' or target.sym = \"vertex\")")
+
+    def test_escaped_quotes_do_not_end_literals(self):
+
+        self.assertEqual(_bind("vertex.name = 'it\\'s vertex'", 'source'), "(source.name = 'it\\'s vertex')")
+
+    def test_properties_labels_and_parameters_are_kept(self):
+
+        self.assertEqual(_bind('vertex.vertex = $vertex and (vertex:vertex)', 'source'),
+                         '(source.vertex = $vertex and (source:vertex))')
+
+    def test_write_clauses_are_rejected(self):
+
+        for predicate in ("vertex.name = 'x' SET vertex.name = 'y'", 'true DETACH DELETE vertex',
+                          "vertex.name = 'x' WITH vertex MERGE (:A_nodes {id: 'z'})"):
+
+            with self.subTest(predicate=predicate), self.assertRaises(DataBaseInterfacePredicateException):
+                get_entities_paged(0, 10, predicate)
+
+    def test_write_clauses_in_literals_are_kept(self):
+
+        self.assertEqual(_bind("vertex.name = 'set' or vertex.name = \"delete\"", 'source'),
+                         "(source.name = 'set' or source.name = \"delete\")")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,362 @@
+"""
+Script to test the threading of the GUI widgets without a display.
+"""
+
+import threading
+import unittest
+
+from unittest import mock
+
+from modules.dbinterface.constants import ESTIMATE_VERTICES, ESTIMATE_EDGES, ESTIMATE_VALUES, ESTIMATE_BUCKETS, \
+    ESTIMATE_COLLISIONS, ESTIMATE_MEMORY, ESTIMATE_ENGINE, CLIENT_ENGINE
+from modules.gui.constants import QUERY_STATUS, NEW_QUERY, ACTIVE_QUERY, TABLE_WINDOW, TABLE_ROW_HEIGHT, \
+    TABLE_SCROLL_UNITS, MOVETO, PAGES
+from modules.gui.manager import ThreadManager
+from modules.gui.widgets import ImportTab, MergeTab, TableTab, VirtualTable
+
+ESTIMATE = {ESTIMATE_VERTICES: 4, ESTIMATE_EDGES: 4, ESTIMATE_VALUES: 5, ESTIMATE_BUCKETS: {1: 6},
+            ESTIMATE_COLLISIONS: [], ESTIMATE_MEMORY: 2 ** 20, ESTIMATE_ENGINE: CLIENT_ENGINE}
+
+
+class JoinedThread(threading.Thread):
+
+    # Tasks are run in another thread, which is joined to run the tasks of a test in order.
+    def start(self):
+
+        super().start()
+        self.join()
+
+
+def drain(manager: ThreadManager, checks: int = 10):
+
+    with mock.patch('modules.gui.manager.Thread', JoinedThread):
+
+        for _ in range(checks):
+            manager.check_open_tasks()
+
+
+def on_main_thread(*args, **kwargs) -> bool:
+
+    return threading.current_thread() is threading.main_thread()
+
+
+class ThreadManagerTest(unittest.TestCase):
+
+    def test_callbacks_run_on_checking_thread(self):
+
+        manager = ThreadManager()
+        threads = []
+
+        manager.stack_task(lambda: manager.stack_callback(lambda: threads.append(on_main_thread()), ()), ())
+        drain(manager)
+
+        self.assertEqual(threads, [True])
+
+    def test_exceptions_of_callbacks_are_alarmed(self):
+
+        manager = ThreadManager()
+        manager.stack_callback(lambda: 1 / 0, ())
+
+        with mock.patch('modules.gui.manager.alarm') as alarm:
+            manager.check_open_tasks()
+
+        alarm.assert_called_once()
+
+
+class MergeTabTest(unittest.TestCase):
+
+    def setUp(self):
+
+        # The widgets are replaced, hence no display is required.
+        self.Tab = MergeTab.__new__(MergeTab)
+        self.Tab.DB = mock.Mock(DBKeys=set(), DBActiveKey='A', UserSelection={'A': 'A__name', 'B': 'B__name'})
+        self.Tab.ThreadManager = ThreadManager()
+        self.Tab.Batch = []
+        self.Tab.Widgets = {'TgtAttrEntry': mock.Mock(get=lambda: 'm'), 'TgtKeyEntry': mock.Mock(get=lambda: 'T')}
+
+        self.Interface = self.Tab.DB.DBInterface
+        self.Interface.db_has_manifest.return_value = False
+
+        self.Messagebox = mock.patch('modules.gui.widgets.messagebox')
+        self.Dialogs = self.Messagebox.start()
+
+    def tearDown(self):
+
+        self.Messagebox.stop()
+
+    def test_merge_dialog_opens_on_main_thread(self):
+
+        self.Interface.db_merge.side_effect = lambda *args, **kwargs: ESTIMATE if kwargs.get('dry_run') else None
+        self.Dialogs.askyesnocancel.side_effect = on_main_thread
+
+        self.Tab.run()
+        drain(self.Tab.ThreadManager)
+
+        self.Dialogs.askyesnocancel.assert_called_once()
+        self.assertEqual(self.Interface.db_merge.call_args_list[-1],
+                         mock.call(['m', 'A__name', 'B__name'], ['A', 'B'], 'T', virtual=False))
+
+    def test_cancelled_merge_is_not_run(self):
+
+        self.Interface.db_merge.return_value = ESTIMATE
+        self.Dialogs.askyesnocancel.return_value = None
+
+        self.Tab.run()
+        drain(self.Tab.ThreadManager)
+
+        self.assertEqual(self.Interface.db_merge.call_count, 1)
+
+    def test_batch_dialog_opens_on_main_thread(self):
+
+        self.Tab.Batch = [(['m', 'A__name'], ['A'], 'T'), (['n', 'B__name'], ['B'], 'U')]
+        self.Interface.db_merge_batch.side_effect = \
+            lambda specs, **kwargs: [ESTIMATE] * len(specs) if kwargs.get('dry_run') else None
+        self.Dialogs.askyesno.side_effect = on_main_thread
+
+        self.Tab.run()
+        drain(self.Tab.ThreadManager)
+
+        self.Dialogs.askyesno.assert_called_once()
+        self.assertEqual(self.Interface.db_merge_batch.call_count, 2)
+        self.assertEqual(self.Tab.Batch, [])
+
+
+class ThreadList(list):
+
+    # Records whether the list is changed on the main thread.
+    def __init__(self, *args):
+
+        super().__init__(*args)
+
+        self.Threads = []
+
+    def remove(self, value):
+
+        self.Threads.append(on_main_thread())
+
+        super().remove(value)
+
+
+class ImportTabTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.Tab = ImportTab.__new__(ImportTab)
+        self.Tab.DB = mock.Mock()
+        self.Tab.ThreadManager = ThreadManager()
+        self.Tab.Container = {'In': {'F': mock.Mock(Type='graphml', Name='F', Path='F.graphml'),
+                                     'G': mock.Mock(Type='graphml', Name='G', Path='G.graphml')},
+                              'Out': ThreadList([('graphml', 'U', 'U.graphml', ['name'])])}
+
+        # The file U is queued by a pending upload.
+        children = {'': ['F', 'G'], 'F': ['F__name', 'F__size'], 'G': ['G__name']}
+        self.Tab.Widgets = {'TargetEntry': mock.Mock(get=lambda: 'T'), 'MapEntry': mock.Mock(get=lambda: 'name'),
+                            'Table': mock.Mock(selection=lambda: ('F__size',),
+                                               get_children=lambda item='': children[item])}
+
+    def test_containers_are_changed_on_main_thread(self):
+
+        self.Tab.merge()
+        drain(self.Tab.ThreadManager)
+
+        self.Tab.DB.DBInterface.db_merge_files.assert_called_once_with(
+            ['name', 'F__name', 'G__name'], [('graphml', 'F', 'F.graphml', ['name']),
+                                             ('graphml', 'G', 'G.graphml', ['name'])], 'T')
+
+        self.assertEqual(self.Tab.Container['Out'], [('graphml', 'U', 'U.graphml', ['name'])])
+        self.assertEqual(self.Tab.Container['Out'].Threads, [True, True])
+        self.assertEqual(list(self.Tab.Container['In']), [])
+
+    def test_failed_merge_keeps_files(self):
+
+        self.Tab.DB.DBInterface.db_merge_files.side_effect = RuntimeError()
+
+        # The exception is alarmed and raised again in the thread of the task.
+        with mock.patch('modules.gui.manager.alarm') as alarm, mock.patch('threading.excepthook'):
+
+            self.Tab.merge()
+            drain(self.Tab.ThreadManager)
+
+        alarm.assert_called_once()
+        self.assertEqual(self.Tab.Container['Out'], [('graphml', 'U', 'U.graphml', ['name'])])
+        self.assertEqual(sorted(self.Tab.Container['In']), ['F', 'G'])
+
+
+class TreeviewStandIn:
+    """
+    Replaces the Tk calls of a `Treeview` by a list of items, hence no display is required.
+    """
+
+    def __init__(self, master=None, **kwargs):
+
+        self.Items = {}
+        self.Options = {}
+        self.Headings = {}
+
+    def bind(self, sequence, function):
+
+        pass
+
+    def get_children(self, item=''):
+
+        return tuple(self.Items)
+
+    def insert(self, parent, index, iid=None, **kwargs):
+
+        self.Items[str(iid)] = kwargs['values']
+
+    def item(self, item, values=None):
+
+        self.Items[item] = values
+
+    def delete(self, *items):
+
+        for item in items:
+            del self.Items[item]
+
+    def config(self, **kwargs):
+
+        self.Options.update(kwargs)
+
+    def heading(self, column, text=None):
+
+        self.Headings[column] = text
+
+    def __setitem__(self, key, value):
+
+        self.Options[key] = value
+
+    def rows(self) -> list:
+
+        return [self.Items[item] for item in self.get_children()]
+
+
+class VirtualTableTest(unittest.TestCase):
+
+    ROWS = [{'id': 'A__' + str(index), 'name': str(index)} for index in range(4 * TABLE_WINDOW)]
+
+    def setUp(self):
+
+        methods = {name: function for name, function in vars(TreeviewStandIn).items()
+                   if callable(function) and name != 'rows'}
+
+        self.Treeview = mock.patch.multiple('modules.gui.widgets.Treeview', **methods)
+        self.Treeview.start()
+
+        self.Table = VirtualTable(None, 'Treeview')
+        self.Table.Scrollbar = mock.Mock()
+
+    def tearDown(self):
+
+        self.Treeview.stop()
+
+    def rows(self, start: int, stop: int) -> list:
+
+        return [['A__' + str(index), str(index)] for index in range(start, stop)]
+
+    def test_only_visible_rows_are_rendered(self):
+
+        self.Table.display(self.ROWS)
+
+        self.assertEqual(self.Table.Options['columns'], ['id', 'name'])
+        self.assertEqual(self.Table.Headings, {'id': 'id', 'name': 'name'})
+        self.assertEqual(TreeviewStandIn.rows(self.Table), self.rows(0, TABLE_WINDOW))
+        self.Table.Scrollbar.set.assert_called_with(0.0, 0.25)
+
+    def test_scrolling_renders_window_at_offset(self):
+
+        self.Table.display(self.ROWS)
+
+        self.Table.yview('scroll', '2', 'units')
+        self.assertEqual(TreeviewStandIn.rows(self.Table), self.rows(2, TABLE_WINDOW + 2))
+
+        self.Table.yview('scroll', '1', PAGES)
+        self.assertEqual(TreeviewStandIn.rows(self.Table), self.rows(TABLE_WINDOW + 2, 2 * TABLE_WINDOW + 2))
+
+        self.Table.yview(MOVETO, '0.5')
+        self.assertEqual(TreeviewStandIn.rows(self.Table), self.rows(2 * TABLE_WINDOW, 3 * TABLE_WINDOW))
+        self.assertEqual(self.Table.yview(), (0.5, 0.75))
+
+    def test_scrolling_is_clamped_to_rows(self):
+
+        self.Table.display(self.ROWS)
+
+        self.Table.yview(MOVETO, '1.0')
+        self.assertEqual(TreeviewStandIn.rows(self.Table), self.rows(3 * TABLE_WINDOW, 4 * TABLE_WINDOW))
+
+        self.Table.yview('scroll', '-9', PAGES)
+        self.assertEqual(TreeviewStandIn.rows(self.Table), self.rows(0, TABLE_WINDOW))
+
+    def test_wheel_scrolls_by_units(self):
+
+        self.Table.display(self.ROWS)
+
+        self.assertEqual(self.Table._VirtualTable__wheel(mock.Mock(num=5, delta=0)), 'break')
+        self.assertEqual(TreeviewStandIn.rows(self.Table)[0], self.rows(TABLE_SCROLL_UNITS, TABLE_SCROLL_UNITS + 1)[0])
+
+        self.Table._VirtualTable__wheel(mock.Mock(num=0, delta=120))
+        self.assertEqual(TreeviewStandIn.rows(self.Table)[0], ['A__0', '0'])
+
+    def test_resizing_changes_number_of_rendered_rows(self):
+
+        self.Table.display(self.ROWS)
+
+        with mock.patch('modules.gui.widgets.Style') as style:
+
+            style.return_value.lookup.return_value = ''
+            self.Table._VirtualTable__resize(mock.Mock(height=11 * TABLE_ROW_HEIGHT))
+
+        self.assertEqual(TreeviewStandIn.rows(self.Table), self.rows(0, 10))
+
+    def test_short_responses_remove_surplus_items(self):
+
+        self.Table.display(self.ROWS)
+        self.Table.display(self.ROWS[:3])
+
+        self.assertEqual(TreeviewStandIn.rows(self.Table), self.rows(0, 3))
+        self.assertEqual(self.Table.yview(), (0.0, 1.0))
+
+        self.Table.display([])
+
+        self.assertEqual(TreeviewStandIn.rows(self.Table), [])
+
+    def test_renamed_columns_read_former_keys(self):
+
+        self.Table.display([{'id': 'A__1', 'name': 'x'}, {'id': 'A__2', 'alias': 'y'}])
+        self.Table.rename('name', 'label')
+
+        self.Table.yview('scroll', '0', 'units')
+        self.assertEqual(TreeviewStandIn.rows(self.Table), [['A__1', 'x'], ['A__2', '']])
+
+        # The rows are renamed afterwards by the table tab.
+        self.Table._VirtualTable__Rows[0]['label'] = self.Table._VirtualTable__Rows[0].pop('name')
+        self.Table.yview('scroll', '0', 'units')
+        self.assertEqual(TreeviewStandIn.rows(self.Table), [['A__1', 'x'], ['A__2', '']])
+
+
+class TableTabTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.Tab = TableTab.__new__(TableTab)
+        self.Tab.DB = mock.Mock(DBStatus={QUERY_STATUS: NEW_QUERY}, DBQuery=([{'id': 'A__1'}], [{'source': 'A__1'}]))
+        self.Tab.Widgets = {'Export': mock.Mock(), 'VertexTable': mock.Mock(), 'EdgeTable': mock.Mock()}
+
+    def test_new_response_is_displayed_once(self):
+
+        self.Tab.display_state('connected')
+        self.Tab.display_state('connected')
+
+        self.Tab.Widgets['VertexTable'].display.assert_called_once_with([{'id': 'A__1'}])
+        self.Tab.Widgets['EdgeTable'].display.assert_called_once_with([{'source': 'A__1'}])
+        self.assertEqual(self.Tab.DB.DBStatus[QUERY_STATUS], ACTIVE_QUERY)
+
+    def test_response_is_not_copied(self):
+
+        self.Tab.display_state('disconnected')
+
+        self.assertIs(self.Tab.Widgets['VertexTable'].display.call_args[0][0], self.Tab.DB.DBQuery[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
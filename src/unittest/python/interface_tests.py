@@ -0,0 +1,722 @@
+"""
+Script to test the DataBaseInterface of the dbinterface module against a RedisGraph stand-in.
+"""
+
+import os
+import tempfile
+import threading
+import unittest
+
+from unittest import mock
+
+from modules.dbinterface.constants import AUTO_ENGINE, CLIENT_ENGINE, DISK_ENGINE, SERVER_ENGINE, FETCH_WORKERS, \
+    VERTEX, EDGE, ESTIMATE_VERTICES, ESTIMATE_EDGES, ESTIMATE_VALUES, ESTIMATE_BUCKETS, ESTIMATE_COLLISIONS, \
+    ESTIMATE_MEMORY, RUN_FILE, COUNT_POLICY, MAX_POLICY, CASEFOLD
+from modules.dbinterface.exceptons import DataBaseInterfaceMergePolicyException, DataBaseInterfaceViewException, \
+    DataBaseInterfacePredicateException
+from modules.dbinterface.interface import DataBaseInterface, FileInterface
+from modules.dbinterface.merge import Normalizer
+from modules.dbinterface.parser.GraphML import GRAPHMLParser
+from redisgraph_fake import FakePopen, FakeRedisGraph, connect
+
+SELECTION = ['m', 'A__name', 'B__name']
+
+
+def add_graphs(client: FakeRedisGraph):
+
+    client.add_graph('A', [{'id': 'A__1', 'A__name': 'x', 'A__score': '7'},
+                           {'id': 'A__2', 'A__name': 'y', 'A__score': '2'},
+                           {'id': 'A__3', 'A__name': 'NULL', 'A__score': '9'}],
+                     [{'source': 'A__1', 'target': 'A__2', 'A__w': '1'},
+                      {'source': 'A__2', 'target': 'A__3', 'A__w': '2'}])
+    client.add_graph('B', [{'id': 'B__1', 'B__name': 'x'}, {'id': 'B__2', 'B__name': 'z'},
+                           {'id': 'B__3', 'B__name': 'y'}],
+                     [{'source': 'B__1', 'target': 'B__2', 'B__w': '3'},
+                      {'source': 'B__3', 'target': 'B__1', 'B__w': '4'}])
+
+
+def canonical_as(graph: tuple, target: str) -> tuple:
+
+    # Renames the merge property of a canonical graph to the merge property of another target graph.
+    def rename(properties):
+        return tuple(sorted((target + '__m' if name.endswith('__m') else name, value) for name, value in properties))
+
+    vertices, edges = graph
+
+    return sorted(rename(vertex) for vertex in vertices), \
+        sorted((rename(source), rename(target_), properties) for source, target_, properties in edges)
+
+
+class InterfaceTestCase(unittest.TestCase):
+    """
+    Runs each test in a temporary working directory against a `FakeRedisGraph` storing the graphs A and B.
+    """
+
+    def setUp(self):
+
+        self.Directory = tempfile.TemporaryDirectory()
+        self.Cwd = os.getcwd()
+        os.chdir(self.Directory.name)
+
+        self.FileInterface = FileInterface()
+        self.Interface = DataBaseInterface(self.FileInterface)
+        self.Client = connect(self.Interface)
+        add_graphs(self.Client)
+
+        FakePopen.Client = self.Client
+        self.Popen = mock.patch('modules.dbinterface.interface.Popen', FakePopen)
+        self.Popen.start()
+
+    def tearDown(self):
+
+        self.Popen.stop()
+        os.chdir(self.Cwd)
+        self.Directory.cleanup()
+
+    def merge(self, target: str = 'T', **kwargs) -> tuple:
+
+        self.Interface.db_merge(list(SELECTION), ['A', 'B'], target, **kwargs)
+
+        return self.Client.canonical(target)
+
+
+class MergeEngineTest(InterfaceTestCase):
+
+    def test_client_engine_unifies_shared_values(self):
+
+        vertices, edges = self.merge(engine=CLIENT_ENGINE)
+
+        self.assertEqual(len(vertices), 4)
+        self.assertEqual(len(edges), 4)
+        self.assertEqual(sorted(dict(vertex)['T__m'] for vertex in vertices), ['NULL', 'x', 'y', 'z'])
+
+    def test_engines_merge_equally(self):
+
+        expected = self.merge(engine=CLIENT_ENGINE)
+
+        for engine in (DISK_ENGINE, SERVER_ENGINE):
+
+            with self.subTest(engine=engine):
+                self.assertEqual(self.merge(target='T' + engine, engine=engine),
+                                 canonical_as(expected, 'T' + engine))
+
+    def test_server_engine_merges_batches(self):
+
+        self.Client.Queries.clear()
+        self.merge(engine=SERVER_ENGINE)
+
+        merges = [query for _, query in self.Client.Queries if ' merge (' in query]
+
+        # One batch of vertices and one batch of edges per page of each source graph.
+        self.assertEqual(len(merges), 4)
+        self.assertTrue(all(query.startswith('CYPHER rows=') for query in merges))
+
+    def test_server_engine_keeps_existing_index(self):
+
+        expected = self.merge(target='C', engine=CLIENT_ENGINE)
+        self.Client.query('T', 'CREATE INDEX ON :T_nodes(id)')
+
+        self.assertEqual(self.merge(engine=SERVER_ENGINE), canonical_as(expected, 'T'))
+
+    def test_pages_cover_all_entities(self):
+
+        self.assertEqual(self.merge(engine=CLIENT_ENGINE, page_size=1),
+                         canonical_as(self.merge(target='P', engine=CLIENT_ENGINE), 'T'))
+
+    def test_auto_engine_chooses_client_engine_within_memory_budget(self):
+
+        self.assertEqual(self.Interface.db_merge(list(SELECTION), ['A', 'B'], 'T', dry_run=True)['engine'],
+                         CLIENT_ENGINE)
+
+    def test_auto_engine_chooses_disk_engine_over_memory_budget(self):
+
+        self.assertEqual(self.Interface.db_merge(list(SELECTION), ['A', 'B'], 'T', dry_run=True,
+                                                 memory_budget=64)['engine'], DISK_ENGINE)
+
+        expected = self.merge(target='C', engine=CLIENT_ENGINE)
+
+        with mock.patch.object(DataBaseInterface, '_DataBaseInterface__merge_on_disk', autospec=True,
+                               side_effect=DataBaseInterface._DataBaseInterface__merge_on_disk) as merge_on_disk:
+
+            self.assertEqual(self.merge(engine=AUTO_ENGINE, memory_budget=64), canonical_as(expected, 'T'))
+
+        merge_on_disk.assert_called_once()
+
+    def test_engines_merge_quoted_properties_equally(self):
+
+        self.Client.add_graph('C', [{'id': 'C__1', 'C__gene symbol': 'x', 'C__flag': 'true'},
+                                    {'id': 'C__2', 'C__gene symbol': 'y'}],
+                              [{'source': 'C__1', 'target': 'C__2', 'C__edge weight': '5'}])
+
+        for engine in (CLIENT_ENGINE, SERVER_ENGINE):
+
+            self.Interface.db_merge(['m', 'A__name', 'C__gene symbol'], ['A', 'C'], 'T' + engine, engine=engine)
+
+        self.assertEqual(self.Client.canonical('T' + SERVER_ENGINE),
+                         canonical_as(self.Client.canonical('T' + CLIENT_ENGINE), 'T' + SERVER_ENGINE))
+        self.assertIn(('C__edge weight', '5'), sum([properties for _, _, properties in
+                                                    self.Client.canonical('T' + SERVER_ENGINE)[1]], ()))
+
+    def test_write_predicates_are_rejected(self):
+
+        graph = self.Client.canonical('A')
+
+        for engine in (CLIENT_ENGINE, DISK_ENGINE, SERVER_ENGINE):
+
+            with self.subTest(engine=engine), self.assertRaises(DataBaseInterfacePredicateException):
+                self.merge(engine=engine, predicate="vertex.A__name = 'x' SET vertex.A__name = 'y'")
+
+        with self.assertRaises(DataBaseInterfacePredicateException):
+            self.merge(virtual=True, predicate='true DETACH DELETE vertex')
+
+        self.assertEqual(self.Client.canonical('A'), graph)
+        self.assertEqual(self.Client.keys('T*'), [])
+
+
+class MergePolicyTest(InterfaceTestCase):
+
+    POLICIES = {'A__score': MAX_POLICY, 'B__w': COUNT_POLICY}
+
+    def test_engines_apply_policies_equally(self):
+
+        expected = self.merge(target='C', engine=CLIENT_ENGINE, policies=self.POLICIES)
+
+        self.assertEqual(self.merge(engine=DISK_ENGINE, policies=self.POLICIES), canonical_as(expected, 'T'))
+        self.assertIn((('B__w', '1'),), [properties for _, _, properties in expected[1]])
+
+    def test_server_engine_rejects_policies(self):
+
+        with self.assertRaises(DataBaseInterfaceMergePolicyException):
+            self.merge(engine=SERVER_ENGINE, policies=self.POLICIES)
+
+    def test_unknown_policies_are_rejected(self):
+
+        with self.assertRaises(DataBaseInterfaceMergePolicyException):
+            self.merge(engine=CLIENT_ENGINE, policies={'A__score': 'median'})
+
+    def test_auto_engine_merges_policies_on_disk_instead_of_server(self):
+
+        with mock.patch.object(DataBaseInterface, '_DataBaseInterface__plan_engine', return_value=SERVER_ENGINE), \
+                mock.patch.object(DataBaseInterface, '_DataBaseInterface__merge_on_disk') as merge_on_disk:
+
+            self.merge(engine=AUTO_ENGINE, policies=self.POLICIES)
+
+        merge_on_disk.assert_called_once()
+
+
+class CompositeKeyTest(InterfaceTestCase):
+
+    SELECTION = ['m', ('E__name', 'E__taxon')]
+
+    def setUp(self):
+
+        super().setUp()
+
+        self.Client.add_graph('E', [{'id': 'E__1', 'E__name': 'x', 'E__taxon': '1'},
+                                    {'id': 'E__2', 'E__name': 'x', 'E__taxon': '2'},
+                                    {'id': 'E__3', 'E__name': 'x', 'E__taxon': '1'},
+                                    {'id': 'E__4', 'E__name': 'x', 'E__taxon': 'NULL'}],
+                              [{'source': 'E__1', 'target': 'E__2', 'E__w': '1'},
+                               {'source': 'E__3', 'target': 'E__4', 'E__w': '2'}])
+
+    def merge(self, target: str = 'T', **kwargs) -> tuple:
+
+        self.Interface.db_merge(list(self.SELECTION), ['E'], target, **kwargs)
+
+        return self.Client.canonical(target)
+
+    def test_vertices_sharing_all_components_are_merged(self):
+
+        vertices, edges = self.merge(engine=CLIENT_ENGINE)
+
+        # Keys with a NULL component are skipped, hence E__4 stays a singleton.
+        self.assertEqual(sorted(dict(vertex)['T__m'] for vertex in vertices), ['NULL', 'x|1', 'x|2'])
+        self.assertEqual(len(edges), 2)
+
+    def test_engines_merge_equally(self):
+
+        expected = self.merge(engine=CLIENT_ENGINE)
+
+        for engine in (DISK_ENGINE, SERVER_ENGINE):
+
+            with self.subTest(engine=engine):
+                self.assertEqual(self.merge(target='T' + engine, engine=engine),
+                                 canonical_as(expected, 'T' + engine))
+
+    def test_fold_restores_composite_keys(self):
+
+        self.merge(engine=CLIENT_ENGINE)
+        self.Client.add_graph('G', [{'id': 'G__1', 'G__name': 'x', 'G__taxon': '2'}, {'id': 'G__2'}],
+                              [{'source': 'G__1', 'target': 'G__2'}])
+
+        self.Interface.db_merge_incremental([('G__name', 'G__taxon')], 'G', 'T')
+
+        values = [dict(vertex)['T__m'] for vertex in self.Client.canonical('T')[0]]
+        self.assertEqual(sorted(values), ['NULL', 'NULL', 'x|1', 'x|2'])
+
+
+class NormalizerTest(InterfaceTestCase):
+
+    def setUp(self):
+
+        super().setUp()
+
+        self.Client.add_graph('B', [{'id': 'B__1', 'B__name': ' X'}, {'id': 'B__2', 'B__name': 'z'},
+                                    {'id': 'B__3', 'B__name': 'Y'}],
+                              [{'source': 'B__1', 'target': 'B__2', 'B__w': '3'}])
+        self.Normalizer = Normalizer([str.strip, CASEFOLD])
+
+    def test_engines_unify_normalized_values(self):
+
+        expected = self.merge(engine=CLIENT_ENGINE, normalizer=self.Normalizer)
+
+        self.assertEqual(sorted(dict(vertex)['T__m'] for vertex in expected[0]), ['NULL', 'x', 'y', 'z'])
+
+        for engine in (DISK_ENGINE, SERVER_ENGINE):
+
+            with self.subTest(engine=engine):
+                self.assertEqual(self.merge(target='T' + engine, engine=engine, normalizer=self.Normalizer),
+                                 canonical_as(expected, 'T' + engine))
+
+    def test_fold_unifies_normalized_values(self):
+
+        self.merge(engine=CLIENT_ENGINE, normalizer=self.Normalizer)
+        self.Client.add_graph('C', [{'id': 'C__1', 'C__name': 'Z '}, {'id': 'C__2'}],
+                              [{'source': 'C__1', 'target': 'C__2'}])
+
+        self.Interface.db_merge_incremental(['C__name'], 'C', 'T', normalizer=self.Normalizer)
+
+        self.assertEqual(sorted(dict(vertex)['T__m'] for vertex in self.Client.canonical('T')[0]),
+                         ['NULL', 'NULL', 'x', 'y', 'z'])
+
+
+class DiskEngineTest(InterfaceTestCase):
+
+    def test_partitions_merge_like_client_engine(self):
+
+        expected = self.merge(target='C', engine=CLIENT_ENGINE)
+
+        with mock.patch.object(DataBaseInterface, '_DataBaseInterface__partition',
+                               side_effect=DataBaseInterface._DataBaseInterface__partition) as partition:
+
+            self.assertEqual(self.merge(engine=DISK_ENGINE, memory_budget=256), canonical_as(expected, 'T'))
+
+        self.assertGreater(min(partition_count for (_, partition_count), _ in partition.call_args_list), 1)
+
+    def test_run_files_are_removed(self):
+
+        self.merge(engine=DISK_ENGINE, memory_budget=256)
+
+        self.assertEqual([name for _, _, names in os.walk('wrk') for name in names if name.endswith(RUN_FILE)], [])
+
+    def test_predicate_applies_to_partitions(self):
+
+        expected = self.merge(target='C', engine=CLIENT_ENGINE, predicate='vertex.B__name IS NOT NULL')
+
+        self.assertEqual(self.merge(engine=DISK_ENGINE, memory_budget=256, predicate='vertex.B__name IS NOT NULL'),
+                         canonical_as(expected, 'T'))
+        self.assertEqual(len(self.Client.canonical('T')[0]), 3)
+
+
+class EstimateTest(InterfaceTestCase):
+
+    def estimate(self, selection: list = None, source_graphs: list = None, **kwargs) -> dict:
+
+        return self.Interface.db_merge(list(selection or SELECTION), source_graphs or ['A', 'B'], 'T', dry_run=True,
+                                       **kwargs)
+
+    def test_no_values_are_fetched(self):
+
+        self.Client.Queries.clear()
+        self.estimate()
+
+        self.assertFalse([query for _, query in self.Client.Queries if 'lower=' in query])
+
+    def test_values_without_sketches_are_counted_as_disjoint(self):
+
+        estimate = self.estimate()
+
+        # A stores x and y, B stores x, z and y. A__3 stores no value.
+        self.assertEqual(estimate[ESTIMATE_VALUES], 5)
+        self.assertEqual(estimate[ESTIMATE_VERTICES], 6)
+        self.assertEqual(estimate[ESTIMATE_EDGES], 4)
+        # Buckets are aggregated per source graph, each value is stored by one vertex of each graph.
+        self.assertEqual(estimate[ESTIMATE_BUCKETS], {1: 6})
+
+    def test_values_are_united_by_sketches(self):
+
+        self.Interface.db_sketch('A')
+        self.Interface.db_sketch('B')
+
+        estimate = self.estimate()
+
+        self.assertAlmostEqual(estimate[ESTIMATE_VALUES], 3, delta=1)
+        self.assertLess(estimate[ESTIMATE_VERTICES], 6)
+
+    def test_predicate_applies_to_estimate(self):
+
+        estimate = self.estimate(predicate='vertex.A__score > 5')
+
+        # Only A__1 and A__3 satisfy the predicate, no edge connects them.
+        self.assertEqual(estimate[ESTIMATE_VERTICES], 2)
+        self.assertEqual(estimate[ESTIMATE_EDGES], 0)
+        self.assertEqual(estimate[ESTIMATE_VALUES], 1)
+
+    def test_projection_applies_to_memory(self):
+
+        self.assertLess(self.estimate(projection={VERTEX: [], EDGE: []})[ESTIMATE_MEMORY],
+                        self.estimate()[ESTIMATE_MEMORY])
+
+    def test_composite_keys_are_grouped_as_tuples(self):
+
+        self.Client.add_graph('E', [{'id': 'E__1', 'E__a': 'x', 'E__b': '1'},
+                                    {'id': 'E__2', 'E__a': 'x', 'E__b': '1'},
+                                    {'id': 'E__3', 'E__a': 'x', 'E__b': '2'}],
+                              [{'source': 'E__1', 'target': 'E__3'}])
+
+        estimate = self.estimate(['m', ('E__a', 'E__b')], ['E'])
+
+        self.assertEqual(estimate[ESTIMATE_VALUES], 2)
+        self.assertEqual(estimate[ESTIMATE_COLLISIONS], [('x|1', 2), ('x|2', 1)])
+        self.assertEqual(estimate[ESTIMATE_BUCKETS], {1: 1, 2: 1})
+
+
+class SketchTest(InterfaceTestCase):
+
+    def test_overlaps_are_estimated_from_sketches(self):
+
+        self.Client.add_graph('C', [{'id': 'C__1', 'C__name': 'x'}, {'id': 'C__2', 'C__name': 'y'},
+                                    {'id': 'C__3', 'C__name': 'z'}], [])
+
+        for graph in ('A', 'B', 'C'):
+            self.Interface.db_sketch(graph)
+
+        overlaps = self.Interface.db_get_overlaps()
+
+        # B__name and C__name share all values, A__name shares x and y with both.
+        self.assertEqual(overlaps['B__name'], ('C__name', 1.0))
+        self.assertEqual(overlaps['C__name'], ('B__name', 1.0))
+        self.assertIn(overlaps['A__name'][0], ('B__name', 'C__name'))
+
+    def test_overlaps_are_estimated_again_after_sketching(self):
+
+        self.Interface.db_sketch('A')
+        self.Interface.db_sketch('B')
+        self.assertIn('A__name', self.Interface.db_get_overlaps())
+
+        self.Client.add_graph('C', [{'id': 'C__1', 'C__name': 'z'}], [])
+        self.Interface.db_sketch('C')
+
+        self.assertIn('C__name', self.Interface.db_get_overlaps())
+
+
+class SinglePassTest(InterfaceTestCase):
+
+    def test_source_graphs_are_read_once(self):
+
+        self.Client.Queries.clear()
+        self.merge(engine=CLIENT_ENGINE, page_size=2)
+
+        windows = [(dbkey, query.split(' match')[0]) for dbkey, query in self.Client.Queries if 'lower=' in query]
+
+        # No distinct values are queried before the entities, and each window is queried once.
+        self.assertFalse([query for _, query in self.Client.Queries if 'distinct' in query])
+        self.assertEqual(sorted(windows), sorted(set(windows)))
+        self.assertEqual(len(windows), 4)
+
+    def test_vertices_without_values_are_singletons(self):
+
+        vertices, _ = self.merge(engine=CLIENT_ENGINE)
+
+        self.assertIn((('A__name', 'NULL'), ('A__score', '9'), ('B__name', 'NULL'), ('T__m', 'NULL')), vertices)
+
+
+class ConcurrentFetchTest(unittest.TestCase):
+
+    @staticmethod
+    def fetch(fetch, dbkeys: list):
+
+        return DataBaseInterface._DataBaseInterface__fetch_concurrently(fetch, dbkeys)
+
+    def test_all_pages_are_yielded(self):
+
+        pages = self.fetch(lambda dbkey: ((dbkey, page) for page in range(5)), ['A', 'B', 'C'])
+
+        self.assertEqual(sorted(pages), sorted((dbkey, page) for dbkey in 'ABC' for page in range(5)))
+
+    def test_graphs_are_fetched_concurrently(self):
+
+        graph_count = min(3, FETCH_WORKERS)
+        barrier = threading.Barrier(graph_count, timeout=5)
+
+        def fetch_(dbkey):
+
+            # Passes only if all graphs are fetched at the same time.
+            barrier.wait()
+
+            yield dbkey
+
+        self.assertEqual(sorted(self.fetch(fetch_, list('ABC')[:graph_count])), list('ABC')[:graph_count])
+
+    def test_exceptions_of_workers_are_raised(self):
+
+        def fetch_(dbkey):
+
+            yield dbkey
+
+            if dbkey == 'B':
+                raise ValueError(dbkey)
+
+        with self.assertRaises(ValueError):
+            list(self.fetch(fetch_, ['A', 'B']))
+
+    def test_stopping_early_releases_workers(self):
+
+        pages = self.fetch(lambda dbkey: range(1000), ['A', 'B', 'C'])
+        next(pages)
+
+        # Closing the generator joins the workers, hence it blocks if a worker waits on the queue.
+        closer = threading.Thread(target=pages.close)
+        closer.start()
+        closer.join(5)
+
+        self.assertFalse(closer.is_alive())
+
+
+class VirtualGraphTest(InterfaceTestCase):
+
+    def setUp(self):
+
+        super().setUp()
+
+        self.Interface.db_merge(list(SELECTION), ['A', 'B'], 'V', engine=CLIENT_ENGINE, virtual=True)
+
+    def test_only_merged_ids_are_stored(self):
+
+        self.assertFalse(self.Client.exists('V'))
+        self.assertTrue(self.Client.exists('V__view'))
+        self.assertIn('V', self.Interface.db_get_keys())
+
+    def test_queries_are_federated_over_source_graphs(self):
+
+        vertices, edges = self.Interface.db_query('MATCH (source)-[edge]->(target) RETURN source, edge, target',
+                                                  'V', True)
+
+        self.assertEqual(sorted(vertex['id'] for vertex in vertices), ['V__m0', 'V__m1', 'V__m2', 'V__m3'])
+        self.assertEqual(len(edges), 4)
+
+        # A__1 and B__1 share x and are unified into one vertex.
+        merged = [vertex for vertex in vertices if vertex.get('A_name') == 'x']
+        self.assertEqual(len(merged), 1)
+        self.assertEqual(merged[0].get('B_name'), 'x')
+
+    def test_write_queries_are_rejected(self):
+
+        with self.assertRaises(DataBaseInterfaceViewException):
+            self.Interface.db_query("CREATE (:V_nodes {id: 'V__m9'})", 'V')
+
+    def test_views_are_rejected_as_source_graphs(self):
+
+        with self.assertRaises(DataBaseInterfaceViewException):
+            self.Interface.db_merge(list(SELECTION), ['A', 'V'], 'T', engine=CLIENT_ENGINE)
+
+    def test_materialized_view_equals_merge(self):
+
+        expected = self.merge(engine=CLIENT_ENGINE)
+
+        self.Interface.db_materialize('V', 'M')
+        self.assertEqual(self.Client.canonical('M'), canonical_as(expected, 'M'))
+        self.assertTrue(self.Client.exists('V__view'))
+
+        self.Interface.db_materialize('V')
+        self.assertEqual(self.Client.canonical('V'), canonical_as(expected, 'V'))
+        self.assertFalse(self.Client.exists('V__view'))
+
+
+class FileMergeTest(InterfaceTestCase):
+
+    def setUp(self):
+
+        super().setUp()
+
+        self.FileInterface.add_parser('graphml', GRAPHMLParser())
+
+    def write_graphml(self, directory: str, names: list) -> str:
+
+        os.mkdir(directory)
+        path = os.path.join(directory, 'G.graphml')
+
+        with open(path, 'w') as file:
+            file.write('<graphml><key id="name" for="node"/><graph edgedefault="directed">' +
+                       ''.join(['<node id="n' + str(index) + '"><data key="name">' + name + '</data></node>'
+                                for index, name in enumerate(names)]) +
+                       '<edge source="n0" target="n1"/></graph></graphml>')
+
+        return path
+
+    def test_files_of_same_name_do_not_share_vertices(self):
+
+        files = [('graphml', 'G', self.write_graphml('first', ['x', 'y']), ['name']),
+                 ('graphml', 'G', self.write_graphml('second', ['z', 'x']), ['name'])]
+
+        self.Interface.db_merge_files(['m', 'G__name'], files, 'T')
+        vertices, edges = self.Client.canonical('T')
+
+        # The vertices n0 of both files are different vertices, only the vertices named x are merged.
+        self.assertEqual(sorted(dict(vertex)['T__m'] for vertex in vertices), ['x', 'y', 'z'])
+        self.assertEqual(sorted((dict(source)['T__m'], dict(target)['T__m']) for source, target, _ in edges),
+                         [('x', 'y'), ('z', 'x')])
+
+
+class IncrementalMergeTest(InterfaceTestCase):
+
+    def setUp(self):
+
+        super().setUp()
+
+        self.Interface.db_merge(list(SELECTION), ['A', 'B'], 'T', engine=CLIENT_ENGINE)
+
+    def fold(self, vertices: list) -> tuple:
+
+        self.Client.add_graph('C', vertices, [{'source': 'C__1', 'target': 'C__2', 'C__w': '5'}])
+        self.Interface.db_merge_incremental(['C__name', 'C__alias'], 'C', 'T')
+        self.Interface.db_merge(list(SELECTION) + ['C__name', 'C__alias'], ['A', 'B', 'C'], 'F',
+                                engine=CLIENT_ENGINE)
+
+        return self.structure('T'), self.structure('F')
+
+    def structure(self, key: str) -> tuple:
+
+        # Folded vertices lack the properties of source graphs they do not stem from.
+        vertices, edges = self.Client.canonical(key)
+        name = key + '__m'
+
+        return sorted(dict(vertex)[name] for vertex in vertices), \
+            sorted((dict(source)[name], dict(target)[name], properties) for source, target, properties in edges)
+
+    def keys(self) -> list:
+
+        # Versions outlive the keys they belong to.
+        return sorted(key for key in self.Client.keys('T*') if not key.endswith(b'__version'))
+
+    def test_only_merge_graphs_store_manifest(self):
+
+        self.assertTrue(self.Interface.db_has_manifest('T'))
+        self.assertFalse(self.Interface.db_has_manifest('A'))
+
+    def test_fold_equals_merge(self):
+
+        folded, merged = self.fold([{'id': 'C__1', 'C__name': 'y', 'C__alias': 'w'}, {'id': 'C__2', 'C__name': 'v'}])
+
+        self.assertEqual(folded, merged)
+        self.assertEqual(folded[0], ['NULL', 'v', 'w___y', 'x', 'z'])
+
+    def test_fold_unifying_merged_vertices_recomputes_merge(self):
+
+        folded, merged = self.fold([{'id': 'C__1', 'C__name': 'x', 'C__alias': 'z'}, {'id': 'C__2', 'C__name': 'v'}])
+
+        self.assertEqual(folded, merged)
+        self.assertFalse(self.Client.exists('T__backup'))
+
+    def test_fold_is_idempotent(self):
+
+        folded, _ = self.fold([{'id': 'C__1', 'C__name': 'y'}, {'id': 'C__2', 'C__name': 'v'}])
+        self.Interface.db_merge_incremental(['C__name', 'C__alias'], 'C', 'T')
+
+        self.assertEqual(self.structure('T'), folded)
+
+    def test_failed_recomputation_keeps_merge_graph(self):
+
+        self.Client.add_graph('C', [{'id': 'C__1', 'C__name': 'x', 'C__alias': 'z'}, {'id': 'C__2'}],
+                              [{'source': 'C__1', 'target': 'C__2'}])
+        graph = self.Client.canonical('T')
+        keys = self.keys()
+
+        def fail(*args, **kwargs):
+
+            # A partially stored merge graph and manifest.
+            self.Client.add_graph('T', [{'id': 'T__m0'}], [])
+            self.Client.hset('T__manifest__meta', 'name', 'partial')
+
+            raise RuntimeError()
+
+        with mock.patch.object(DataBaseInterface, 'db_merge', side_effect=fail):
+
+            with self.assertRaises(RuntimeError):
+                self.Interface.db_merge_incremental(['C__name', 'C__alias'], 'C', 'T')
+
+        self.assertEqual(self.Client.canonical('T'), graph)
+        self.assertEqual(self.keys(), keys)
+        self.assertEqual(self.Client.hget('T__manifest__meta', 'name'), b'm')
+        self.assertTrue(self.Interface.db_has_manifest('T'))
+
+
+class ResultCacheTest(InterfaceTestCase):
+
+    QUERY = 'MATCH (source)-[edge]->(target) RETURN source, edge, target'
+
+    def setUp(self):
+
+        super().setUp()
+
+        self.Cache = self.Interface._DataBaseInterface__Cache
+        self.Put = mock.patch.object(self.Cache, 'put', wraps=self.Cache.put)
+        self.Put.start()
+
+    def tearDown(self):
+
+        self.Put.stop()
+        super().tearDown()
+
+    def test_merge_fetches_are_not_cached(self):
+
+        for engine in (CLIENT_ENGINE, DISK_ENGINE):
+
+            with self.subTest(engine=engine):
+                self.merge(target='T' + engine, engine=engine)
+
+        self.Interface.db_merge(list(SELECTION), ['A', 'B'], 'D', dry_run=True)
+        self.Interface.db_merge(list(SELECTION), ['A', 'B'], 'S', virtual=True)
+
+        self.Cache.put.assert_not_called()
+
+    def test_read_queries_are_cached(self):
+
+        response = self.Interface.db_query(self.QUERY, 'A', to_graph=True)
+        self.Client.Queries.clear()
+
+        self.assertEqual(self.Interface.db_query(self.QUERY, 'A', to_graph=True), response)
+        self.assertEqual([query for _, query in self.Client.Queries if 'RETURN' in query], [])
+        self.Cache.put.assert_called_once()
+
+    def test_write_queries_invalidate_cached_results(self):
+
+        self.Interface.db_query('MATCH (vertex) RETURN vertex', 'A', to_graph=True)
+        self.Interface.db_query("CREATE (:A_nodes {id: 'A__9', A__name: 'v'})", 'A', to_graph=True)
+        vertices, _ = self.Interface.db_query('MATCH (vertex) RETURN vertex', 'A', to_graph=True)
+
+        self.assertIn('A__9', [vertex['id'] for vertex in vertices])
+
+
+class KeysTest(InterfaceTestCase):
+
+    def test_auxiliary_keys_are_excluded(self):
+
+        self.merge(target='T', virtual=True)
+        self.Client.set('A__version', 1)
+        self.Client.set('T__backup__version', 1)
+        self.Client.hset('T__backup__manifest__meta', 'name', 'm')
+
+        self.assertEqual(sorted(self.Interface.db_get_keys()), ['A', 'B', 'T'])
+
+    def test_graphs_named_like_auxiliary_keys_are_kept(self):
+
+        for key in ('__manifest__x', 'A__backup__y', 'B__sketch'):
+            self.Client.add_graph(key, [{'id': key + '__1'}], [])
+
+        self.assertEqual(sorted(self.Interface.db_get_keys()), sorted(['A', 'B', '__manifest__x', 'A__backup__y',
+                                                                        'B__sketch']))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,339 @@
+"""
+Script to test the data structures and kernels of the merge algorithm of the dbinterface module.
+"""
+
+from os import chdir, getcwd, listdir
+from os.path import join
+from copy import deepcopy
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+from modules.dbinterface.merge import DisjointSet, Normalizer, MinHash, merge_column, merge_entities, flatten_keys, \
+    encode_key, decode_key, join_values
+from modules.dbinterface.interface import DataBaseInterface, FileInterface
+from modules.dbinterface.constants import PYTHON_KERNEL, NUMPY_KERNEL, PARALLEL_KERNEL, VERTEX, EDGE, CONCAT_POLICY, \
+    FIRST_POLICY, DISTINCT_POLICY, COUNT_POLICY, MIN_POLICY, MAX_POLICY, MEAN_POLICY, CASEFOLD, WHITESPACE, VERSION
+from modules.dbinterface.exceptons import DataBaseInterfaceCanonicalizerException
+
+PAGES = \
+    [
+        (
+            [{'id': 'A__1', 'A__name': 'x', 'A__sym': 'p', 'A__score': '2'},
+             {'id': 'A__2', 'A__name': 'y', 'A__sym': 'q', 'A__score': 'NULL'},
+             {'id': 'A__3', 'A__name': 'NULL', 'A__sym': 'NULL', 'A__score': '0.5'}],
+            [{'source': 'A__1', 'target': 'A__2', 'A__w': '1'},
+             {'source': 'A__2', 'target': 'A__3', 'A__w': '2'}]
+        ),
+        (
+            [{'id': 'B__1', 'B__name': 'x', 'B__score': '3'},
+             {'id': 'B__2', 'B__name': 'q', 'B__score': 'high'},
+             {'id': 'B__3', 'B__name': 'z'}],
+            [{'source': 'B__1', 'target': 'B__2', 'B__w': '3'},
+             {'source': 'B__2', 'target': 'B__3', 'B__w': '4'}]
+        ),
+        (
+            [{'id': 'C__1', 'C__name': 'z'},
+             {'id': 'C__2', 'C__name': 'y', 'C__score': '7'}],
+            [{'source': 'C__1', 'target': 'C__2', 'C__w': '5'},
+             {'source': 'C__2', 'target': 'C__1', 'C__w': '6'}]
+        )
+    ]
+
+SELECTION = ['A__name', 'A__sym', 'B__name', 'C__name']
+
+
+class DisjointSetTest(TestCase):
+
+    def test_elements_are_singletons(self):
+
+        disjoint_set = DisjointSet(['a', 'b'])
+
+        self.assertEqual(disjoint_set.find('a'), 'a')
+        self.assertEqual(disjoint_set.find('b'), 'b')
+        self.assertIn('a', disjoint_set)
+        self.assertNotIn('c', disjoint_set)
+
+    def test_add_keeps_contained_elements(self):
+
+        disjoint_set = DisjointSet(['a', 'b'])
+        disjoint_set.union('a', 'b')
+        disjoint_set.add('b')
+
+        self.assertEqual(disjoint_set.find('a'), disjoint_set.find('b'))
+
+    def test_union_is_transitive(self):
+
+        disjoint_set = DisjointSet('abcde')
+        disjoint_set.union('a', 'b')
+        disjoint_set.union('c', 'd')
+        disjoint_set.union('b', 'd')
+
+        self.assertEqual(len({disjoint_set.find(element) for element in 'abcd'}), 1)
+        self.assertNotEqual(disjoint_set.find('a'), disjoint_set.find('e'))
+
+    def test_union_of_many_elements(self):
+
+        disjoint_set = DisjointSet('abcd')
+        root = disjoint_set.union('a', 'b', 'c')
+
+        self.assertEqual({disjoint_set.find(element) for element in 'abc'}, {root})
+        self.assertIsNone(disjoint_set.union())
+
+    def test_larger_subset_becomes_root(self):
+
+        disjoint_set = DisjointSet('abc')
+        root = disjoint_set.union('b', 'c')
+
+        self.assertEqual(disjoint_set.union('a', 'b'), root)
+
+    def test_iteration_yields_all_elements(self):
+
+        disjoint_set = DisjointSet('abc')
+        disjoint_set.union('a', 'c')
+
+        self.assertEqual(list(disjoint_set), ['a', 'b', 'c'])
+
+
+
+class MinHashTest(TestCase):
+
+    def sketch(self, values) -> MinHash:
+
+        sketch = MinHash()
+        sketch.update([str(value) for value in values])
+
+        return sketch
+
+    def test_equal_sets_are_similar(self):
+
+        self.assertEqual(self.sketch(range(100)).jaccard(self.sketch(reversed(range(100)))), 1.0)
+
+    def test_disjoint_sets_are_dissimilar(self):
+
+        self.assertLess(self.sketch(range(1000)).jaccard(self.sketch(range(1000, 2000))), 0.05)
+
+    def test_similarity_is_estimated(self):
+
+        # The sets share 1000 of 3000 values. The standard error is at most 1 / sqrt(128).
+        self.assertAlmostEqual(self.sketch(range(2000)).jaccard(self.sketch(range(1000, 3000))), 1 / 3, delta=0.1)
+
+    def test_pages_are_sketched_like_one_page(self):
+
+        sketch = MinHash()
+        sketch.update([str(value) for value in range(500)])
+        sketch.update([str(value).encode() for value in range(500, 1000)])
+
+        self.assertEqual(sketch.to_bytes(), self.sketch(range(1000)).to_bytes())
+
+    def test_union_is_sketch_of_union(self):
+
+        union = self.sketch(range(600)).union(self.sketch(range(400, 1000)))
+
+        self.assertEqual(union.to_bytes(), self.sketch(range(1000)).to_bytes())
+
+    def test_signatures_are_restored_from_bytes(self):
+
+        sketch = self.sketch(range(100))
+        signature = sketch.to_bytes()
+
+        self.assertEqual(len(signature), 128 * 8)
+        self.assertEqual(MinHash.from_bytes(signature).jaccard(sketch), 1.0)
+        self.assertEqual(MinHash.from_bytes(signature).to_bytes(), signature)
+
+    def test_signature_is_private(self):
+
+        self.assertFalse(hasattr(MinHash(), 'Signature'))
+
+
+class CompositeKeyTest(TestCase):
+
+    def test_keys_are_flattened_in_order(self):
+
+        self.assertEqual(flatten_keys(['a', ('b', 'c'), 'd']), ['a', 'b', 'c', 'd'])
+
+    def test_keys_are_encoded_reversibly(self):
+
+        self.assertEqual(encode_key('a'), 'a')
+        self.assertEqual(encode_key(('a', 'b')), 'a|b')
+        self.assertEqual(decode_key('a|b'), ('a', 'b'))
+        self.assertEqual(decode_key('a'), 'a')
+
+    def test_values_are_joined_sorted(self):
+
+        self.assertEqual(join_values([('y', '1'), 'x', ('x', '2')]), 'x___x|2___y|1')
+
+
+class NormalizerTest(TestCase):
+
+    def test_canonicalizers_are_applied_in_order(self):
+
+        normalizer = Normalizer([WHITESPACE, CASEFOLD, VERSION])
+
+        self.assertEqual(normalizer.normalize('  ENSG0001.12 '), 'ensg0001')
+        self.assertEqual(normalizer(' Tumor   Protein '), 'tumor protein')
+
+    def test_callables_are_canonicalizers(self):
+
+        self.assertEqual(Normalizer([str.upper]).normalize('tp53'), 'TP53')
+
+    def test_unknown_canonicalizers_are_rejected(self):
+
+        with self.assertRaises(DataBaseInterfaceCanonicalizerException):
+            Normalizer(['stem'])
+
+    def test_synonyms_map_to_canonicalized_preferred_value(self):
+
+        normalizer = Normalizer([CASEFOLD], {'P53': 'TP53'})
+
+        self.assertEqual(normalizer.normalize('p53'), 'tp53')
+        self.assertEqual(normalizer.normalize('BRCA1'), 'brca1')
+
+    def test_synonyms_are_loaded_from_csv(self):
+
+        with TemporaryDirectory() as directory:
+
+            path = join(directory, 'synonyms.csv')
+            with open(path, 'w') as file:
+                file.write('TP53,P53,LFS1\n\nBRCA1;,\n')
+
+            normalizer = Normalizer()
+            normalizer.load_synonyms(path)
+
+        self.assertEqual([normalizer.normalize(value) for value in ('P53', 'LFS1', 'BRCA1;')],
+                         ['TP53', 'TP53', 'BRCA1;'])
+
+
+class MergePolicyTest(TestCase):
+
+    VALUES = ['b', 'NULL', '3', '', 'a___b', '1.5']
+
+    def test_concat_keeps_all_values(self):
+
+        self.assertEqual(merge_column(self.VALUES, CONCAT_POLICY), 'b___NULL___3______a___b___1.5')
+
+    def test_first_skips_missing_values(self):
+
+        self.assertEqual(merge_column(['NULL', '', 'c', 'd'], FIRST_POLICY), 'c')
+        self.assertEqual(merge_column(['NULL'], FIRST_POLICY), '')
+
+    def test_distinct_splits_merged_values(self):
+
+        self.assertEqual(merge_column(self.VALUES, DISTINCT_POLICY), '1.5___3___a___b')
+
+    def test_count_skips_missing_values(self):
+
+        self.assertEqual(merge_column(self.VALUES, COUNT_POLICY), '4')
+
+    def test_numeric_policies_ignore_other_values(self):
+
+        self.assertEqual(merge_column(self.VALUES, MIN_POLICY), '1.5')
+        self.assertEqual(merge_column(self.VALUES, MAX_POLICY), '3')
+        self.assertEqual(merge_column(self.VALUES, MEAN_POLICY), '2.25')
+        self.assertEqual(merge_column(['a', 'NULL'], MEAN_POLICY), '')
+
+    def test_integral_numbers_are_formatted_as_integers(self):
+
+        self.assertEqual(merge_column(['1', '3'], MEAN_POLICY), '2')
+
+    def test_entities_are_merged_per_property(self):
+
+        merged = merge_entities([{'a': '1', 'b': 'x'}, {'a': '5'}], ['a', 'b'], {'a': MAX_POLICY})
+
+        self.assertEqual(merged, {'a': '5', 'b': 'x'})
+
+
+class KernelTest(TestCase):
+
+    def setUp(self):
+
+        self.DBInterface = DataBaseInterface(FileInterface())
+
+        # The parallel kernel writes its run files to the work directory.
+        self.Directory = TemporaryDirectory()
+        self.WorkingDirectory = getcwd()
+        chdir(self.Directory.name)
+
+    def tearDown(self):
+
+        chdir(self.WorkingDirectory)
+        self.Directory.cleanup()
+
+    def merge(self, kernel: str, policies: dict = None, selection: list = None) -> tuple:
+
+        graph = self.DBInterface._DataBaseInterface__merge_pages(deepcopy(PAGES), list(selection or SELECTION),
+                                                                 'T__m', kernel, policies or {}, None)
+
+        # The kernels return the merged entities in different order.
+        return sorted([sorted(vertex.items()) for vertex in graph[VERTEX]]), \
+            sorted([sorted(edge.items()) for edge in graph[EDGE]])
+
+    def test_values_are_unified_transitively(self):
+
+        vertices, edges = self.merge(PYTHON_KERNEL)
+
+        # A__1 and B__1 share x, A__2, B__2 and C__2 share y or q, B__3 and C__1 share z.
+        self.assertEqual(len(vertices), 4)
+        self.assertEqual(len(edges), 4)
+
+    def test_kernels_are_equal(self):
+
+        self.assertEqual(self.merge(NUMPY_KERNEL), self.merge(PYTHON_KERNEL))
+
+    def test_kernels_are_equal_with_policies(self):
+
+        for policy in (FIRST_POLICY, DISTINCT_POLICY, COUNT_POLICY, MIN_POLICY, MAX_POLICY, MEAN_POLICY):
+
+            policies = {'A__score': policy, 'B__score': policy, 'C__score': policy, 'A__w': policy}
+
+            with self.subTest(policy=policy):
+                self.assertEqual(self.merge(NUMPY_KERNEL, policies), self.merge(PYTHON_KERNEL, policies))
+
+    def test_kernels_are_equal_with_composite_keys(self):
+
+        # The values of (A__name, A__sym) are tuples and unify with no single value, hence only B__3 and C__1 share z.
+        selection = [('A__name', 'A__sym'), 'B__name', 'C__name']
+        expected = self.merge(PYTHON_KERNEL, selection=selection)
+
+        self.assertEqual(sorted(dict(vertex)['T__m'] for vertex in expected[0]),
+                         ['NULL', 'q', 'x', 'x|p', 'y', 'y|q', 'z'])
+
+        for kernel in (NUMPY_KERNEL, PARALLEL_KERNEL):
+
+            with self.subTest(kernel=kernel):
+                self.assertEqual(self.merge(kernel, selection=selection), expected)
+
+    def test_normalized_values_are_unified(self):
+
+        # Casefolding unifies B__name Q with A__sym q, hence A__2, B__2 and C__2 are merged again.
+        pages = deepcopy(PAGES)
+        pages[1][0][1]['B__name'] = 'Q'
+
+        graph = self.DBInterface._DataBaseInterface__merge_pages(pages, list(SELECTION), 'T__m', PYTHON_KERNEL, {},
+                                                                 Normalizer([CASEFOLD]))
+
+        self.assertEqual(len(graph[VERTEX]), 4)
+        self.assertIn('q___y', [vertex['T__m'] for vertex in graph[VERTEX]])
+
+    def test_parallel_kernel_is_equal(self):
+
+        self.assertEqual(self.merge(PARALLEL_KERNEL), self.merge(PYTHON_KERNEL))
+
+        policies = {'A__score': MEAN_POLICY, 'B__score': COUNT_POLICY, 'A__w': MAX_POLICY}
+        self.assertEqual(self.merge(PARALLEL_KERNEL, policies), self.merge(PYTHON_KERNEL, policies))
+
+    def test_parallel_kernel_removes_run_files(self):
+
+        self.merge(PARALLEL_KERNEL)
+
+        self.assertEqual(listdir('wrk'), [])
+
+    def test_numeric_policies_ignore_other_values(self):
+
+        vertices, _ = self.merge(NUMPY_KERNEL, {'A__score': MEAN_POLICY, 'B__score': MAX_POLICY})
+        scores = sorted((dict(vertex)['A__score'], dict(vertex)['B__score']) for vertex in vertices)
+
+        self.assertEqual(scores, [('', ''), ('', ''), ('0.5', ''), ('2', '3')])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,938 @@
+"""
+Script to store an in-memory stand-in of a RedisGraph instance used by the tests of the dbinterface module.
+
+The stand-in answers the query shapes built by the cypher module with verbose responses of RedisGraph 1.x, that is
+one column per property of each returned binder and the string NULL for missing values. Graphs are stored as JSON
+strings with their graph key, hence EXISTS, RENAME, KEYS and DEL apply to them like to any other key.
+"""
+
+import csv
+import operator
+import re
+
+from json import dumps, loads
+from shlex import split
+from unittest import mock
+
+import fakeredis
+import redis
+
+_TOKENS = re.compile(r"\s*(?:(?P<string>'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\")|(?P<number>\d+(?:\.\d+)?)"
+                     r"|(?P<parameter>\$\w+)|(?P<name>`[^`]*`|\w+)|(?P<operator><>|<=|>=|[=<>(){}\[\],.:+-]))")
+_NAME = r'(?:\w+|`[^`]*`)'
+
+
+class Null:
+    """
+    The value of a missing property. Comparisons with it are never true, like comparisons with null in OpenCypher.
+    """
+
+    def __eq__(self, other):
+        return False
+
+    def __ne__(self, other):
+        return False
+
+    def __lt__(self, other):
+        return False
+
+    __le__ = __gt__ = __ge__ = __lt__
+
+    def __bool__(self):
+        return False
+
+    def __add__(self, other):
+        return self
+
+    __radd__ = __add__
+
+    def __hash__(self):
+        return 0
+
+
+NULL = Null()
+
+
+class Scalar(str):
+    """
+    A stored value. Compared as number with numbers and numeric values, like values typed by the bulk upload.
+    """
+
+    def __compare(self, other, compare) -> bool:
+
+        number, other_number = _number(self), _number(other)
+
+        if number is not None and other_number is not None:
+            return compare(number, other_number)
+
+        if isinstance(other, (int, float)) or other is NULL:
+            return False
+
+        return compare(str(self), str(other))
+
+    def __eq__(self, other):
+        return self.__compare(other, operator.eq)
+
+    def __ne__(self, other):
+        return not self.__eq__(other) and other is not NULL
+
+    def __lt__(self, other):
+        return self.__compare(other, operator.lt)
+
+    def __le__(self, other):
+        return self.__compare(other, operator.le)
+
+    def __gt__(self, other):
+        return self.__compare(other, operator.gt)
+
+    def __ge__(self, other):
+        return self.__compare(other, operator.ge)
+
+    def __add__(self, other):
+        return NULL if other is NULL else Scalar(str(self) + str(other))
+
+    def __radd__(self, other):
+        return Scalar(str(other) + str(self))
+
+    __hash__ = str.__hash__
+
+
+def _number(value):
+
+    if isinstance(value, bool) or value is NULL:
+        return None
+
+    try:
+        return float(value)
+
+    except (TypeError, ValueError):
+        return None
+
+
+class FakeRedisGraph(fakeredis.FakeStrictRedis):
+    """
+    Redis client answering `GRAPH.QUERY`, `GRAPH.DELETE` and `GRAPH.EXPLAIN` from graphs stored as JSON strings.
+
+    Attributes
+    ----------
+    Queries : list
+        The graph key and query of every `GRAPH.QUERY` command, in order.
+
+    Failures : dict
+        Maps substrings of queries to exceptions raised instead of answering the query.
+    """
+
+    def __init__(self, *args, **kwargs):
+
+        super().__init__(*args, **kwargs)
+
+        self.Queries = []
+        self.Failures = {}
+
+    def execute_command(self, *args, **options):
+
+        command = args[0] if isinstance(args[0], str) else args[0].decode()
+
+        if command == 'GRAPH.QUERY':
+            return [self.query(args[1], args[2]), [b'Query internal execution time: 0.1 milliseconds']]
+
+        if command == 'GRAPH.EXPLAIN':
+            return [b'Results', b'    Project']
+
+        if command.startswith('GRAPH.DELETE'):
+
+            self.delete(command.split(' ', 1)[1])
+
+            return b'OK'
+
+        if command == 'KEYS *':
+            return self.keys('*')
+
+        if command == 'SAVE':
+            return b'OK'
+
+        return super().execute_command(*args, **options)
+
+    def graph(self, key: str) -> dict:
+        """
+        Returns a stored graph.
+
+        Parameters
+        ----------
+        key : str
+            The graph key.
+
+        Returns
+        -------
+        dict
+            Stores the vertices, their labels and the edges as pairs of vertex IDs and properties. An empty
+            graph if the key is not stored.
+        """
+
+        stored = self.get(key)
+
+        return loads(stored) if stored else {'vertices': [], 'labels': [], 'edges': [], 'indices': []}
+
+    def store(self, key: str, graph: dict):
+
+        self.set(key, dumps(graph))
+
+    def add_graph(self, key: str, vertices: list, edges: list):
+        """
+        Stores a graph like the bulk upload, labeling its vertices `<key>_nodes`.
+
+        Parameters
+        ----------
+        key : str
+            The graph key.
+
+        vertices : list
+            A list of dictionaries. Each dictionary has to contain the key `id`.
+
+        edges : list
+            A list of dictionaries. Each dictionary has to contain the keys `source` and `target`.
+        """
+
+        graph = self.graph(key)
+        ids = {vertex['id']: index for index, vertex in enumerate(graph['vertices'])}
+
+        for vertex in vertices:
+
+            ids[vertex['id']] = len(graph['vertices'])
+            graph['vertices'].append(dict(vertex))
+            graph['labels'].append(key + '_nodes')
+
+        for edge in edges:
+            graph['edges'].append([ids[edge['source']], ids[edge['target']], dict(edge)])
+
+        self.store(key, graph)
+
+    def entities(self, key: str) -> tuple:
+        """
+        Returns the vertices and edges of a stored graph.
+
+        Parameters
+        ----------
+        key : str
+            The graph key.
+
+        Returns
+        -------
+        tuple
+            A tuple of two lists of dictionaries. Represents vertices and edges.
+        """
+
+        graph = self.graph(key)
+
+        return [dict(vertex) for vertex in graph['vertices']], [dict(edge) for _, _, edge in graph['edges']]
+
+    def canonical(self, key: str) -> tuple:
+        """
+        Returns a stored graph independent of its vertex IDs and the order of its entities.
+
+        Parameters
+        ----------
+        key : str
+            The graph key.
+
+        Returns
+        -------
+        tuple
+            A tuple of two sorted lists. Represents the properties of the vertices except `id` and the properties
+            of the edges except `source` and `target` together with the properties of their source and target.
+        """
+
+        vertices, edges = self.entities(key)
+        properties = {vertex['id']: tuple(sorted((name, value) for name, value in vertex.items() if name != 'id'))
+                      for vertex in vertices}
+
+        return sorted(properties.values()), \
+            sorted((properties[edge['source']], properties[edge['target']],
+                    tuple(sorted((name, value) for name, value in edge.items() if name not in ('source', 'target'))))
+                   for edge in edges)
+
+    def query(self, key, command: str) -> list:
+        """
+        Answers a OpenCypher query.
+
+        Parameters
+        ----------
+        key
+            The graph key.
+
+        command : str
+            The OpenCypher query.
+
+        Returns
+        -------
+        list
+            The verbose response. Encoded header and rows.
+
+        Raises
+        ------
+        ResponseError
+            If the query has an unknown shape or matches a configured failure.
+        """
+
+        key = key if isinstance(key, str) else key.decode()
+        self.Queries.append((key, command))
+
+        for part, exception in self.Failures.items():
+
+            if part in command:
+                raise exception
+
+        parameters, body = _parameters(command)
+        graph = self.graph(key)
+
+        for pattern, answer in _SHAPES:
+
+            match = re.fullmatch(pattern, body.strip(), re.S)
+
+            if match:
+
+                response = answer(self, key, graph, parameters, match)
+
+                return [[_encode(cell) for cell in row] for row in response]
+
+        raise redis.ResponseError('Unknown query shape: ' + body)
+
+
+class FakePopen:
+    """
+    Stand-in of `subprocess.Popen` running the bulk upload into a `FakeRedisGraph`.
+
+    Attributes
+    ----------
+    Client : FakeRedisGraph
+        The client to upload to. Set by the test before the upload.
+    """
+
+    Client = None
+
+    def __init__(self, command, **kwargs):
+
+        arguments = split(command)
+        key = arguments[arguments.index('-h') - 1]
+        nodes = arguments[arguments.index('-n') + 1]
+        edges = arguments[arguments.index('-r') + 1]
+
+        with open(nodes, newline='') as file:
+            vertices = [{name: value for name, value in row.items() if value != ''} for row in csv.DictReader(file)]
+
+        with open(edges, newline='') as file:
+            edges = [{name: value for name, value in row.items() if value != ''} for row in csv.DictReader(file)]
+
+        FakePopen.Client.add_graph(key, vertices, edges)
+
+        self.stdout = self
+
+    def wait(self):
+        return 0
+
+    @staticmethod
+    def read():
+        return b''
+
+
+def _encode(cell) -> bytes:
+
+    return cell if isinstance(cell, bytes) else str(cell).encode('utf-8')
+
+
+def _parameters(command: str) -> tuple:
+
+    parameters = {}
+
+    if not command.startswith('CYPHER '):
+        return parameters, command
+
+    tokens = _Tokens(command[len('CYPHER '):])
+
+    while tokens.peek_name() and tokens.peek(1) == '=':
+
+        name = tokens.next()
+        tokens.next()
+        parameters[name] = tokens.literal()
+
+    return parameters, tokens.rest()
+
+
+class _Tokens:
+
+    def __init__(self, text: str):
+
+        self.text = text
+        self.position = 0
+
+    def __token(self, position: int):
+
+        match = _TOKENS.match(self.text, position)
+
+        if not match or match.end() == position:
+            return None, position
+
+        return match, match.end()
+
+    def peek(self, offset: int = 0):
+
+        position = self.position
+
+        for _ in range(offset + 1):
+
+            match, position = self.__token(position)
+
+            if match is None:
+                return None
+
+        return match.group().strip()
+
+    def peek_name(self) -> bool:
+
+        match, _ = self.__token(self.position)
+
+        return match is not None and match.group('name') is not None
+
+    def next(self) -> str:
+
+        match, self.position = self.__token(self.position)
+
+        return _unquote_name(match.group().strip())
+
+    def rest(self) -> str:
+
+        return self.text[self.position:]
+
+    def literal(self):
+
+        token = self.peek()
+
+        if token == '[':
+
+            self.next()
+            values = []
+
+            while self.peek() != ']':
+
+                values.append(self.literal())
+
+                if self.peek() == ',':
+                    self.next()
+
+            self.next()
+
+            return values
+
+        if token == '{':
+
+            self.next()
+            values = {}
+
+            while self.peek() != '}':
+
+                name = self.next()
+                self.next()
+                values[name] = self.literal()
+
+                if self.peek() == ',':
+                    self.next()
+
+            self.next()
+
+            return values
+
+        token = self.next()
+
+        if token[0] in '\'"':
+            return _unquote(token)
+
+        if token in ('true', 'false'):
+            return token == 'true'
+
+        if token == 'null':
+            return None
+
+        return float(token) if '.' in token else int(token)
+
+
+def _unquote(literal: str) -> str:
+
+    return re.sub(r'\\(.)', r'\1', literal[1:-1])
+
+
+def _unquote_name(name: str) -> str:
+
+    return name[1:-1] if name.startswith('`') else name
+
+
+def _value(value):
+
+    if value is None or value is NULL:
+        return NULL
+
+    return Scalar(value)
+
+
+def _evaluate(expression: str, scope: dict, parameters: dict, labels: dict):
+
+    # Translates the OpenCypher expression into a Python expression on the bound entities.
+    python = []
+    tokens = _Tokens(expression)
+
+    while tokens.peek() is not None:
+
+        token = tokens.peek()
+        raw, _ = tokens._Tokens__token(tokens.position)
+
+        if raw.group('string'):
+
+            tokens.next()
+            python.append(repr(_unquote(token)))
+
+        elif raw.group('parameter'):
+
+            tokens.next()
+            python.append(repr(parameters[token[1:]]))
+
+        elif raw.group('name') and tokens.peek(1) == '.' and token in scope:
+
+            tokens.next()
+            tokens.next()
+            python.append('_value(' + token + '.get(' + repr(tokens.next()) + '))')
+
+        elif raw.group('name') and tokens.peek(1) == ':' and token in scope:
+
+            tokens.next()
+            tokens.next()
+            python.append(repr(tokens.next()) + ' in _labels[' + repr(token) + ']')
+
+        elif token.lower() == 'id' and tokens.peek(1) == '(':
+
+            tokens.next()
+            tokens.next()
+            python.append('_ids[' + repr(tokens.next()) + ']')
+            tokens.next()
+
+        elif token.lower() in ('and', 'or', 'not', 'in'):
+
+            tokens.next()
+            python.append(token.lower())
+
+        elif token.lower() in ('true', 'false'):
+
+            tokens.next()
+            python.append(token.capitalize())
+
+        elif token.lower() == 'is':
+
+            tokens.next()
+            negated = tokens.peek().lower() == 'not'
+
+            if negated:
+                tokens.next()
+
+            tokens.next()
+            python.append('is not _NULL' if negated else 'is _NULL')
+
+        elif token == '=':
+
+            tokens.next()
+            python.append('==')
+
+        elif token == '<>':
+
+            tokens.next()
+            python.append('!=')
+
+        elif raw.group('name') and token not in scope:
+
+            raise redis.ResponseError('Unknown identifier: ' + token)
+
+        else:
+
+            tokens.next()
+            python.append(token)
+
+    names = dict(scope)
+    names.update({'_value': _value, '_labels': labels, '_ids': labels.get('_ids', {}), '_NULL': NULL})
+
+    return eval(' '.join(python), {'__builtins__': {}}, names)
+
+
+def _vertex_scope(graph: dict, indices: dict) -> tuple:
+
+    scope = {binder: graph['vertices'][index] for binder, index in indices.items()}
+    labels = {binder: [graph['labels'][index]] for binder, index in indices.items()}
+    labels['_ids'] = dict(indices)
+
+    return scope, labels
+
+
+def _columns(binders: list, rows: list, returned: str) -> list:
+
+    # Each returned item is a binder, whose properties are returned as columns, or a property of a binder.
+    items = [item.strip() for item in re.findall(r'(?:[^,`]|`[^`]*`)+', returned)]
+    header = []
+    getters = []
+
+    for item in items:
+
+        binder, _, property_ = item.partition('.')
+
+        if property_:
+
+            property_ = _unquote_name(property_)
+            header.append(binder + '.' + property_)
+            getters.append(lambda row, binder=binder, property_=property_: row[binder].get(property_, 'NULL'))
+
+        else:
+
+            keys = sorted(set().union(*[row[binder].keys() for row in rows])) if rows else ['id']
+
+            for key in keys:
+
+                header.append(binder + '.' + key)
+                getters.append(lambda row, binder=binder, key=key: row[binder].get(key, 'NULL'))
+
+    return [header] + [[getter(row) for getter in getters] for row in rows]
+
+
+def _window(graph, parameters, match):
+
+    return [index for index in range(len(graph['vertices']))
+            if parameters['lower'] <= index < parameters['upper']]
+
+
+def _answer_bound(fake, key, graph, parameters, match):
+
+    return [['max(id(vertex))'], [len(graph['vertices']) - 1 if graph['vertices'] else 'NULL']]
+
+
+def _answer_entities(fake, key, graph, parameters, match):
+
+    rows = []
+
+    for index in _window(graph, parameters, match):
+
+        scope, labels = _vertex_scope(graph, {'source': index})
+
+        if match.group('source') and not _evaluate(match.group('source'), scope, parameters, labels):
+            continue
+
+        for source, target, edge in graph['edges']:
+
+            if source != index:
+                continue
+
+            scope, labels = _vertex_scope(graph, {'source': index, 'target': target})
+
+            if match.group('target') and not _evaluate(match.group('target'), scope, parameters, labels):
+                continue
+
+            rows.append({'source': graph['vertices'][source], 'target': graph['vertices'][target], 'edge': edge})
+
+    return _columns(['source', 'target', 'edge'], rows, match.group('returned'))
+
+
+def _answer_keys(fake, key, graph, parameters, match):
+
+    rows = []
+
+    for index in _window(graph, parameters, match):
+
+        scope, labels = _vertex_scope(graph, {'vertex': index})
+
+        if match.group('predicate') and not _evaluate(match.group('predicate'), scope, parameters, labels):
+            continue
+
+        rows.append({'vertex': graph['vertices'][index]})
+
+    response = _columns(['vertex'], rows, match.group('returned'))
+
+    if match.group('distinct'):
+        response = [response[0]] + [list(row) for row in dict.fromkeys(tuple(row) for row in response[1:])]
+
+    return response
+
+
+def _matching(graph, parameters, predicate):
+
+    # The indices of all vertices satisfying a predicate on the binder `vertex`.
+    for index in range(len(graph['vertices'])):
+
+        scope, labels = _vertex_scope(graph, {'vertex': index})
+
+        if not predicate or _evaluate(predicate, scope, parameters, labels):
+            yield index
+
+
+def _groups(graph, parameters, predicate, expression):
+
+    groups = {}
+
+    for index in _matching(graph, parameters, predicate):
+
+        scope, labels = _vertex_scope(graph, {'vertex': index})
+        value = _evaluate(expression, scope, parameters, labels)
+
+        if value is not NULL:
+            groups[str(value)] = groups.get(str(value), 0) + 1
+
+    return groups
+
+
+def _answer_counts(fake, key, graph, parameters, match):
+
+    expressions = re.findall(r', count\(DISTINCT (.*?)\)(?=, count\(DISTINCT |$)', match.group('counted'))
+    count = len(list(_matching(graph, parameters, match.group('predicate'))))
+
+    return [['count(vertex)'] + ['count(DISTINCT ' + expression + ')' for expression in expressions],
+            [count] + [len(_groups(graph, parameters, match.group('predicate'), expression))
+                       for expression in expressions]]
+
+
+def _answer_edge_count(fake, key, graph, parameters, match):
+
+    count = 0
+
+    for source, target, _ in graph['edges']:
+
+        scope, labels = _vertex_scope(graph, {'source': source, 'target': target})
+
+        if not match.group('predicate') or _evaluate(match.group('predicate'), scope, parameters, labels):
+            count += 1
+
+    return [['count(edge)'], [count]]
+
+
+def _answer_value_sizes(fake, key, graph, parameters, match):
+
+    groups = sorted(_groups(graph, parameters, match.group('predicate'), match.group('expression')).items(),
+                    key=lambda item: item[1], reverse=True)
+
+    return [[match.group('expression'), 'size']] + [list(item) for item in groups[:int(match.group('limit'))]]
+
+
+def _answer_size_distribution(fake, key, graph, parameters, match):
+
+    distribution = {}
+
+    for size in _groups(graph, parameters, match.group('predicate'), match.group('expression')).values():
+        distribution[size] = distribution.get(size, 0) + 1
+
+    return [['size', 'count(value)']] + [list(item) for item in distribution.items()]
+
+
+def _answer_vertex_limited(fake, key, graph, parameters, match):
+
+    return _columns(['vertex'], [{'vertex': vertex} for vertex in graph['vertices'][:1]], 'vertex')
+
+
+def _answer_edge_limited(fake, key, graph, parameters, match):
+
+    return _columns(['edge'], [{'edge': edge} for _, _, edge in graph['edges'][:1]], 'edge')
+
+
+def _answer_vertices_by_id(fake, key, graph, parameters, match):
+
+    identifiers = set(parameters['identifiers'])
+
+    return _columns(['vertex'], [{'vertex': vertex} for vertex, label in zip(graph['vertices'], graph['labels'])
+                                 if label == match.group('label') and vertex.get('id') in identifiers], 'vertex')
+
+
+def _answer_edges_by_source(fake, key, graph, parameters, match):
+
+    identifiers = set(parameters['identifiers'])
+
+    return _columns(['edge'], [{'edge': edge} for source, _, edge in graph['edges']
+                               if graph['labels'][source] == match.group('label')
+                               and graph['vertices'][source].get('id') in identifiers], 'edge')
+
+
+def _answer_vertices(fake, key, graph, parameters, match):
+
+    binder = match.group('binder')
+    rows = []
+
+    for index in range(len(graph['vertices'])):
+
+        scope, labels = _vertex_scope(graph, {binder: index})
+
+        if match.group('predicate') and not _evaluate(match.group('predicate'), scope, parameters, labels):
+            continue
+
+        rows.append({binder: graph['vertices'][index]})
+
+    return _columns([binder], rows, match.group('returned'))
+
+
+def _answer_paths(fake, key, graph, parameters, match):
+
+    binders = [match.group('source'), match.group('target'), match.group('edge')]
+
+    return _columns(binders, [dict(zip(binders, (graph['vertices'][source], graph['vertices'][target], edge)))
+                              for source, target, edge in graph['edges']], match.group('returned'))
+
+
+def _answer_create_index(fake, key, graph, parameters, match):
+
+    index = [match.group('label'), match.group('property')]
+
+    if index in graph['indices']:
+        raise redis.ResponseError("Attribute '" + index[1] + "' is already indexed")
+
+    graph['indices'].append(index)
+    fake.store(key, graph)
+
+    return [[]]
+
+
+def _assignments(binder: str, sets: str) -> list:
+
+    return [(_unquote_name(property_), expression.startswith('CASE'))
+            for property_, expression in re.findall(binder + r'\.(' + _NAME + r') = (CASE .*? END|row\.' + _NAME + ')',
+                                                    sets)]
+
+
+def _assign(entity: dict, row: dict, assignments: list):
+
+    for property_, concatenated in assignments:
+
+        value = row.get(property_)
+
+        if value is None:
+
+            if not concatenated:
+                entity.pop(property_, None)
+
+            continue
+
+        value = str(value).lower() if isinstance(value, bool) else str(value)
+
+        entity[property_] = entity[property_] + '___' + value if concatenated and property_ in entity else value
+
+
+def _answer_merge_vertices(fake, key, graph, parameters, match):
+
+    label = match.group('label')
+    assignments = _assignments('vertex', match.group('sets'))
+
+    for row in parameters['rows']:
+
+        for vertex, vertex_label in zip(graph['vertices'], graph['labels']):
+
+            if vertex_label == label and vertex.get('id') == row['id']:
+                break
+
+        else:
+
+            vertex = {'id': row['id']}
+            graph['vertices'].append(vertex)
+            graph['labels'].append(label)
+
+        _assign(vertex, row, assignments)
+
+    fake.store(key, graph)
+
+    return [[]]
+
+
+def _answer_merge_edges(fake, key, graph, parameters, match):
+
+    label = match.group('label')
+    assignments = _assignments('edge', match.group('sets'))
+    ids = {vertex.get('id'): index for index, vertex in enumerate(graph['vertices'])
+           if graph['labels'][index] == label}
+
+    for row in parameters['rows']:
+
+        if row['source'] not in ids or row['target'] not in ids:
+            continue
+
+        source, target = ids[row['source']], ids[row['target']]
+
+        for edge_source, edge_target, edge in graph['edges']:
+
+            if (edge_source, edge_target) == (source, target):
+                break
+
+        else:
+
+            edge = {}
+            graph['edges'].append([source, target, edge])
+
+        _assign(edge, row, assignments)
+
+    fake.store(key, graph)
+
+    return [[]]
+
+
+def _answer_create(fake, key, graph, parameters, match):
+
+    graph['vertices'].append({name: str(value) for name, value in _Tokens(match.group('map')).literal().items()})
+    graph['labels'].append(match.group('label'))
+    fake.store(key, graph)
+
+    return [[]]
+
+
+_SHAPES = \
+    [
+        (r'match \(vertex\) return max\(id\(vertex\)\)', _answer_bound),
+        (r'match \(source\) where id\(source\) >= \$lower and id\(source\) < \$upper(?: and (?P<source>.*?))? '
+         r'match \(source\)-\[edge\]->\(target\)(?: where (?P<target>.*?))? return (?P<returned>.*)', _answer_entities),
+        (r'match \(vertex\) where id\(vertex\) >= \$lower and id\(vertex\) < \$upper(?: and (?P<predicate>.*?))? '
+         r'return (?P<distinct>distinct )?(?P<returned>vertex\..*)', _answer_keys),
+        (r'match \(vertex\)(?: where (?P<predicate>.*?))? return count\(vertex\)(?P<counted>.*)', _answer_counts),
+        (r'match \(\)-\[edge\]->\(\)(?P<predicate>) return count\(edge\)', _answer_edge_count),
+        (r'match \(source\)-\[edge\]->\(target\) where (?P<predicate>.*) return count\(edge\)', _answer_edge_count),
+        (r'match \(vertex\) where (?P<predicate>.*?) return (?P<expression>.*), count\(vertex\) as size '
+         r'order by size desc limit (?P<limit>\d+)', _answer_value_sizes),
+        (r'match \(vertex\) where (?P<predicate>.*?) with (?P<expression>.*) as value, count\(vertex\) as size '
+         r'return size, count\(value\)', _answer_size_distribution),
+        (r'match \(vertex\) return distinct vertex limit 1', _answer_vertex_limited),
+        (r'match \(\)-\[edge\]->\(\) return distinct edge limit 1', _answer_edge_limited),
+        (r'match \(vertex:(?P<label>\w+)\) where vertex\.id in \$identifiers return vertex', _answer_vertices_by_id),
+        (r'match \(source:(?P<label>\w+)\)-\[edge\]->\(\) where source\.id in \$identifiers return edge',
+         _answer_edges_by_source),
+        (r'CREATE INDEX ON :(?P<label>\w+)\((?P<property>\w+)\)', _answer_create_index),
+        (r'unwind \$rows as row merge \(vertex:(?P<label>\w+) \{id: row\.id\}\) set (?P<sets>.*)',
+         _answer_merge_vertices),
+        (r'unwind \$rows as row match \(source:(?P<label>\w+) \{id: row\.source\}\), '
+         r'\(target:(?P=label) \{id: row\.target\}\) merge \(source\)-\[edge:\w+\]->\(target\) set (?P<sets>.*)',
+         _answer_merge_edges),
+        (r'(?i:create) \(:(?P<label>\w+) (?P<map>\{.*\})\)', _answer_create),
+        (r'(?i:match) \((?P<source>\w+)\)-\[(?P<edge>\w+)\]->\((?P<target>\w+)\) (?i:return) (?P<returned>.*)',
+         _answer_paths),
+        (r'(?i:match) \((?P<binder>\w+)\)(?: (?i:where) (?P<predicate>.*?))? (?i:return) (?P<returned>.*)',
+         _answer_vertices),
+    ]
+
+
+def connect(interface, client: FakeRedisGraph = None) -> FakeRedisGraph:
+    """
+    Connects a `DataBaseInterface` to a `FakeRedisGraph` instead of a Redis instance.
+
+    Parameters
+    ----------
+    interface : DataBaseInterface
+        The interface to connect.
+
+    client : FakeRedisGraph, optional
+        The client to connect to. A new client if None (default is None).
+
+    Returns
+    -------
+    FakeRedisGraph
+        The connected client.
+    """
+
+    client = client or FakeRedisGraph()
+
+    with mock.patch.object(redis, 'StrictRedis', lambda **kwargs: client), \
+            mock.patch.object(redis, 'BlockingConnectionPool', lambda **kwargs: None):
+        interface.client_connect('localhost', '6379')
+
+    return client
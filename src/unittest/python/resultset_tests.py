@@ -0,0 +1,121 @@
+"""
+Script to test the result set and the revision of query responses of the dbinterface module.
+"""
+
+from unittest import TestCase, main
+
+from modules.dbinterface.resultset import ResultSet, revise_response
+
+
+class ResultSetTest(TestCase):
+
+    RESPONSE = [[b'source.id', b'source.name', b'edge.source', b'edge.target', b'edge.w', b'target.id', b'target.name'],
+                [b'A__1', b'x', b'A__1', b'A__2', b'1', b'A__2', b'y'],
+                [b'A__1', b'x', b'A__1', b'A__3', b'2', b'A__3', b'NULL'],
+                [b'A__2', b'y', b'A__2', b'A__3', b'3', b'A__3', b'NULL']]
+
+    def test_header_is_grouped_by_binder(self):
+
+        result = ResultSet(self.RESPONSE)
+
+        self.assertEqual(result.binders(), ['source', 'edge', 'target'])
+        self.assertEqual(result.keys('edge'), ['source', 'target', 'w'])
+        self.assertEqual(len(result), 3)
+
+    def test_vertices_are_deduplicated_across_binders(self):
+
+        vertices, _ = ResultSet(self.RESPONSE).split()
+
+        self.assertEqual(vertices, [{'id': 'A__1', 'name': 'x'}, {'id': 'A__2', 'name': 'y'},
+                                    {'id': 'A__3', 'name': 'NULL'}])
+
+    def test_edges_are_deduplicated_by_source_and_target(self):
+
+        response = self.RESPONSE + [[b'A__1', b'x', b'A__1', b'A__2', b'1', b'A__2', b'y']]
+        _, edges = ResultSet(response).split()
+
+        self.assertEqual(edges, [{'source': 'A__1', 'target': 'A__2', 'w': '1'},
+                                 {'source': 'A__1', 'target': 'A__3', 'w': '2'},
+                                 {'source': 'A__2', 'target': 'A__3', 'w': '3'}])
+
+    def test_edges_with_equal_concatenated_ends_are_kept(self):
+
+        response = [['edge.source', 'edge.target'], ['a', 'bc'], ['ab', 'c']]
+
+        self.assertEqual(len(ResultSet(response).split()[1]), 2)
+
+    def test_binders_without_entity_columns_are_skipped(self):
+
+        vertices, edges = ResultSet([['count(vertex)'], [b'3']]).split()
+
+        self.assertEqual((vertices, edges), ([], []))
+
+    def test_str_cells_are_kept(self):
+
+        vertices, _ = ResultSet([['vertex.id'], ['A__1']]).split()
+
+        self.assertEqual(vertices, [{'id': 'A__1'}])
+
+    def test_empty_response_has_no_entities(self):
+
+        self.assertEqual(ResultSet([]).split(), ([], []))
+        self.assertEqual(ResultSet([['vertex.id']]).split(), ([], []))
+
+    def test_entities_skip_repeated_keys(self):
+
+        self.assertEqual(ResultSet(self.RESPONSE).entities('source', 'id'),
+                         [{'id': 'A__1', 'name': 'x'}, {'id': 'A__2', 'name': 'y'}])
+        self.assertEqual(len(ResultSet(self.RESPONSE).entities('source')), 3)
+
+    def test_rows_decode_cells_on_access(self):
+
+        row = next(ResultSet(self.RESPONSE).rows())
+
+        self.assertEqual(row['edge.w'], '1')
+        self.assertEqual(row.get('edge', 'size', 'NULL'), 'NULL')
+        self.assertEqual(row.entity('target'), {'id': 'A__2', 'name': 'y'})
+        self.assertEqual(list(ResultSet(self.RESPONSE).column('target', 'name')), ['y', 'NULL', 'NULL'])
+
+
+class ReviseResponseTest(TestCase):
+
+    def test_prefixes_are_dropped_from_the_header(self):
+
+        response = [[b'vertex.A__e_name', b'vertex.id'], [b'x', b'A__1']]
+
+        self.assertEqual(revise_response(response)[0], ['vertex.A_name', 'vertex.id'])
+
+    def test_merged_values_are_unified_in_order(self):
+
+        response = [['vertex.name'], ['b___a___NULL___b']]
+
+        self.assertEqual(revise_response(response), [['vertex.name'], ['b,a']])
+
+    def test_null_values_are_emptied(self):
+
+        response = [['vertex.id', 'vertex.name'], ['1', 'NULL'], ['2', 'x']]
+
+        self.assertEqual(revise_response(response), [['vertex.id', 'vertex.name'], ['1', ''], ['2', 'x']])
+
+    def test_empty_columns_are_dropped(self):
+
+        response = [['vertex.id', 'vertex.name', 'vertex.sym', 'vertex.size'],
+                    ['1', 'NULL', 'p', 'NULL___NULL'],
+                    ['2', 'NULL', 'NULL', 'NULL']]
+
+        self.assertEqual(revise_response(response), [['vertex.id', 'vertex.sym'], ['1', 'p'], ['2', '']])
+
+    def test_response_is_revised_in_place(self):
+
+        response = [[b'vertex.id'], [b'1']]
+
+        self.assertIs(revise_response(response), response)
+        self.assertEqual(response, [['vertex.id'], ['1']])
+
+    def test_empty_response_keeps_no_column(self):
+
+        self.assertEqual(revise_response([['vertex.id']]), [[]])
+
+
+if __name__ == '__main__':
+    main()